@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import asyncio
 from collections import OrderedDict
-from collections.abc import Mapping
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial
 import time
@@ -24,7 +25,12 @@ from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.util import dt as dt_util
 
 from . import auth_store, jwt_wrapper, models
-from .const import ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN, REFRESH_TOKEN_EXPIRATION
+from .const import (
+    ACCESS_TOKEN_CACHE_SIZE,
+    ACCESS_TOKEN_EXPIRATION,
+    GROUP_ID_ADMIN,
+    REFRESH_TOKEN_EXPIRATION,
+)
 from .mfa_modules import MultiFactorAuthModule, auth_mfa_module_from_config
 from .models import AuthFlowContext, AuthFlowResult
 from .providers import AuthProvider, LoginFlow, auth_provider_from_config
@@ -34,11 +40,39 @@ EVENT_USER_ADDED = "user_added"
 EVENT_USER_UPDATED = "user_updated"
 EVENT_USER_REMOVED = "user_removed"
 
+# Seconds an access token is still accepted after it expired
+ACCESS_TOKEN_LEEWAY = 10
+
 type _MfaModuleDict = dict[str, MultiFactorAuthModule]
 type _ProviderKey = tuple[str, str | None]
 type _ProviderDict = dict[_ProviderKey, AuthProvider]
 
 
+@dataclass(slots=True)
+class AccessTokenCacheStats:
+    """Statistics of the verified access token cache."""
+
+    hits: int = 0
+    misses: int = 0
+    verify_time: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of validations answered from the cache."""
+        if total := self.hits + self.misses:
+            return self.hits / total
+        return 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        """Return the statistics as a dict."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "verify_time": self.verify_time,
+        }
+
+
 class InvalidAuthError(Exception):
     """Raised when a authentication error occurs."""
 
@@ -192,6 +226,9 @@ class AuthManager:
         self._remove_expired_job = HassJob(
             self._async_remove_expired_refresh_tokens, job_type=HassJobType.Callback
         )
+        # Verified access tokens mapped to their refresh token id and expiry
+        self._access_token_cache: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self.access_token_cache_stats = AccessTokenCacheStats()
 
     async def async_setup(self) -> None:
         """Set up the auth manager."""
@@ -354,6 +391,7 @@ class AuthManager:
         if tasks:
             await asyncio.gather(*tasks)
 
+        self._async_invalidate_access_tokens(user.refresh_tokens)
         await self._store.async_remove_user(user)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
@@ -391,6 +429,7 @@ class AuthManager:
         self, credentials: models.Credentials, data: dict[str, Any]
     ) -> None:
         """Update credentials data."""
+        self._async_invalidate_credentials_access_tokens(credentials)
         self._store.async_update_user_credentials_data(credentials, data=data)
 
     async def async_activate_user(self, user: models.User) -> None:
@@ -401,6 +440,7 @@ class AuthManager:
         """Deactivate a user."""
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
+        self._async_invalidate_access_tokens(user.refresh_tokens)
         await self._store.async_deactivate_user(user)
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
@@ -410,6 +450,7 @@ class AuthManager:
         if provider is not None and hasattr(provider, "async_will_remove_credentials"):
             await provider.async_will_remove_credentials(credentials)
 
+        self._async_invalidate_credentials_access_tokens(credentials)
         await self._store.async_remove_credentials(credentials)
 
     async def async_enable_user_mfa(
@@ -529,6 +570,7 @@ class AuthManager:
     @callback
     def async_remove_refresh_token(self, refresh_token: models.RefreshToken) -> None:
         """Delete a refresh token."""
+        self._async_invalidate_access_tokens((refresh_token.id,))
         self._store.async_remove_refresh_token(refresh_token)
 
         callbacks = self._revoke_callbacks.pop(refresh_token.id, ())
@@ -651,6 +693,32 @@ class AuthManager:
     @callback
     def async_validate_access_token(self, token: str) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        cache = self._access_token_cache
+        stats = self.access_token_cache_stats
+        if (cached := cache.get(token)) is not None:
+            refresh_token_id, expire_at = cached
+            if (
+                expire_at > time.time() - ACCESS_TOKEN_LEEWAY
+                and (refresh_token := self.async_get_refresh_token(refresh_token_id))
+                is not None
+                and refresh_token.user.is_active
+            ):
+                cache.move_to_end(token)
+                stats.hits += 1
+                return refresh_token
+            del cache[token]
+
+        stats.misses += 1
+        start = time.perf_counter()
+        try:
+            refresh_token = self._async_verify_access_token(token)
+        finally:
+            stats.verify_time += time.perf_counter() - start
+        return refresh_token
+
+    @callback
+    def _async_verify_access_token(self, token: str) -> models.RefreshToken | None:
+        """Verify an access token and cache it when it is valid."""
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -668,8 +736,12 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
-                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            claims = jwt_wrapper.verify_and_decode(
+                token,
+                jwt_key,
+                leeway=ACCESS_TOKEN_LEEWAY,
+                issuer=issuer,
+                algorithms=["HS256"],
             )
         except jwt.InvalidTokenError:
             return None
@@ -677,8 +749,39 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        cache = self._access_token_cache
+        cache[token] = (refresh_token.id, claims["exp"])
+        if len(cache) > ACCESS_TOKEN_CACHE_SIZE:
+            cache.popitem(last=False)
         return refresh_token
 
+    @callback
+    def _async_invalidate_access_tokens(
+        self, refresh_token_ids: Collection[str]
+    ) -> None:
+        """Remove the cached access tokens of the refresh tokens."""
+        cache = self._access_token_cache
+        for token in [
+            token
+            for token, (refresh_token_id, _) in cache.items()
+            if refresh_token_id in refresh_token_ids
+        ]:
+            del cache[token]
+
+    @callback
+    def _async_invalidate_credentials_access_tokens(
+        self, credentials: models.Credentials
+    ) -> None:
+        """Remove the cached access tokens issued for the credentials."""
+        self._async_invalidate_access_tokens(
+            {
+                refresh_token.id
+                for refresh_token in self._store.async_get_refresh_tokens()
+                if refresh_token.credential is not None
+                and refresh_token.credential.id == credentials.id
+            }
+        )
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
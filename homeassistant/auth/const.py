@@ -3,6 +3,8 @@
 from datetime import timedelta
 
 ACCESS_TOKEN_EXPIRATION = timedelta(minutes=30)
+# Number of verified access tokens kept to skip verifying them again
+ACCESS_TOKEN_CACHE_SIZE = 256
 MFA_SESSION_EXPIRATION = timedelta(minutes=5)
 REFRESH_TOKEN_EXPIRATION = timedelta(days=90).total_seconds()
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
+from collections.abc import Iterable
 import contextlib
 from functools import partial
 from itertools import chain
@@ -88,6 +89,8 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
+from .helpers.setup_governor import async_get_setup_governor, async_start_setup_governor
+from .helpers.startup_trace import async_start_startup_trace, async_trace_startup
 from .helpers.storage import get_internal_store_manager
 from .helpers.system_info import async_get_system_info, is_official_image
 from .helpers.typing import ConfigType
@@ -450,10 +453,12 @@ async def async_from_config_dict(
     This method is a coroutine.
     """
     start = monotonic()
+    async_start_startup_trace(hass)
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
     # Prime custom component cache early so we know if registry entries are tied
     # to a custom integration
+    await loader.async_load_integration_cache(hass)
     await loader.async_get_custom_components(hass)
     await async_load_base_functionality(hass)
 
@@ -777,10 +782,17 @@ async def async_setup_multi_components(
 ) -> None:
     """Set up multiple domains. Log on failure."""
     # Avoid creating tasks for domains that were setup in a previous stage
-    domains_not_yet_setup = domains - hass.config.components
+    domains_not_yet_setup: Iterable[str] = domains - hass.config.components
     # Create setup tasks for base platforms first since everything will have
     # to wait to be imported, and the sooner we can get the base platforms
     # loaded the sooner we can start loading the rest of the integrations.
+    #
+    # The other integrations are started in the order of their priority,
+    # so the local integrations get the executor before the cloud ones.
+    if (governor := async_get_setup_governor(hass)) is not None:
+        domains_not_yet_setup = sorted(
+            domains_not_yet_setup, key=governor.async_sort_key
+        )
     futures = {
         domain: hass.async_create_task_internal(
             async_setup_component(hass, domain, config),
@@ -956,9 +968,7 @@ async def _async_resolve_domains_to_setup(
     # so we do not have to wait for it to be loaded when we need it
     # in the setup process.
     hass.async_create_background_task(
-        get_internal_store_manager(hass).async_preload(
-            [*PRELOAD_STORAGE, *domains_to_setup]
-        ),
+        _async_preload_storage(hass, [*PRELOAD_STORAGE, *domains_to_setup]),
         "preload storage",
         eager_start=True,
     )
@@ -966,6 +976,12 @@ async def _async_resolve_domains_to_setup(
     return domains_to_setup, integration_cache
 
 
+async def _async_preload_storage(hass: core.HomeAssistant, keys: list[str]) -> None:
+    """Preload the storage of the integrations we are going to set up."""
+    with async_trace_startup(hass, "storage", "preload storage", "storage"):
+        await get_internal_store_manager(hass).async_preload(keys)
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -977,6 +993,9 @@ async def _async_set_up_integrations(
         hass, config
     )
 
+    # Limit the config entries set up at once, until Home Assistant has started
+    async_start_setup_governor(hass, integration_cache)
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -1021,7 +1040,8 @@ async def _async_set_up_integrations(
                 for dep in integration.all_dependencies
             )
             async_set_domains_to_be_loaded(hass, to_be_loaded)
-            await async_setup_multi_components(hass, domain_group, config)
+            with async_trace_startup(hass, "stage", name):
+                await async_setup_multi_components(hass, domain_group, config)
 
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
@@ -1030,10 +1050,11 @@ async def _async_set_up_integrations(
     if stage_1_domains:
         _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
         try:
-            async with hass.timeout.async_timeout(
-                STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+            with async_trace_startup(hass, "stage", "stage 1"):
+                async with hass.timeout.async_timeout(
+                    STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
+                ):
+                    await async_setup_multi_components(hass, stage_1_domains, config)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
@@ -1046,10 +1067,11 @@ async def _async_set_up_integrations(
     if stage_2_domains:
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
         try:
-            async with hass.timeout.async_timeout(
-                STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+            with async_trace_startup(hass, "stage", "stage 2"):
+                async with hass.timeout.async_timeout(
+                    STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
+                ):
+                    await async_setup_multi_components(hass, stage_2_domains, config)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
@@ -1059,8 +1081,11 @@ async def _async_set_up_integrations(
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
-        async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
+        with async_trace_startup(hass, "stage", "wrap up"):
+            async with hass.timeout.async_timeout(
+                WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME
+            ):
+                await hass.async_block_till_done()
     except TimeoutError:
         _LOGGER.warning(
             "Setup timed out for bootstrap waiting on %s - moving forward",
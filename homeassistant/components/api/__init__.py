@@ -2,9 +2,12 @@
 
 import asyncio
 from asyncio import shield, timeout
+from collections.abc import Iterable
 from functools import lru_cache
 from http import HTTPStatus
 import logging
+import math
+import time
 from typing import Any
 
 from aiohttp import web
@@ -37,7 +40,13 @@ from homeassistant.const import (
     URL_API_TEMPLATE,
 )
 import homeassistant.core as ha
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    split_entity_id,
+)
 from homeassistant.exceptions import (
     InvalidEntityFormatError,
     InvalidStateError,
@@ -46,12 +55,15 @@ from homeassistant.exceptions import (
     Unauthorized,
 )
 from homeassistant.helpers import config_validation as cv, recorder, template
-from homeassistant.helpers.json import json_dumps, json_fragment
+from homeassistant.helpers.json import json_bytes, json_dumps, json_fragment
+from homeassistant.helpers.request_metrics import async_get_request_metrics
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.event_type import EventType
 from homeassistant.util.json import json_loads
 
+from .state_stream import StateChangeLog, async_get_state_change_log
+
 _LOGGER = logging.getLogger(__name__)
 
 ATTR_BASE_URL = "base_url"
@@ -64,18 +76,25 @@ ATTR_UUID = "uuid"
 ATTR_VERSION = "version"
 
 DOMAIN = "api"
+URL_API_REQUEST_METRICS = "/api/request_metrics"
+URL_API_STREAM_STATES = "/api/stream/states"
 STREAM_PING_PAYLOAD = "ping"
 STREAM_PING_INTERVAL = 50  # seconds
 SERVICE_WAIT_TIMEOUT = 10
+# Maximum coalescing interval of the state stream, in seconds
+STATE_STREAM_MAX_INTERVAL = 60
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Register the API with the HTTP interface."""
+    # Start numbering state changes, they version the states
+    async_get_state_change_log(hass)
     hass.http.register_view(APIStatusView)
     hass.http.register_view(APICoreStateView)
     hass.http.register_view(APIEventStream)
+    hass.http.register_view(APIStateStream)
     hass.http.register_view(APIConfigView)
     hass.http.register_view(APIStatesView)
     hass.http.register_view(APIEntityStateView)
@@ -85,6 +104,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.http.register_view(APIDomainServicesView)
     hass.http.register_view(APIComponentsView)
     hass.http.register_view(APITemplateView)
+    hass.http.register_view(APIRequestMetricsView)
 
     if DATA_LOGGING in hass.data:
         hass.http.register_view(APIErrorLog)
@@ -192,6 +212,163 @@ class APIEventStream(HomeAssistantView):
         return response
 
 
+class APIStateStream(HomeAssistantView):
+    """View to stream state changes as server-sent events.
+
+    The stream starts with a states event holding the current states,
+    followed by a state_changed event for each change. The entity_id and
+    domain query parameters filter the entities. With an interval, the
+    changes are sent at most once per interval with only the newest
+    state of each entity. A client reconnecting with a Last-Event-ID
+    that is still in the state change log receives the changes it
+    missed instead of the current states.
+    """
+
+    url = URL_API_STREAM_STATES
+    name = "api:stream:states"
+
+    async def get(self, request: web.Request) -> web.StreamResponse:
+        """Stream the state changes."""
+        hass = request.app[KEY_HASS]
+        user: User = request[KEY_HASS_USER]
+        query = request.query
+        entity_ids = set(filter(None, query.get("entity_id", "").split(",")))
+        domains = set(filter(None, query.get("domain", "").split(",")))
+        try:
+            interval = float(query.get("interval", 0))
+        except ValueError:
+            interval = -1
+        if not 0 <= interval <= STATE_STREAM_MAX_INTERVAL:
+            return self.json_message("Invalid interval.", HTTPStatus.BAD_REQUEST)
+
+        entity_perm = None
+        if not user.is_admin and not user.permissions.access_all_entities(POLICY_READ):
+            entity_perm = user.permissions.check_entity
+
+        def matches(entity_id: str) -> bool:
+            """Return if the changes of an entity are streamed."""
+            return (
+                (not entity_ids or entity_id in entity_ids)
+                and (not domains or split_entity_id(entity_id)[0] in domains)
+                and (entity_perm is None or entity_perm(entity_id, POLICY_READ))
+            )
+
+        log = async_get_state_change_log(hass)
+        # Newest pending change of each entity, in the order of the changes
+        pending: dict[str, tuple[int, State | None]] = {}
+        wake = asyncio.Event()
+
+        @ha.callback
+        def queue_change(change: tuple[int, str, State | None]) -> None:
+            """Queue a state change to be sent."""
+            seq, entity_id, state = change
+            if matches(entity_id):
+                pending.pop(entity_id, None)
+                pending[entity_id] = (seq, state)
+                wake.set()
+
+        @ha.callback
+        def stop(event: Event) -> None:
+            """Close the stream when Home Assistant stops."""
+            wake.set()
+
+        # We must never await between collecting the states and listening
+        # for state changes or we will miss changes
+        initial: bytes | None = None
+        changes = None
+        if last_event_id := request.headers.get("Last-Event-ID"):
+            changes = log.async_changes_since(last_event_id)
+        if changes is None:
+            initial = _state_stream_states_message(
+                log,
+                (
+                    state
+                    for state in hass.states.async_all()
+                    if matches(state.entity_id)
+                ),
+            )
+        else:
+            for change in changes:
+                queue_change(change)
+        unsub_log = log.async_listen(queue_change)
+        unsub_stop = hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, stop)
+
+        response = web.StreamResponse()
+        response.content_type = "text/event-stream"
+        response.headers["Cache-Control"] = "no-cache"
+        try:
+            await response.prepare(request)
+            if initial is not None:
+                await response.write(initial)
+            while not hass.is_stopping:
+                if not pending:
+                    try:
+                        async with timeout(STREAM_PING_INTERVAL):
+                            await wake.wait()
+                    except TimeoutError:
+                        await response.write(b": ping\n\n")
+                        continue
+                    if hass.is_stopping:
+                        break
+                if interval:
+                    await asyncio.sleep(interval)
+                wake.clear()
+                messages = [
+                    message
+                    for entity_id, (seq, state) in pending.items()
+                    if (
+                        message := _state_stream_change_message(
+                            log, seq, entity_id, state
+                        )
+                    )
+                ]
+                pending.clear()
+                await response.write(b"".join(messages))
+        except (asyncio.CancelledError, ConnectionResetError):
+            _LOGGER.debug("State stream closed by %s", request.remote)
+        finally:
+            unsub_log()
+            unsub_stop()
+
+        return response
+
+
+def _state_stream_states_message(log: StateChangeLog, states: Iterable[State]) -> bytes:
+    """Return the server-sent event with the current states."""
+    serialized: list[bytes] = []
+    for state in states:
+        try:
+            serialized.append(state.as_dict_json)
+        except (ValueError, TypeError):
+            _LOGGER.error("Unable to serialize state of %s to JSON", state.entity_id)
+    return b"".join(
+        (
+            f"id: {log.event_id(log.seq)}\nevent: states\ndata: [".encode(),
+            b",".join(serialized),
+            b"]\n\n",
+        )
+    )
+
+
+def _state_stream_change_message(
+    log: StateChangeLog, seq: int, entity_id: str, state: State | None
+) -> bytes | None:
+    """Return the server-sent event of a state change."""
+    try:
+        new_state = b"null" if state is None else state.as_dict_json
+    except (ValueError, TypeError):
+        _LOGGER.error("Unable to serialize state of %s to JSON", entity_id)
+        return None
+    return b"".join(
+        (
+            f"id: {log.event_id(seq)}\nevent: state_changed\n".encode(),
+            f'data: {{"entity_id":"{entity_id}","new_state":'.encode(),
+            new_state,
+            b"}\n\n",
+        )
+    )
+
+
 class APIConfigView(HomeAssistantView):
     """View to handle Configuration requests."""
 
@@ -212,20 +389,91 @@ class APIStatesView(HomeAssistantView):
 
     @ha.callback
     def get(self, request: web.Request) -> web.Response:
-        """Get current states."""
+        """Get current states.
+
+        The ETag is the version of the states, so unchanged states are
+        answered with a 304. With since=<version>, only the states that
+        changed since that version are returned, together with the
+        removed entity ids.
+        """
         user: User = request[KEY_HASS_USER]
         hass = request.app[KEY_HASS]
-        if user.is_admin:
-            states = (state.as_dict_json for state in hass.states.async_all())
+        log = async_get_state_change_log(hass)
+        version = log.version
+        last_changed = log.last_changed
+        if (ifnonematch := request.if_none_match) is not None:
+            not_modified = any(etag.value == version for etag in ifnonematch)
         else:
-            entity_perm = user.permissions.check_entity
-            states = (
-                state.as_dict_json
-                for state in hass.states.async_all()
-                if entity_perm(state.entity_id, "read")
+            not_modified = (
+                ifmodsince := request.if_modified_since
+            ) is not None and last_changed < ifmodsince.timestamp()
+        if not_modified:
+            response = web.Response(status=HTTPStatus.NOT_MODIFIED)
+        elif (since := request.query.get("since")) is not None:
+            response = self._delta_response(hass, user, log, since)
+        else:
+            states = self._allowed_states(user, hass.states.async_all())
+            response = web.Response(
+                body=b"".join((b"[", b",".join(states), b"]")),
+                content_type=CONTENT_TYPE_JSON,
+                zlib_executor_size=32768,
             )
+            response.enable_compression()
+        response.etag = version
+        # HTTP dates have a resolution of a second, only send the end of the
+        # second of the last change once later changes cannot fall within it
+        if time.time() >= (last_modified := math.ceil(last_changed)):
+            response.last_modified = last_modified
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
+    @staticmethod
+    def _allowed_states(user: User, states: Iterable[State]) -> Iterable[bytes]:
+        """Return the serialized states the user is allowed to read."""
+        if user.is_admin:
+            return (state.as_dict_json for state in states)
+        entity_perm = user.permissions.check_entity
+        return (
+            state.as_dict_json
+            for state in states
+            if entity_perm(state.entity_id, "read")
+        )
+
+    def _delta_response(
+        self, hass: HomeAssistant, user: User, log: StateChangeLog, since: str
+    ) -> web.Response:
+        """Return the states changed since a version."""
+        if (changes := log.async_changes_since(since)) is None:
+            # The version is too old or from before a restart
+            full = True
+            changed = hass.states.async_all()
+            removed: list[str] = []
+        else:
+            full = False
+            changed = []
+            removed = []
+            entity_perm = None if user.is_admin else user.permissions.check_entity
+            for entity_id in dict.fromkeys(change[1] for change in changes):
+                if entity_perm is not None and not entity_perm(entity_id, "read"):
+                    continue
+                if (state := hass.states.get(entity_id)) is None:
+                    removed.append(entity_id)
+                else:
+                    changed.append(state)
         response = web.Response(
-            body=b"".join((b"[", b",".join(states), b"]")),
+            body=b"".join(
+                (
+                    b'{"version":',
+                    json_bytes(log.version),
+                    b',"full":',
+                    b"true" if full else b"false",
+                    b',"states":[',
+                    b",".join(self._allowed_states(user, changed)),
+                    b'],"removed":',
+                    json_bytes(removed),
+                    b"}",
+                )
+            ),
             content_type=CONTENT_TYPE_JSON,
             zlib_executor_size=32768,
         )
@@ -502,6 +750,22 @@ class APIErrorLog(HomeAssistantView):
         return response
 
 
+class APIRequestMetricsView(HomeAssistantView):
+    """View to fetch the HTTP and websocket request metrics."""
+
+    url = URL_API_REQUEST_METRICS
+    name = "api:request_metrics"
+
+    @require_admin
+    async def get(self, request: web.Request) -> web.Response:
+        """Retrieve the request metrics in the Prometheus text format."""
+        return web.Response(
+            text=async_get_request_metrics(request.app[KEY_HASS]).as_prometheus(),
+            content_type="text/plain",
+            headers={"X-Prometheus-Format": "0.0.4"},
+        )
+
+
 async def async_services_json(hass: HomeAssistant) -> list[dict[str, Any]]:
     """Generate services data to JSONify."""
     descriptions = await async_get_all_descriptions(hass)
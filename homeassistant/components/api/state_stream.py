@@ -0,0 +1,93 @@
+"""Log of recent state changes to resume state streams and poll deltas."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable
+import secrets
+import time
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+
+DATA_STATE_CHANGE_LOG: HassKey[StateChangeLog] = HassKey("api_state_change_log")
+
+# Number of state changes kept to resume a stream or return a delta
+STATE_CHANGE_LOG_SIZE = 1024
+
+type StateChange = tuple[int, str, State | None]
+
+
+class StateChangeLog:
+    """Sequence numbered log of the recent state changes.
+
+    The id of the newest change is the version of the state machine.
+    Event ids are prefixed with a token unique to this instance, so ids
+    from before a restart are never mistaken for current ones.
+    """
+
+    __slots__ = ("_changes", "_listeners", "last_changed", "seq", "token")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the log."""
+        self.token = secrets.token_hex(4)
+        self.seq = 0
+        # Timestamp of the newest change
+        self.last_changed = time.time()
+        self._changes: deque[StateChange] = deque(maxlen=STATE_CHANGE_LOG_SIZE)
+        self._listeners: set[Callable[[StateChange], None]] = set()
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    def event_id(self, seq: int) -> str:
+        """Return the event id of a sequence number."""
+        return f"{self.token}:{seq}"
+
+    @property
+    def version(self) -> str:
+        """Return the id of the newest change."""
+        return self.event_id(self.seq)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Record a state change and pass it to the listeners."""
+        self.seq += 1
+        self.last_changed = event.time_fired_timestamp
+        data = event.data
+        change = (self.seq, data["entity_id"], data["new_state"])
+        self._changes.append(change)
+        for listener in self._listeners:
+            listener(change)
+
+    @callback
+    def async_listen(self, listener: Callable[[StateChange], None]) -> CALLBACK_TYPE:
+        """Listen for state changes."""
+        self._listeners.add(listener)
+        return lambda: self._listeners.discard(listener)
+
+    @callback
+    def async_changes_since(self, event_id: str) -> Iterable[StateChange] | None:
+        """Return the changes after an event id, None if some are missing."""
+        token, _, seq_str = event_id.partition(":")
+        if token != self.token or not seq_str.isdigit():
+            return None
+        seq = int(seq_str)
+        changes = self._changes
+        if seq > self.seq or (changes and seq < changes[0][0] - 1):
+            return None
+        return [change for change in changes if change[0] > seq]
+
+
+@callback
+@singleton(DATA_STATE_CHANGE_LOG)
+def async_get_state_change_log(hass: HomeAssistant) -> StateChangeLog:
+    """Return the state change log, creating it on first use."""
+    return StateChangeLog(hass)
@@ -19,6 +19,7 @@ from homeassistant.const import (
     CONF_CONDITIONS,
     CONF_DESCRIPTION,
     CONF_ID,
+    CONF_PATH,
     CONF_VARIABLES,
 )
 from homeassistant.core import HomeAssistant
@@ -27,6 +28,11 @@ from homeassistant.helpers import config_validation as cv, script
 from homeassistant.helpers.condition import async_validate_conditions_config
 from homeassistant.helpers.trigger import async_validate_trigger_config
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.validated_config_cache import (
+    ValidatedConfigCache,
+    async_get_validated_config_cache,
+    config_key,
+)
 from homeassistant.util.yaml.input import UndefinedSubstitution
 
 from .const import (
@@ -322,15 +328,38 @@ class AutomationConfig(dict):
     validation_error: str | None = None
 
 
+async def _async_config_key(hass: HomeAssistant, config: ConfigType) -> bytes | None:
+    """Return the key of an automation in the validated config cache."""
+    if not blueprint.is_blueprint_instance_config(config):
+        return config_key(config)
+    # The automation also changes when the blueprint is edited
+    try:
+        used_blueprint = await async_get_blueprints(hass).async_get_blueprint(
+            config[blueprint.CONF_USE_BLUEPRINT][CONF_PATH]
+        )
+    except (HomeAssistantError, KeyError, TypeError):
+        return None
+    return config_key(config, used_blueprint.data)
+
+
 async def _try_async_validate_config_item(
     hass: HomeAssistant,
     config: dict[str, Any],
+    cache: ValidatedConfigCache[AutomationConfig],
 ) -> AutomationConfig | None:
-    """Validate config item."""
+    """Validate config item, reusing the validated config if it did not change."""
+    key = await _async_config_key(hass, config)
+    if key is not None and (automation_config := cache.async_get(key)) is not None:
+        return automation_config
     try:
-        return await _async_validate_config_item(hass, config, False, True)
+        automation_config = await _async_validate_config_item(hass, config, False, True)
     except (vol.Invalid, HomeAssistantError):
         return None
+    # Invalid automations are validated again, the referenced devices and
+    # integrations may have been added since
+    if key is not None and automation_config.validation_status is ValidationStatus.OK:
+        cache.async_set(key, automation_config)
+    return automation_config
 
 
 async def async_validate_config_item(
@@ -344,13 +373,17 @@ async def async_validate_config_item(
 
 async def async_validate_config(hass: HomeAssistant, config: ConfigType) -> ConfigType:
     """Validate config."""
+    cache: ValidatedConfigCache[AutomationConfig] = async_get_validated_config_cache(
+        hass, DOMAIN
+    )
+    cache.async_start_validation()
     # No gather here since _try_async_validate_config_item is unlikely to suspend
     # and the cost of creating many tasks is not worth the benefit.
     automations = list(
         filter(
             lambda x: x is not None,
             [
-                await _try_async_validate_config_item(hass, p_config)
+                await _try_async_validate_config_item(hass, p_config, cache)
                 for _, p_config in config_per_platform(config, DOMAIN)
             ],
         )
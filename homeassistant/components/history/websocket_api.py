@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.read_queue import READ_PRIORITY_STREAM
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
@@ -156,7 +157,7 @@ async def ws_get_history_during_period(
     minimal_response = msg["minimal_response"]
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -167,6 +168,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            owner=connection,
         )
     )
 
@@ -191,7 +193,7 @@ def _async_send_empty_response(
     """Send an empty response when we know all results are filtered away."""
     connection.send_result(msg_id)
     stream_end_time = end_time or dt_util.utcnow()
-    connection.send_message(
+    connection.send_bulk_message(
         _generate_websocket_response(msg_id, start_time, stream_end_time, {})
     )
 
@@ -279,7 +281,7 @@ async def _async_send_historical_states(
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    last_time_ts, last_time_dt, payload = await instance.async_add_read_job(
         _generate_historical_response,
         hass,
         msg_id,
@@ -291,9 +293,11 @@ async def _async_send_historical_states(
         minimal_response,
         no_attributes,
         send_empty,
+        priority=READ_PRIORITY_STREAM,
+        owner=connection,
     )
     if payload:
-        connection.send_message(payload)
+        connection.send_bulk_message(payload)
     return last_time_dt if last_time_ts != 0 else None
 
 
@@ -348,7 +352,7 @@ async def _async_events_consumer(
             events.append(stream_queue.get_nowait())
 
         if history_states := _events_to_compressed_states(events, no_attributes):
-            connection.send_message(
+            connection.send_bulk_message(
                 json_bytes(
                     messages.event_message(
                         msg_id,
@@ -7,6 +7,7 @@ from typing import Any
 from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import system_info
+from homeassistant.util.blocking_telemetry import get_blocking_call_telemetry
 
 
 @callback
@@ -21,7 +22,7 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     info = await system_info.async_get_system_info(hass)
 
-    return {
+    health: dict[str, Any] = {
         "version": f"core-{info.get('version')}",
         "installation_type": info.get("installation_type"),
         "dev": info.get("dev"),
@@ -36,3 +37,17 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         "timezone": info.get("timezone"),
         "config_dir": hass.config.config_dir,
     }
+    token_cache_stats = hass.auth.access_token_cache_stats
+    health["access_token_cache"] = (
+        f"{token_cache_stats.hits} hits, {token_cache_stats.misses} misses, "
+        f"{token_cache_stats.verify_time:.3f} s verifying"
+    )
+    if (telemetry := get_blocking_call_telemetry()) is not None:
+        integrations = telemetry.as_dict()["integrations"]
+        health["blocking_calls"] = sum(
+            totals["count"] for totals in integrations.values()
+        )
+        health["blocking_call_time"] = (
+            f"{sum(totals['time'] for totals in integrations.values()):.3f} s"
+        )
+    return health
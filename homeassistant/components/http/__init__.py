@@ -43,11 +43,13 @@ from homeassistant.helpers.http import (
     KEY_ALLOW_CONFIGURED_CORS,
     KEY_AUTHENTICATED,  # noqa: F401
     KEY_HASS,
+    KEY_REQUEST_METRICS,
     HomeAssistantView,
     current_request,
 )
 from homeassistant.helpers.importlib import async_import_module
 from homeassistant.helpers.network import NoURLAvailableError, get_url
+from homeassistant.helpers.request_metrics import async_get_request_metrics
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 from homeassistant.setup import (
@@ -389,6 +391,7 @@ class HomeAssistantHTTP:
         """Initialize the server."""
         self.app[KEY_HASS] = self.hass
         self.app["hass"] = self.hass  # For backwards compatibility
+        self.app[KEY_REQUEST_METRICS] = async_get_request_metrics(self.hass)
 
         # Order matters, security filters middleware needs to go first,
         # forwarded middleware needs to go second.
@@ -3,20 +3,64 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from dataclasses import dataclass
+import gzip
+import os
 from pathlib import Path
+import re
 import sys
+import time
 from typing import Final
 
-from aiohttp.hdrs import CACHE_CONTROL, CONTENT_TYPE
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.hdrs import (
+    ACCEPT_ENCODING,
+    CACHE_CONTROL,
+    CONTENT_ENCODING,
+    CONTENT_TYPE,
+    IF_MATCH,
+    IF_MODIFIED_SINCE,
+    IF_RANGE,
+    IF_UNMODIFIED_SINCE,
+    RANGE,
+    VARY,
+)
+from aiohttp.helpers import ETAG_ANY, ETag
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_fileresponse import CONTENT_TYPES, FALLBACK_CONTENT_TYPE
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU
 
+from homeassistant.helpers.http import KEY_HASS
+
 CACHE_TIME: Final = 31 * 86400  # = 1 month
 CACHE_HEADER = f"public, max-age={CACHE_TIME}"
 CACHE_HEADERS: Mapping[str, str] = {CACHE_CONTROL: CACHE_HEADER}
-RESPONSE_CACHE: LRU[tuple[str, Path], tuple[Path, str]] = LRU(512)
+# Files with a content hash in their name, like app.1a2b3c4d.js, never change
+CACHE_HEADER_IMMUTABLE = f"{CACHE_HEADER}, immutable"
+_FINGERPRINT: Final = re.compile(r"\.[0-9a-f]{8,}\.")
+
+# Seconds the metadata of an indexed file is trusted before it is checked again
+INDEX_REVALIDATE_TIME: Final = 60
+# Files are compressed in memory between these sizes
+PRECOMPRESS_MIN_SIZE: Final = 1024
+PRECOMPRESS_MAX_SIZE: Final = 1024 * 1024
+_PRECOMPRESS_TYPES: Final = frozenset(
+    {
+        "application/javascript",
+        "application/json",
+        "application/manifest+json",
+        "image/svg+xml",
+        "text/javascript",
+    }
+)
+# Requests with these headers are answered by aiohttp from the file
+_FILE_RESPONSE_HEADERS: Final = (
+    IF_MATCH,
+    IF_MODIFIED_SINCE,
+    IF_RANGE,
+    IF_UNMODIFIED_SINCE,
+    RANGE,
+)
 
 if sys.version_info >= (3, 13):
     # guess_type is soft-deprecated in 3.13
@@ -28,20 +72,116 @@ else:
     _GUESSER = CONTENT_TYPES.guess_type
 
 
+@dataclass(slots=True)
+class StaticFile:
+    """Metadata and compressed variant of a served static file."""
+
+    path: Path
+    content_type: str
+    mtime_ns: int
+    size: int
+    gzip: bytes | None
+    checked: float
+
+    @property
+    def etag(self) -> str:
+        """Return the ETag of the file, the same as aiohttp would send."""
+        return f"{self.mtime_ns:x}-{self.size:x}"
+
+    @property
+    def gzip_etag(self) -> str:
+        """Return the ETag of the gzip compressed file."""
+        return f"{self.mtime_ns:x}-{self.size:x}-gzip"
+
+
+STATIC_INDEX: LRU[tuple[str, Path], StaticFile] = LRU(512)
+
+
+def _etag_match(etag: str, etags: tuple[ETag, ...]) -> bool:
+    """Return if an ETag matches an If-None-Match header."""
+    return any(candidate.value in (etag, ETAG_ANY) for candidate in etags)
+
+
+def _cache_header(file_path: Path) -> str:
+    """Return the Cache-Control header for a file."""
+    if _FINGERPRINT.search(file_path.name):
+        return CACHE_HEADER_IMMUTABLE
+    return CACHE_HEADER
+
+
+def _compressible(content_type: str, size: int) -> bool:
+    """Return if a file benefits from being compressed in memory."""
+    return PRECOMPRESS_MIN_SIZE <= size <= PRECOMPRESS_MAX_SIZE and (
+        content_type.startswith("text/")
+        or content_type.partition(";")[0] in _PRECOMPRESS_TYPES
+    )
+
+
+def _index_file(
+    file_path: Path, content_type: str, previous: StaticFile | None
+) -> StaticFile | None:
+    """Stat a file and compress it if it changed, None if it is gone."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    now = time.monotonic()
+    if (
+        previous is not None
+        and previous.mtime_ns == st.st_mtime_ns
+        and previous.size == st.st_size
+    ):
+        previous.checked = now
+        return previous
+    compressed: bytes | None = None
+    # aiohttp serves compressed files shipped next to the file itself
+    if _compressible(content_type, st.st_size) and not any(
+        file_path.with_name(f"{file_path.name}{suffix}").exists()
+        for suffix in (".br", ".gz")
+    ):
+        try:
+            compressed = gzip.compress(file_path.read_bytes(), mtime=0)
+        except OSError:
+            return None
+        if len(compressed) >= st.st_size:
+            compressed = None
+    return StaticFile(
+        file_path, content_type, st.st_mtime_ns, st.st_size, compressed, now
+    )
+
+
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
+
+    Resolved paths, content types and ETags are kept in an in-memory
+    index so conditional requests are answered without touching the
+    filesystem. Text files without compressed files next to them are
+    also kept gzip compressed in memory for clients that accept it. The
+    metadata of an indexed file is checked again every
+    INDEX_REVALIDATE_TIME seconds. Files with a content hash in their
+    name are marked immutable so browsers do not revalidate them.
+    """
 
     async def _handle(self, request: Request) -> StreamResponse:
-        """Wrap base handler to cache file path resolution and content type guess."""
+        """Serve a file from the index, indexing it on first request."""
         rel_url = request.match_info["filename"]
         key = (rel_url, self._directory)
+        hass = request.app[KEY_HASS]
         response: StreamResponse
 
-        if key in RESPONSE_CACHE:
-            file_path, content_type = RESPONSE_CACHE[key]
-            response = FileResponse(file_path, chunk_size=self._chunk_size)
-            response.headers[CONTENT_TYPE] = content_type
-        else:
+        if (entry := STATIC_INDEX.get(key)) is not None and (
+            time.monotonic() - entry.checked > INDEX_REVALIDATE_TIME
+        ):
+            entry = await hass.async_add_executor_job(
+                _index_file, entry.path, entry.content_type, entry
+            )
+            if entry is None:
+                # A concurrent request may have removed it already
+                STATIC_INDEX.pop(key, None)
+            else:
+                STATIC_INDEX[key] = entry
+
+        if entry is None:
             response = await super()._handle(request)
             if not isinstance(response, FileResponse):
                 # Must be directory index; ignore caching
@@ -50,7 +190,38 @@ class CachingStaticResource(StaticResource):
             response.content_type = _GUESSER(file_path)[0] or FALLBACK_CONTENT_TYPE
             # Cache actual header after setter construction.
             content_type = response.headers[CONTENT_TYPE]
-            RESPONSE_CACHE[key] = (file_path, content_type)
+            if entry := await hass.async_add_executor_job(
+                _index_file, file_path, content_type, None
+            ):
+                STATIC_INDEX[key] = entry
+            response.headers[CACHE_CONTROL] = _cache_header(file_path)
+            return response
+
+        use_gzip = (
+            entry.gzip is not None
+            and "gzip" in request.headers.get(ACCEPT_ENCODING, "").lower()
+            and not any(header in request.headers for header in _FILE_RESPONSE_HEADERS)
+        )
+        etag = entry.gzip_etag if use_gzip else entry.etag
+        if (ifnonematch := request.if_none_match) is not None and _etag_match(
+            etag, ifnonematch
+        ):
+            response = Response(status=304)
+            response.etag = etag
+        elif use_gzip:
+            response = Response(
+                body=entry.gzip,
+                headers={
+                    CONTENT_TYPE: entry.content_type,
+                    CONTENT_ENCODING: "gzip",
+                },
+            )
+            response.etag = etag
+        else:
+            response = FileResponse(entry.path, chunk_size=self._chunk_size)
+            response.headers[CONTENT_TYPE] = entry.content_type
 
-        response.headers[CACHE_CONTROL] = CACHE_HEADER
+        if entry.gzip is not None:
+            response.headers[VARY] = ACCEPT_ENCODING
+        response.headers[CACHE_CONTROL] = _cache_header(entry.path)
         return response
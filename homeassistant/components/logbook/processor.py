@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -36,6 +37,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util.collection import chunked_or_all
 import homeassistant.util.dt as dt_util
 from homeassistant.util.event_type import EventType
 
@@ -81,6 +83,7 @@ from .models import (
 )
 from .queries import statement_for_request
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
+from .queries.contexts import contexts_stmt
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -180,9 +183,43 @@ class EventProcessor:
                 self.filters,
                 self.context_id,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            rows = execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            if self.entity_ids or self.device_ids:
+                rows = list(rows)
+                self._load_context_origins(session, rows)
+            return self.humanify(rows)
+
+    def _load_context_origins(self, session: Session, rows: Sequence[Row]) -> None:
+        """Load the rows that originated the contexts of the rows.
+
+        The query for entities or devices only returns their own rows so
+        the origins of their contexts, and of their direct parent contexts,
+        are looked up afterwards using the context_id_bin indices. They are
+        not limited to the time window, so a row keeps the origin of its
+        context when that fired before the window started. Contexts that
+        have already been resolved in this logbook run are not looked up
+        again.
+        """
+        context_lookup = self.logbook_run.context_lookup
+        context_id_bins = {
+            context_id_bin
+            for row in rows
+            for context_id_bin in (
+                row[CONTEXT_ID_BIN_POS],
+                row[CONTEXT_PARENT_ID_BIN_POS],
             )
+            if context_id_bin not in context_lookup
+        }
+        # The context ids are bound in both the events and states select
+        max_bind_vars = get_instance(self.hass).max_bind_vars // 2
+        for context_id_bins_chunk in chunked_or_all(context_id_bins, max_bind_vars):
+            for row in execute_stmt_lambda_element(
+                session, contexts_stmt(context_id_bins_chunk), orm_rows=False
+            ):
+                # The rows are ordered by time so the
+                # first row for each context is its origin
+                if (context_id_bin := row[CONTEXT_ID_BIN_POS]) not in context_lookup:
+                    context_lookup[context_id_bin] = row
 
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.read_queue import READ_PRIORITY_STREAM
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_point_in_utc_time
@@ -71,7 +72,7 @@ def _async_send_empty_response(
     stream_end_time = end_time or dt_util.utcnow()
     empty_stream_message = _generate_stream_message([], start_time, stream_end_time)
     empty_response = messages.event_message(msg_id, empty_stream_message)
-    connection.send_message(json_bytes(empty_response))
+    connection.send_bulk_message(json_bytes(empty_response))
 
 
 async def _async_send_historical_events(
@@ -104,6 +105,7 @@ async def _async_send_historical_events(
     if not is_big_query:
         message, last_event_time = await _async_get_ws_stream_events(
             hass,
+            connection,
             msg_id,
             start_time,
             end_time,
@@ -116,7 +118,7 @@ async def _async_send_historical_events(
         # consumers of the api know their request was
         # answered but there were no results
         if last_event_time or not partial or force_send:
-            connection.send_message(message)
+            connection.send_bulk_message(message)
         return last_event_time
 
     # This is a big query so we deliver
@@ -125,6 +127,7 @@ async def _async_send_historical_events(
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
     recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         recent_query_start,
         end_time,
@@ -132,10 +135,11 @@ async def _async_send_historical_events(
         partial=True,
     )
     if recent_query_last_event_time:
-        connection.send_message(recent_message)
+        connection.send_bulk_message(recent_message)
 
     older_message, older_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         start_time,
         recent_query_start,
@@ -148,7 +152,7 @@ async def _async_send_historical_events(
     # consumers of the api know their request was
     # answered but there were no results
     if older_query_last_event_time or not partial or force_send:
-        connection.send_message(older_message)
+        connection.send_bulk_message(older_message)
 
     # Returns the time of the newest event
     return recent_query_last_event_time or older_query_last_event_time
@@ -156,6 +160,7 @@ async def _async_send_historical_events(
 
 async def _async_get_ws_stream_events(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
@@ -163,13 +168,15 @@ async def _async_get_ws_stream_events(
     partial: bool,
 ) -> tuple[bytes, dt | None]:
     """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
+    return await get_instance(hass).async_add_read_job(
         _ws_stream_get_events,
         msg_id,
         start_time,
         end_time,
         event_processor,
         partial,
+        priority=READ_PRIORITY_STREAM,
+        owner=connection,
     )
 
 
@@ -234,7 +241,7 @@ async def _async_events_consumer(
         if logbook_events := event_processor.humanify(
             async_event_to_row(e) for e in events
         ):
-            connection.send_message(
+            connection.send_bulk_message(
                 json_bytes(
                     messages.event_message(
                         msg_id,
@@ -501,11 +508,12 @@ async def ws_get_events(
     )
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_job(
             _ws_formatted_get_events,
             msg["id"],
             start_time,
             end_time,
             event_processor,
+            owner=connection,
         )
     )
@@ -24,7 +24,9 @@ from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.json import save_json
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.startup_trace import async_get_startup_trace
 
 from .const import DOMAIN
 
@@ -40,6 +42,9 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_SET_LOOP_TIME_TRACKING = "set_loop_time_tracking"
+SERVICE_LOG_LOOP_TIME = "log_loop_time"
+SERVICE_DUMP_STARTUP_TRACE = "dump_startup_trace"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,6 +68,9 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_SET_LOOP_TIME_TRACKING,
+    SERVICE_LOG_LOOP_TIME,
+    SERVICE_DUMP_STARTUP_TRACE,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -273,6 +281,30 @@ async def async_setup_entry(  # noqa: C901
             base_logger.setLevel(logging.INFO)
         hass.loop.set_debug(enabled)
 
+    @callback
+    def _async_set_loop_time_tracking(call: ServiceCall) -> None:
+        """Enable or disable the event loop time tracking."""
+        enabled = call.data[CONF_ENABLED]
+        _LOGGER.critical("Setting event loop time tracking to %s", enabled)
+        hass.async_set_loop_time_tracking(enabled)
+
+    @callback
+    def _async_log_loop_time(call: ServiceCall) -> None:
+        """Log the event loop time per integration."""
+        if (loop_time := hass.loop_time) is None:
+            raise HomeAssistantError("Event loop time tracking not enabled")
+        for domain, histogram in loop_time.as_dict().items():
+            _LOGGER.critical(
+                "Event loop time of %s: %.3fs in %s runs",
+                domain,
+                histogram["sum"],
+                histogram["count"],
+            )
+
+    async def _async_dump_startup_trace(call: ServiceCall) -> None:
+        """Write the startup trace to a file."""
+        await _async_write_startup_trace(hass)
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -382,6 +414,28 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_SET_LOOP_TIME_TRACKING,
+        _async_set_loop_time_tracking,
+        schema=vol.Schema({vol.Optional(CONF_ENABLED, default=True): cv.boolean}),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_LOOP_TIME,
+        _async_log_loop_time,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_DUMP_STARTUP_TRACE,
+        _async_dump_startup_trace,
+    )
+
     return True
 
 
@@ -467,6 +521,24 @@ async def _async_generate_memory_profile(hass: HomeAssistant, call: ServiceCall)
     )
 
 
+async def _async_write_startup_trace(hass: HomeAssistant) -> None:
+    """Write the startup trace to a file in the Chrome trace event format."""
+    if (trace := async_get_startup_trace(hass)) is None:
+        raise HomeAssistantError("No startup trace was recorded")
+    start_time = int(time.time() * 1000000)
+    trace_path = hass.config.path(f"startup_trace.{start_time}.json")
+    await hass.async_add_executor_job(save_json, trace_path, trace.as_chrome_trace())
+    persistent_notification.async_create(
+        hass,
+        (
+            f"Wrote the startup trace to {trace_path}, open it with"
+            " https://ui.perfetto.dev or chrome://tracing"
+        ),
+        title="Startup Trace",
+        notification_id=f"profiler_startup_trace_{start_time}",
+    )
+
+
 def _write_profile(profiler, cprofile_path, callgrind_path):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Hashable, Iterable
 from concurrent.futures import CancelledError
 import contextlib
 from datetime import datetime, timedelta
@@ -51,6 +51,7 @@ from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
 from .const import (
+    DB_READER_PREFIX,
     DB_WORKER_PREFIX,
     DOMAIN,
     KEEPALIVE_TIME,
@@ -79,7 +80,8 @@ from .db_schema import (
 )
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
-from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .pool import POOL_SIZE, READ_POOL_SIZE, MutexPool, RecorderPool
+from .read_queue import READ_PRIORITY_INTERACTIVE, ReadQueue
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -146,6 +148,10 @@ CONNECTIVITY_ERR = "Error in database connectivity during commit"
 # Pool size must accommodate Recorder thread + All db executors
 MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
 
+# The read executor has its own connections so history, logbook and
+# statistics queries do not compete with the db executor jobs
+MAX_DB_READ_EXECUTOR_WORKERS = READ_POOL_SIZE
+
 
 class Recorder(threading.Thread):
     """A threaded recorder class."""
@@ -220,6 +226,8 @@ class Recorder(threading.Thread):
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._db_read_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self.read_queue = ReadQueue(hass, MAX_DB_READ_EXECUTOR_WORKERS)
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -282,6 +290,13 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        self._db_read_executor = DBInterruptibleThreadPoolExecutor(
+            self.recorder_and_worker_thread_ids,
+            thread_name_prefix=DB_READER_PREFIX,
+            max_workers=MAX_DB_READ_EXECUTOR_WORKERS,
+            shutdown_hook=self._shutdown_pool,
+        )
+        self.read_queue.async_set_executor(self._db_read_executor)
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
@@ -356,6 +371,23 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    @callback
+    def async_add_read_job[_T](
+        self,
+        target: Callable[..., _T],
+        *args: Any,
+        priority: int = READ_PRIORITY_INTERACTIVE,
+        owner: Hashable | None = None,
+    ) -> asyncio.Future[_T]:
+        """Add a read only job to the read queue from within the event loop.
+
+        The owner is usually the websocket connection the job is run for
+        and is used to share the read executor fairly between clients.
+        Cancelling the returned future before the job has started
+        removes it from the queue.
+        """
+        return self.read_queue.async_add_job(target, args, priority, owner)
+
     @callback
     def _async_check_queue(self, *_: Any) -> None:
         """Periodic check of the queue size to ensure we do not exhaust memory.
@@ -795,7 +827,7 @@ class Recorder(threading.Thread):
             # since we want the frontend queries to avoid a thundering
             # herd of queries to find the statistics meta data if
             # there are a lot of statistics graphs on the frontend.
-            self.statistics_meta_manager.load(session)
+            self.statistics_meta_manager.prime_cache(session)
 
         migration.migrate_data_live(self, self.get_session, schema_status)
 
@@ -848,6 +880,13 @@ class Recorder(threading.Thread):
 
         assert self.event_session is not None
         session = self.event_session
+        # Prime the caches in bulk with the most recently added rows so
+        # the first commits after a restart do not have to resolve
+        # thousands of rows one at a time
+        self.event_data_manager.prime_cache(session)
+        self.event_type_manager.prime_cache(session)
+        self.states_meta_manager.prime_cache(session)
+        self.state_attributes_manager.prime_cache(session)
         self.event_data_manager.load(non_state_change_events, session)
         self.event_type_manager.load(non_state_change_events, session)
         self.states_meta_manager.load(state_change_events, session)
@@ -1366,6 +1405,15 @@ class Recorder(threading.Thread):
             self.database_engine = database_engine
             self.max_bind_vars = database_engine.max_bind_vars
         self._completed_first_database_setup = True
+        if self._using_file_sqlite and threading.current_thread().name.startswith(
+            DB_READER_PREFIX
+        ):
+            # Connections of the read executor are never used to write
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("PRAGMA query_only=ON")
+            finally:
+                cursor.close()
 
     def _setup_connection(self) -> None:
         """Ensure database is ready to fly."""
@@ -1469,13 +1517,18 @@ class Recorder(threading.Thread):
         try:
             self._end_session()
         finally:
-            if self._db_executor:
-                # We shutdown the executor without forcefully
+            executors = [
+                executor
+                for executor in (self._db_executor, self._db_read_executor)
+                if executor
+            ]
+            for executor in executors:
+                # We shutdown the executors without forcefully
                 # joining the threads until after we have tried
                 # to cleanly close the connection.
-                self._db_executor.shutdown(join_threads_or_timeout=False)
+                executor.shutdown(join_threads_or_timeout=False)
             self._close_connection()
-            if self._db_executor:
+            for executor in executors:
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
-                self._db_executor.join_threads_or_timeout()
+                executor.join_threads_or_timeout()
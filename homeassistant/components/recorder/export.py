@@ -0,0 +1,430 @@
+"""Export and import recorder data.
+
+The records are written and read by a file format from EXPORT_FORMATS.
+Only JSON Lines is implemented, columnar formats like Arrow IPC or
+Parquet would need pyarrow, which is not a dependency of the recorder.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+import logging
+from typing import IO, TYPE_CHECKING, Any, Final
+
+from sqlalchemy import Select, and_, select
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import HomeAssistant, callback, valid_entity_id
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import json_bytes
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads, json_loads_object
+
+from .db_schema import (
+    StateAttributes,
+    States,
+    Statistics,
+    StatisticsBase,
+    StatisticsShortTerm,
+)
+from .models import StatisticData, StatisticMetaData
+from .read_queue import READ_PRIORITY_BULK
+from .statistics import async_add_external_statistics, async_import_statistics
+from .util import get_instance, session_scope
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+EXPORT_FORMAT: Final = "recorder_export"
+EXPORT_VERSION: Final = 1
+
+FORMAT_JSON_LINES: Final = "jsonl"
+
+TABLE_STATES: Final = "states"
+TABLE_STATISTICS: Final = "statistics"
+TABLE_STATISTICS_SHORT_TERM: Final = "statistics_short_term"
+TABLE_STATISTICS_META: Final = "statistics_meta"
+
+EXPORT_TABLES: Final = (TABLE_STATES, TABLE_STATISTICS, TABLE_STATISTICS_SHORT_TERM)
+
+# Rows fetched per round trip with a server-side cursor
+EXPORT_CHUNK_SIZE: Final = 1000
+# Statistics rows handed to the recorder per import job
+IMPORT_BATCH_SIZE: Final = 1000
+# Bytes of JSON Lines read from the import file per executor job
+IMPORT_READ_SIZE: Final = 1024 * 1024
+
+STATISTICS_TABLES: Final[dict[str, type[StatisticsBase]]] = {
+    TABLE_STATISTICS: Statistics,
+    TABLE_STATISTICS_SHORT_TERM: StatisticsShortTerm,
+}
+
+
+async def async_export(
+    hass: HomeAssistant,
+    instance: Recorder,
+    path: str,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    tables: Iterable[str],
+    file_format: str = FORMAT_JSON_LINES,
+) -> dict[str, int]:
+    """Export recorder data to a file and return the number of rows per table."""
+    if not hass.config.is_allowed_path(path):
+        raise HomeAssistantError(f"Cannot write to {path}, no access to path")
+    return await instance.async_add_read_job(
+        export_to_file,
+        instance,
+        path,
+        start_time,
+        end_time,
+        entity_ids,
+        list(tables),
+        EXPORT_FORMATS[file_format],
+        priority=READ_PRIORITY_BULK,
+    )
+
+
+def export_to_file(
+    instance: Recorder,
+    path: str,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    tables: list[str],
+    file_format: ExportFormat,
+) -> dict[str, int]:
+    """Export recorder data to a file.
+
+    Rows are read in chunks with a server-side cursor and written as
+    soon as they are fetched so memory use does not depend on the
+    size of the export.
+    """
+    start_ts = start_time.timestamp()
+    end_ts = end_time.timestamp() if end_time else None
+    counts: dict[str, int] = {}
+    with (
+        session_scope(session=instance.get_session(), read_only=True) as session,
+        open(path, "wb") as fp,
+    ):
+        write = partial(file_format.write, fp)
+        write({"format": EXPORT_FORMAT, "version": EXPORT_VERSION})
+        if TABLE_STATES in tables:
+            counts[TABLE_STATES] = _export_states(
+                instance, session, write, start_ts, end_ts, entity_ids
+            )
+        statistics_tables = [table for table in tables if table in STATISTICS_TABLES]
+        if not statistics_tables:
+            return counts
+        metadata = instance.statistics_meta_manager.get_many(
+            session, statistic_ids=set(entity_ids)
+        )
+        for _, meta in metadata.values():
+            write({"table": TABLE_STATISTICS_META, **meta})
+        metadata_ids = {
+            metadata_id: statistic_id
+            for statistic_id, (metadata_id, _) in metadata.items()
+        }
+        for table in statistics_tables:
+            counts[table] = _export_statistics(
+                session,
+                write,
+                table,
+                STATISTICS_TABLES[table],
+                start_ts,
+                end_ts,
+                metadata_ids,
+            )
+    return counts
+
+
+def _export_states(
+    instance: Recorder,
+    session: Session,
+    write: Callable[[dict[str, Any]], None],
+    start_ts: float,
+    end_ts: float | None,
+    entity_ids: list[str],
+) -> int:
+    """Export states and their attributes."""
+    metadata_ids = {
+        metadata_id: entity_id
+        for entity_id, metadata_id in instance.states_meta_manager.get_many(
+            entity_ids, session, False
+        ).items()
+        if metadata_id is not None
+    }
+    if not metadata_ids:
+        return 0
+    stmt = (
+        select(
+            States.metadata_id,
+            States.state,
+            States.last_changed_ts,
+            States.last_updated_ts,
+            StateAttributes.shared_attrs,
+            States.attributes,
+        )
+        .outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
+        .where(States.metadata_id.in_(metadata_ids), States.last_updated_ts >= start_ts)
+    )
+    if end_ts is not None:
+        stmt = stmt.where(States.last_updated_ts < end_ts)
+    stmt = stmt.order_by(States.metadata_id, States.last_updated_ts)
+    count = 0
+    for rows in _execute_in_chunks(session, stmt):
+        for (
+            metadata_id,
+            state,
+            last_changed_ts,
+            last_updated_ts,
+            shared_attrs,
+            attributes,
+        ) in rows:
+            write(
+                {
+                    "table": TABLE_STATES,
+                    "entity_id": metadata_ids[metadata_id],
+                    "state": state,
+                    "attributes": json_loads_object(shared_attrs or attributes or "{}"),
+                    "last_changed_ts": last_changed_ts or last_updated_ts,
+                    "last_updated_ts": last_updated_ts,
+                },
+            )
+        count += len(rows)
+    return count
+
+
+def _export_statistics(
+    session: Session,
+    write: Callable[[dict[str, Any]], None],
+    table_name: str,
+    table: type[StatisticsBase],
+    start_ts: float,
+    end_ts: float | None,
+    metadata_ids: dict[int, str],
+) -> int:
+    """Export rows from a statistics table."""
+    if not metadata_ids:
+        return 0
+    condition = and_(table.metadata_id.in_(metadata_ids), table.start_ts >= start_ts)
+    if end_ts is not None:
+        condition = and_(condition, table.start_ts < end_ts)
+    stmt = (
+        select(
+            table.metadata_id,
+            table.start_ts,
+            table.mean,
+            table.min,
+            table.max,
+            table.last_reset_ts,
+            table.state,
+            table.sum,
+        )
+        .where(condition)
+        .order_by(table.metadata_id, table.start_ts)
+    )
+    count = 0
+    for rows in _execute_in_chunks(session, stmt):
+        for metadata_id, start, mean, min_, max_, last_reset, state, sum_ in rows:
+            write(
+                {
+                    "table": table_name,
+                    "statistic_id": metadata_ids[metadata_id],
+                    "start_ts": start,
+                    "mean": mean,
+                    "min": min_,
+                    "max": max_,
+                    "last_reset_ts": last_reset,
+                    "state": state,
+                    "sum": sum_,
+                },
+            )
+        count += len(rows)
+    return count
+
+
+def _execute_in_chunks(session: Session, stmt: Select) -> Iterable[list[Any]]:
+    """Execute a statement and yield the rows in chunks."""
+    result = session.execute(
+        stmt.execution_options(stream_results=True, yield_per=EXPORT_CHUNK_SIZE)
+    )
+    for partition in result.partitions():
+        yield list(partition)
+
+
+async def async_import(
+    hass: HomeAssistant, path: str, file_format: str = FORMAT_JSON_LINES
+) -> int:
+    """Import hourly statistics from an export file.
+
+    States and short-term statistics in the file are skipped. Returns
+    the number of statistics rows queued for import.
+    """
+    if not hass.config.is_allowed_path(path):
+        raise HomeAssistantError(f"Cannot read {path}, no access to path")
+    try:
+        fp: IO[bytes] = await hass.async_add_executor_job(open, path, "rb")
+    except OSError as err:
+        raise HomeAssistantError(f"Cannot read {path}: {err}") from err
+    instance = get_instance(hass)
+    importer = _StatisticsImporter(path, EXPORT_FORMATS[file_format].read)
+    try:
+        # The records are read, parsed and converted in the executor,
+        # only the batches of statistics are queued in the event loop
+        while await hass.async_add_executor_job(importer.read_chunk, fp):
+            if importer.async_queue_batches(hass):
+                # Wait for the recorder to import the queued rows before
+                # reading more so memory stays flat for large files
+                await instance.async_block_till_done()
+    finally:
+        await hass.async_add_executor_job(fp.close)
+    importer.flush()
+    importer.async_queue_batches(hass)
+    return importer.imported
+
+
+def _write_json_line(fp: IO[bytes], data: dict[str, Any]) -> None:
+    """Write a single JSON Lines record."""
+    fp.write(json_bytes(data))
+    fp.write(b"\n")
+
+
+def _read_json_lines(fp: IO[bytes]) -> list[dict[str, Any]]:
+    """Read and parse the next chunk of JSON Lines records."""
+    return [_parse_line(line) for line in fp.readlines(IMPORT_READ_SIZE)]
+
+
+def _parse_line(line: bytes) -> dict[str, Any]:
+    """Parse a single JSON Lines record."""
+    try:
+        data = json_loads(line)
+    except ValueError as err:
+        raise HomeAssistantError(f"Invalid export record: {err}") from err
+    if not isinstance(data, dict):
+        raise HomeAssistantError("Invalid export record: not an object")
+    return data
+
+
+@dataclass(frozen=True, slots=True)
+class ExportFormat:
+    """Writer and reader of the records of an export file."""
+
+    write: Callable[[IO[bytes], dict[str, Any]], None]
+    """Write a record to the file."""
+    read: Callable[[IO[bytes]], list[dict[str, Any]]]
+    """Read the next chunk of records, an empty list at the end of the file."""
+
+
+EXPORT_FORMATS: Final = {
+    FORMAT_JSON_LINES: ExportFormat(_write_json_line, _read_json_lines),
+}
+
+
+class _StatisticsImporter:
+    """Collect statistics rows and import them in batches."""
+
+    def __init__(
+        self, path: str, read: Callable[[IO[bytes]], list[dict[str, Any]]]
+    ) -> None:
+        """Initialize the importer."""
+        self._path = path
+        self._read = read
+        self._header_read = False
+        self._metadata: dict[str, StatisticMetaData] = {}
+        self._pending: dict[str, list[StatisticData]] = {}
+        # Full batches waiting to be queued for import in the event loop
+        self._batches: list[tuple[StatisticMetaData, list[StatisticData]]] = []
+        self.imported = 0
+
+    def read_chunk(self, fp: IO[bytes]) -> bool:
+        """Read the next chunk of records, False at the end of the file.
+
+        This method must be run in the executor.
+        """
+        if not (records := self._read(fp)):
+            return False
+        if not self._header_read:
+            if records[0].get("format") != EXPORT_FORMAT:
+                raise HomeAssistantError(f"{self._path} is not a recorder export file")
+            self._header_read = True
+            records = records[1:]
+        for record in records:
+            self.add(record)
+        return True
+
+    def add(self, data: dict[str, Any]) -> None:
+        """Add a record from the export file."""
+        try:
+            self._add(data)
+        except (KeyError, TypeError, ValueError, OverflowError, OSError) as err:
+            raise HomeAssistantError(
+                f"Invalid export record for {data.get('table')}: {err!r}"
+            ) from err
+
+    def _add(self, data: dict[str, Any]) -> None:
+        """Add a record, raising if a required field is missing or invalid."""
+        table = data.get("table")
+        if table == TABLE_STATISTICS_META:
+            statistic_id: str = data["statistic_id"]
+            self._metadata[statistic_id] = StatisticMetaData(
+                has_mean=data["has_mean"],
+                has_sum=data["has_sum"],
+                name=data["name"],
+                source=data["source"],
+                statistic_id=statistic_id,
+                unit_of_measurement=data["unit_of_measurement"],
+            )
+            return
+        if table != TABLE_STATISTICS:
+            return
+        statistic_id = data["statistic_id"]
+        if statistic_id not in self._metadata:
+            raise HomeAssistantError(f"Missing metadata for {statistic_id}")
+        statistic = StatisticData(start=dt_util.utc_from_timestamp(data["start_ts"]))
+        for key in ("mean", "min", "max", "state", "sum"):
+            if (value := data.get(key)) is not None:
+                statistic[key] = value  # type: ignore[literal-required]
+        if (last_reset_ts := data.get("last_reset_ts")) is not None:
+            statistic["last_reset"] = dt_util.utc_from_timestamp(last_reset_ts)
+        pending = self._pending.setdefault(statistic_id, [])
+        pending.append(statistic)
+        if len(pending) >= IMPORT_BATCH_SIZE:
+            self._import(statistic_id)
+
+    def flush(self) -> None:
+        """Move all pending statistics to the batches to import."""
+        for statistic_id in list(self._pending):
+            self._import(statistic_id)
+
+    def _import(self, statistic_id: str) -> None:
+        """Move the pending statistics for a statistic_id to a batch to import."""
+        self._batches.append(
+            (self._metadata[statistic_id], self._pending.pop(statistic_id))
+        )
+
+    @callback
+    def async_queue_batches(self, hass: HomeAssistant) -> int:
+        """Queue the batches for import and return the number of queued rows."""
+        queued = 0
+        for metadata, statistics in self._batches:
+            statistic_id = metadata["statistic_id"]
+            if valid_entity_id(statistic_id):
+                async_import_statistics(hass, metadata, statistics)
+            else:
+                async_add_external_statistics(hass, metadata, statistics)
+            queued += len(statistics)
+            _LOGGER.debug(
+                "Queued import of %s rows for %s", len(statistics), statistic_id
+            )
+        self._batches.clear()
+        self.imported += queued
+        return queued
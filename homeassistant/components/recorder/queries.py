@@ -62,6 +62,42 @@ def find_event_type_ids(event_types: Iterable[str]) -> StatementLambdaElement:
     )
 
 
+def find_recent_shared_attributes(limit: int) -> StatementLambdaElement:
+    """Find the most recently added shared attributes."""
+    return lambda_stmt(
+        lambda: select(StateAttributes.attributes_id, StateAttributes.shared_attrs)
+        .order_by(StateAttributes.attributes_id.desc())
+        .limit(limit)
+    )
+
+
+def find_recent_shared_event_datas(limit: int) -> StatementLambdaElement:
+    """Find the most recently added shared event data."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id, EventData.shared_data)
+        .order_by(EventData.data_id.desc())
+        .limit(limit)
+    )
+
+
+def find_recent_event_type_ids(limit: int) -> StatementLambdaElement:
+    """Find the most recently added event_type ids."""
+    return lambda_stmt(
+        lambda: select(EventTypes.event_type_id, EventTypes.event_type)
+        .order_by(EventTypes.event_type_id.desc())
+        .limit(limit)
+    )
+
+
+def find_recent_states_metadata_ids(limit: int) -> StatementLambdaElement:
+    """Find the most recently added metadata_ids and entity_ids."""
+    return lambda_stmt(
+        lambda: select(StatesMeta.metadata_id, StatesMeta.entity_id)
+        .order_by(StatesMeta.metadata_id.desc())
+        .limit(limit)
+    )
+
+
 def find_all_states_metadata_ids() -> StatementLambdaElement:
     """Find all metadata_ids and entity_ids."""
     return lambda_stmt(lambda: select(StatesMeta.metadata_id, StatesMeta.entity_id))
@@ -0,0 +1,178 @@
+"""Fair queue for database read jobs."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Hashable
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import partial
+from heapq import heappop, heappush
+from itertools import count
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+# Read jobs a user is actively waiting for, such as a history
+# or statistics request made by the frontend
+READ_PRIORITY_INTERACTIVE = 0
+# Backfill for live history and logbook streams
+READ_PRIORITY_STREAM = 1
+# Large reads that can wait, such as exports
+READ_PRIORITY_BULK = 2
+
+
+@dataclass(frozen=True, slots=True)
+class ReadQueueStats:
+    """Statistics for the read queue."""
+
+    queued: int
+    running: int
+    completed: int
+    cancelled: int
+    total_wait: float
+    max_wait: float
+
+
+@dataclass(slots=True)
+class _ReadJob:
+    """A read job waiting in the queue."""
+
+    future: asyncio.Future[Any]
+    key: tuple[int, Hashable | None]
+    target: Callable[..., Any]
+    args: tuple[Any, ...]
+    queued_at: float
+    dispatched: bool = False
+
+
+class ReadQueue:
+    """Fair queue that runs read jobs on the read executor.
+
+    Jobs are ordered by priority first. Jobs with the same priority
+    are interleaved between owners (usually a websocket connection)
+    so a single client can not starve the others by queuing a lot of
+    requests at once. Jobs that are cancelled while they are still
+    queued, for example because the websocket subscription that
+    requested them was closed, never reach the database.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_running: int) -> None:
+        """Initialize the read queue."""
+        self._hass = hass
+        self._max_running = max_running
+        self._executor: Executor | None = None
+        self._queue: list[tuple[int, int, int, _ReadJob]] = []
+        self._queued_per_owner: dict[tuple[int, Hashable | None], int] = {}
+        self._seq = count()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._cancelled = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @callback
+    def async_set_executor(self, executor: Executor | None) -> None:
+        """Set the executor the jobs run on."""
+        self._executor = executor
+
+    @callback
+    def async_add_job[_T](
+        self,
+        target: Callable[..., _T],
+        args: tuple[Any, ...],
+        priority: int,
+        owner: Hashable | None,
+    ) -> asyncio.Future[_T]:
+        """Queue a read job and return a future with its result."""
+        future: asyncio.Future[_T] = self._hass.loop.create_future()
+        queued_per_owner = self._queued_per_owner
+        key = (priority, owner)
+        rank = queued_per_owner.get(key, 0)
+        queued_per_owner[key] = rank + 1
+        job = _ReadJob(future, key, target, args, time.monotonic())
+        heappush(self._queue, (priority, rank, next(self._seq), job))
+        self._queued += 1
+        future.add_done_callback(partial(self._async_job_cancelled, job))
+        self._async_dispatch()
+        return future
+
+    @callback
+    def _async_job_cancelled(self, job: _ReadJob, future: asyncio.Future[Any]) -> None:
+        """Stop counting a job that was cancelled while it was still queued.
+
+        The job stays in the heap until it is popped and skipped.
+        """
+        if job.dispatched or not future.cancelled():
+            return
+        self._queued -= 1
+        self._cancelled += 1
+        self._async_release_rank(job)
+
+    @callback
+    def _async_release_rank(self, job: _ReadJob) -> None:
+        """Release the place of a job in the queue of its owner."""
+        queued_per_owner = self._queued_per_owner
+        if (remaining := queued_per_owner[job.key] - 1) > 0:
+            queued_per_owner[job.key] = remaining
+        else:
+            del queued_per_owner[job.key]
+
+    @callback
+    def _async_dispatch(self) -> None:
+        """Start queued jobs while there are idle workers."""
+        queue = self._queue
+        while queue and self._running < self._max_running:
+            job = heappop(queue)[3]
+            if job.future.cancelled():
+                # Already accounted for when it was cancelled
+                continue
+            job.dispatched = True
+            self._queued -= 1
+            self._async_release_rank(job)
+            wait = time.monotonic() - job.queued_at
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            try:
+                executor_future = self._hass.loop.run_in_executor(
+                    self._executor, job.target, *job.args
+                )
+            except RuntimeError as err:
+                # The executor has been shutdown
+                job.future.set_exception(err)
+                continue
+            self._running += 1
+            executor_future.add_done_callback(partial(self._async_job_done, job.future))
+
+    @callback
+    def _async_job_done(
+        self, future: asyncio.Future[Any], executor_future: asyncio.Future[Any]
+    ) -> None:
+        """Deliver the result of a job and start the next one."""
+        self._running -= 1
+        self._completed += 1
+        if executor_future.cancelled():
+            if not future.done():
+                future.cancel()
+        # Always retrieve the exception, even if the caller went away,
+        # so it is not logged as never retrieved
+        elif (exc := executor_future.exception()) is not None:
+            if not future.done():
+                future.set_exception(exc)
+        elif not future.done():
+            future.set_result(executor_future.result())
+        self._async_dispatch()
+
+    @callback
+    def async_stats(self) -> ReadQueueStats:
+        """Return statistics about the read queue."""
+        return ReadQueueStats(
+            queued=self._queued,
+            running=self._running,
+            completed=self._completed,
+            cancelled=self._cancelled,
+            total_wait=self._total_wait,
+            max_wait=self._max_wait,
+        )
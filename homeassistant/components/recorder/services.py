@@ -19,12 +19,21 @@ import homeassistant.util.dt as dt_util
 
 from .const import ATTR_APPLY_FILTER, ATTR_KEEP_DAYS, ATTR_REPACK, DOMAIN
 from .core import Recorder
+from .export import (
+    EXPORT_FORMATS,
+    EXPORT_TABLES,
+    FORMAT_JSON_LINES,
+    async_export,
+    async_import,
+)
 from .tasks import PurgeEntitiesTask, PurgeTask
 
 SERVICE_PURGE = "purge"
 SERVICE_PURGE_ENTITIES = "purge_entities"
 SERVICE_ENABLE = "enable"
 SERVICE_DISABLE = "disable"
+SERVICE_EXPORT = "export"
+SERVICE_IMPORT = "import"
 
 SERVICE_PURGE_SCHEMA = vol.Schema(
     {
@@ -63,6 +72,31 @@ SERVICE_PURGE_ENTITIES_SCHEMA = vol.All(
 SERVICE_ENABLE_SCHEMA = vol.Schema({})
 SERVICE_DISABLE_SCHEMA = vol.Schema({})
 
+ATTR_FILENAME = "filename"
+ATTR_START_TIME = "start_time"
+ATTR_END_TIME = "end_time"
+ATTR_TABLES = "tables"
+ATTR_FORMAT = "format"
+
+SERVICE_EXPORT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_FILENAME): cv.string,
+        vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Required(ATTR_START_TIME): cv.datetime,
+        vol.Optional(ATTR_END_TIME): cv.datetime,
+        vol.Optional(ATTR_TABLES, default=list(EXPORT_TABLES)): vol.All(
+            cv.ensure_list, [vol.In(EXPORT_TABLES)]
+        ),
+        vol.Optional(ATTR_FORMAT, default=FORMAT_JSON_LINES): vol.In(EXPORT_FORMATS),
+    }
+)
+SERVICE_IMPORT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_FILENAME): cv.string,
+        vol.Optional(ATTR_FORMAT, default=FORMAT_JSON_LINES): vol.In(EXPORT_FORMATS),
+    }
+)
+
 
 @callback
 def _async_register_purge_service(hass: HomeAssistant, instance: Recorder) -> None:
@@ -135,6 +169,50 @@ def _async_register_disable_service(hass: HomeAssistant, instance: Recorder) ->
     )
 
 
+@callback
+def _async_register_export_service(hass: HomeAssistant, instance: Recorder) -> None:
+    async def async_handle_export_service(service: ServiceCall) -> None:
+        """Handle calls to the export service."""
+        end_time = service.data.get(ATTR_END_TIME)
+        await async_export(
+            hass,
+            instance,
+            hass.config.path(service.data[ATTR_FILENAME]),
+            dt_util.as_utc(service.data[ATTR_START_TIME]),
+            dt_util.as_utc(end_time) if end_time else None,
+            service.data[ATTR_ENTITY_ID],
+            service.data[ATTR_TABLES],
+            service.data[ATTR_FORMAT],
+        )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_EXPORT,
+        async_handle_export_service,
+        schema=SERVICE_EXPORT_SCHEMA,
+    )
+
+
+@callback
+def _async_register_import_service(hass: HomeAssistant) -> None:
+    async def async_handle_import_service(service: ServiceCall) -> None:
+        """Handle calls to the import service."""
+        await async_import(
+            hass,
+            hass.config.path(service.data[ATTR_FILENAME]),
+            service.data[ATTR_FORMAT],
+        )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_IMPORT,
+        async_handle_import_service,
+        schema=SERVICE_IMPORT_SCHEMA,
+    )
+
+
 @callback
 def async_register_services(hass: HomeAssistant, instance: Recorder) -> None:
     """Register recorder services."""
@@ -142,3 +220,5 @@ def async_register_services(hass: HomeAssistant, instance: Recorder) -> None:
     _async_register_purge_entities_service(hass, instance)
     _async_register_enable_service(hass, instance)
     _async_register_disable_service(hass, instance)
+    _async_register_export_service(hass, instance)
+    _async_register_import_service(hass)
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import groupby
 import logging
 from operator import itemgetter
 import re
@@ -247,13 +248,12 @@ def get_display_unit(
     return state_unit
 
 
-def _get_statistic_to_display_unit_converter(
+def _get_statistic_display_unit_converter(
     statistic_unit: str | None,
     state_unit: str | None,
     requested_units: dict[str, str] | None,
-    allow_none: bool = True,
-) -> Callable[[float | None], float | None] | Callable[[float], float] | None:
-    """Prepare a converter from the statistics unit to display unit."""
+) -> tuple[type[BaseUnitConverter], str | None] | None:
+    """Return the converter and display unit for a statistic, if it needs converting."""
     if (converter := STATISTIC_UNIT_TO_UNIT_CONVERTER.get(statistic_unit)) is None:
         return None
 
@@ -271,11 +271,43 @@ def _get_statistic_to_display_unit_converter(
     if display_unit == statistic_unit:
         return None
 
-    if allow_none:
-        return converter.converter_factory_allow_none(
-            from_unit=statistic_unit, to_unit=display_unit
+    return converter, display_unit
+
+
+def _get_statistic_to_display_unit_converter(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+) -> Callable[[float | None], float | None] | None:
+    """Prepare a converter from the statistics unit to display unit."""
+    if (
+        display_converter := _get_statistic_display_unit_converter(
+            statistic_unit, state_unit, requested_units
+        )
+    ) is None:
+        return None
+    converter, display_unit = display_converter
+    return converter.converter_factory_allow_none(
+        from_unit=statistic_unit, to_unit=display_unit
+    )
+
+
+def _get_statistic_to_display_unit_list_converter(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+) -> Callable[[list[float | None]], list[float | None]] | None:
+    """Prepare a converter for lists of values from the statistics unit to display unit."""
+    if (
+        display_converter := _get_statistic_display_unit_converter(
+            statistic_unit, state_unit, requested_units
         )
-    return converter.converter_factory(from_unit=statistic_unit, to_unit=display_unit)
+    ) is None:
+        return None
+    converter, display_unit = display_converter
+    return converter.converter_factory_list_allow_none(
+        from_unit=statistic_unit, to_unit=display_unit
+    )
 
 
 def _get_display_to_statistic_unit_converter(
@@ -908,16 +940,37 @@ def list_statistic_ids(
     return _flatten_list_statistic_ids_metadata_result(result)
 
 
+def _statistics_column(
+    stat_list: list[StatisticsRow],
+    key: Literal["max", "mean", "min"],
+) -> tuple[list[float | None], bool]:
+    """Return a column of values and whether it contains any None."""
+    column = [statistic.get(key) for statistic in stat_list]
+    return column, None in column
+
+
+def _period_values(
+    column: tuple[list[float | None], bool], first: int, end: int
+) -> list[float]:
+    """Return the values which are not None in a slice of a column."""
+    values, has_none = column
+    if has_none:
+        return [v for v in values[first:end] if v is not None]
+    return values[first:end]  # type: ignore[return-value]
+
+
 def _reduce_statistics(
     stats: dict[str, list[StatisticsRow]],
-    same_period: Callable[[float, float], bool],
     period_start_end: Callable[[float], tuple[float, float]],
-    period: timedelta,
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily or monthly statistics."""
+    """Reduce hourly statistics to daily or monthly statistics.
+
+    The rows are sorted by start time, so the rows of a period are
+    found with a binary search for the end of the period and each
+    period is reduced from slices of the value columns.
+    """
     result: dict[str, list[StatisticsRow]] = defaultdict(list)
-    period_seconds = period.total_seconds()
     _want_mean = "mean" in types
     _want_min = "min" in types
     _want_max = "max" in types
@@ -925,70 +978,70 @@ def _reduce_statistics(
     _want_state = "state" in types
     _want_sum = "sum" in types
     for statistic_id, stat_list in stats.items():
-        max_values: list[float] = []
-        mean_values: list[float] = []
-        min_values: list[float] = []
-        prev_stat: StatisticsRow = stat_list[0]
-        fake_entry: StatisticsRow = {"start": stat_list[-1]["start"] + period_seconds}
-
-        # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_entry,)):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, end = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                row: StatisticsRow = {
-                    "start": start,
-                    "end": end,
-                }
-                if _want_mean:
-                    row["mean"] = mean(mean_values) if mean_values else None
-                    mean_values.clear()
-                if _want_min:
-                    row["min"] = min(min_values) if min_values else None
-                    min_values.clear()
-                if _want_max:
-                    row["max"] = max(max_values) if max_values else None
-                    max_values.clear()
-                if _want_last_reset:
-                    row["last_reset"] = prev_stat.get("last_reset")
-                if _want_state:
-                    row["state"] = prev_stat.get("state")
-                if _want_sum:
-                    row["sum"] = prev_stat["sum"]
-                result[statistic_id].append(row)
-            if _want_max and (_max := statistic.get("max")) is not None:
-                max_values.append(_max)
-            if _want_mean and (_mean := statistic.get("mean")) is not None:
-                mean_values.append(_mean)
-            if _want_min and (_min := statistic.get("min")) is not None:
-                min_values.append(_min)
-            prev_stat = statistic
+        starts = [statistic["start"] for statistic in stat_list]
+        if _want_max:
+            max_column = _statistics_column(stat_list, "max")
+        if _want_mean:
+            mean_column = _statistics_column(stat_list, "mean")
+        if _want_min:
+            min_column = _statistics_column(stat_list, "min")
+        reduced = result[statistic_id]
+        period_first = 0
+        num_rows = len(starts)
+        while period_first < num_rows:
+            start, end = period_start_end(starts[period_first])
+            period_end = bisect_left(starts, end, period_first + 1)
+            # The last entry of the period
+            last_stat = stat_list[period_end - 1]
+            row: StatisticsRow = {
+                "start": start,
+                "end": end,
+            }
+            if _want_mean:
+                values = _period_values(mean_column, period_first, period_end)
+                row["mean"] = mean(values) if values else None
+            if _want_min:
+                values = _period_values(min_column, period_first, period_end)
+                row["min"] = min(values) if values else None
+            if _want_max:
+                values = _period_values(max_column, period_first, period_end)
+                row["max"] = max(values) if values else None
+            if _want_last_reset:
+                row["last_reset"] = last_stat.get("last_reset")
+            if _want_state:
+                row["state"] = last_stat.get("state")
+            if _want_sum:
+                row["sum"] = last_stat["sum"]
+            reduced.append(row)
+            period_first = period_end
 
     return result
 
 
-def reduce_day_ts_factory() -> (
-    tuple[
-        Callable[[float, float], bool],
-        Callable[[float], tuple[float, float]],
-    ]
-):
-    """Return functions to match same day and day start end."""
+def _same_period_ts_factory(
+    period_start_end_ts: Callable[[float], tuple[float, float]],
+) -> Callable[[float, float], bool]:
+    """Return a function to match timestamps in the same period."""
     _lower_bound: float = 0
     _upper_bound: float = 0
 
+    def _same_period_ts(time1: float, time2: float) -> bool:
+        """Return True if time1 and time2 are in the same period."""
+        nonlocal _lower_bound, _upper_bound
+        if not _lower_bound <= time1 < _upper_bound:
+            _lower_bound, _upper_bound = period_start_end_ts(time1)
+        return _lower_bound <= time2 < _upper_bound
+
+    return _same_period_ts
+
+
+def _day_start_end_ts_factory() -> Callable[[float], tuple[float, float]]:
+    """Return a function to find the start and end of the day of a timestamp."""
     # We have to recreate _local_from_timestamp in the closure in case the timezone changes
     _local_from_timestamp = partial(
         datetime.fromtimestamp, tz=dt_util.get_default_time_zone()
     )
 
-    def _same_day_ts(time1: float, time2: float) -> bool:
-        """Return True if time1 and time2 are in the same date."""
-        nonlocal _lower_bound, _upper_bound
-        if not _lower_bound <= time1 < _upper_bound:
-            _lower_bound, _upper_bound = _day_start_end_ts_cached(time1)
-        return _lower_bound <= time2 < _upper_bound
-
     def _day_start_end_ts(time: float) -> tuple[float, float]:
         """Return the start and end of the period (day) time is within."""
         start_local = _local_from_timestamp(time).replace(
@@ -1000,9 +1053,18 @@ def reduce_day_ts_factory() -> (
         )
 
     # We create _day_start_end_ts_cached in the closure in case the timezone changes
-    _day_start_end_ts_cached = lru_cache(maxsize=6)(_day_start_end_ts)
+    return lru_cache(maxsize=6)(_day_start_end_ts)
 
-    return _same_day_ts, _day_start_end_ts_cached
+
+def reduce_day_ts_factory() -> (
+    tuple[
+        Callable[[float, float], bool],
+        Callable[[float], tuple[float, float]],
+    ]
+):
+    """Return functions to match same day and day start end."""
+    _day_start_end_ts_cached = _day_start_end_ts_factory()
+    return _same_period_ts_factory(_day_start_end_ts_cached), _day_start_end_ts_cached
 
 
 def _reduce_statistics_per_day(
@@ -1010,34 +1072,16 @@ def _reduce_statistics_per_day(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to daily statistics."""
-    _same_day_ts, _day_start_end_ts = reduce_day_ts_factory()
-    return _reduce_statistics(
-        stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
-    )
+    return _reduce_statistics(stats, _day_start_end_ts_factory(), types)
 
 
-def reduce_week_ts_factory() -> (
-    tuple[
-        Callable[[float, float], bool],
-        Callable[[float], tuple[float, float]],
-    ]
-):
-    """Return functions to match same week and week start end."""
-    _lower_bound: float = 0
-    _upper_bound: float = 0
-
+def _week_start_end_ts_factory() -> Callable[[float], tuple[float, float]]:
+    """Return a function to find the start and end of the week of a timestamp."""
     # We have to recreate _local_from_timestamp in the closure in case the timezone changes
     _local_from_timestamp = partial(
         datetime.fromtimestamp, tz=dt_util.get_default_time_zone()
     )
 
-    def _same_week_ts(time1: float, time2: float) -> bool:
-        """Return True if time1 and time2 are in the same year and week."""
-        nonlocal _lower_bound, _upper_bound
-        if not _lower_bound <= time1 < _upper_bound:
-            _lower_bound, _upper_bound = _week_start_end_ts_cached(time1)
-        return _lower_bound <= time2 < _upper_bound
-
     def _week_start_end_ts(time: float) -> tuple[float, float]:
         """Return the start and end of the period (week) time is within."""
         time_local = _local_from_timestamp(time)
@@ -1050,9 +1094,7 @@ def reduce_week_ts_factory() -> (
         )
 
     # We create _week_start_end_ts_cached in the closure in case the timezone changes
-    _week_start_end_ts_cached = lru_cache(maxsize=6)(_week_start_end_ts)
-
-    return _same_week_ts, _week_start_end_ts_cached
+    return lru_cache(maxsize=6)(_week_start_end_ts)
 
 
 def _reduce_statistics_per_week(
@@ -1060,10 +1102,7 @@ def _reduce_statistics_per_week(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to weekly statistics."""
-    _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
-    return _reduce_statistics(
-        stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
-    )
+    return _reduce_statistics(stats, _week_start_end_ts_factory(), types)
 
 
 def _find_month_end_time(timestamp: datetime) -> datetime:
@@ -1074,28 +1113,13 @@ def _find_month_end_time(timestamp: datetime) -> datetime:
     )
 
 
-def reduce_month_ts_factory() -> (
-    tuple[
-        Callable[[float, float], bool],
-        Callable[[float], tuple[float, float]],
-    ]
-):
-    """Return functions to match same month and month start end."""
-    _lower_bound: float = 0
-    _upper_bound: float = 0
-
+def _month_start_end_ts_factory() -> Callable[[float], tuple[float, float]]:
+    """Return a function to find the start and end of the month of a timestamp."""
     # We have to recreate _local_from_timestamp in the closure in case the timezone changes
     _local_from_timestamp = partial(
         datetime.fromtimestamp, tz=dt_util.get_default_time_zone()
     )
 
-    def _same_month_ts(time1: float, time2: float) -> bool:
-        """Return True if time1 and time2 are in the same year and month."""
-        nonlocal _lower_bound, _upper_bound
-        if not _lower_bound <= time1 < _upper_bound:
-            _lower_bound, _upper_bound = _month_start_end_ts_cached(time1)
-        return _lower_bound <= time2 < _upper_bound
-
     def _month_start_end_ts(time: float) -> tuple[float, float]:
         """Return the start and end of the period (month) time is within."""
         start_local = _local_from_timestamp(time).replace(
@@ -1105,9 +1129,21 @@ def reduce_month_ts_factory() -> (
         return (start_local.timestamp(), end_local.timestamp())
 
     # We create _month_start_end_ts_cached in the closure in case the timezone changes
-    _month_start_end_ts_cached = lru_cache(maxsize=6)(_month_start_end_ts)
+    return lru_cache(maxsize=6)(_month_start_end_ts)
 
-    return _same_month_ts, _month_start_end_ts_cached
+
+def reduce_month_ts_factory() -> (
+    tuple[
+        Callable[[float, float], bool],
+        Callable[[float], tuple[float, float]],
+    ]
+):
+    """Return functions to match same month and month start end."""
+    _month_start_end_ts_cached = _month_start_end_ts_factory()
+    return (
+        _same_period_ts_factory(_month_start_end_ts_cached),
+        _month_start_end_ts_cached,
+    )
 
 
 def _reduce_statistics_per_month(
@@ -1115,10 +1151,7 @@ def _reduce_statistics_per_month(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to monthly statistics."""
-    _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
-    return _reduce_statistics(
-        stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
-    )
+    return _reduce_statistics(stats, _month_start_end_ts_factory(), types)
 
 
 def _generate_statistics_during_period_stmt(
@@ -2074,16 +2107,18 @@ def _build_sum_converted_stats(
     table_duration_seconds: float,
     start_ts_idx: int,
     sum_idx: int,
-    convert: Callable[[float | None], float | None] | Callable[[float], float],
+    convert: Callable[[list[float | None]], list[float | None]],
 ) -> list[StatisticsRow]:
-    """Build a list of sum statistics."""
+    """Build a list of sum statistics with unit conversion."""
     return [
         {
             "start": (start_ts := db_row[start_ts_idx]),
             "end": start_ts + table_duration_seconds,
-            "sum": None if (v := db_row[sum_idx]) is None else convert(v),
+            "sum": _sum,
         }
-        for db_row in db_rows
+        for db_row, _sum in zip(
+            db_rows, convert([db_row[sum_idx] for db_row in db_rows]), strict=True
+        )
     ]
 
 
@@ -2126,20 +2161,25 @@ def _build_converted_stats(
     table_duration_seconds: float,
     start_ts_idx: int,
     row_mapping: tuple[tuple[str, int], ...],
-    convert: Callable[[float | None], float | None] | Callable[[float], float],
+    convert: Callable[[list[float | None]], list[float | None]],
 ) -> list[StatisticsRow]:
-    """Build a list of statistics with unit conversion."""
-    return [
+    """Build a list of statistics with unit conversion.
+
+    Each column is converted in a single call and then added to the rows.
+    """
+    stats: list[StatisticsRow] = [
         {
             "start": (start_ts := db_row[start_ts_idx]),
             "end": start_ts + table_duration_seconds,
-            **{
-                key: None if (v := db_row[idx]) is None else convert(v)  # type: ignore[typeddict-item]
-                for key, idx in row_mapping
-            },
         }
         for db_row in db_rows
     ]
+    for key, idx in row_mapping:
+        for row, value in zip(
+            stats, convert([db_row[idx] for db_row in db_rows]), strict=True
+        ):
+            row[key] = value  # type: ignore[literal-required]
+    return stats
 
 
 def _sorted_statistics_to_dict(
@@ -2189,15 +2229,14 @@ def _sorted_statistics_to_dict(
     for meta_id, db_rows in stats_by_meta_id.items():
         metadata_by_id = metadata[meta_id]
         statistic_id = metadata_by_id["statistic_id"]
+        convert: Callable[[list[float | None]], list[float | None]] | None = None
         if convert_units:
             state_unit = unit = metadata_by_id["unit_of_measurement"]
             if state := hass.states.get(statistic_id):
                 state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-            convert = _get_statistic_to_display_unit_converter(
-                unit, state_unit, units, allow_none=False
+            convert = _get_statistic_to_display_unit_list_converter(
+                unit, state_unit, units
             )
-        else:
-            convert = None
 
         build_args = (db_rows, table_duration_seconds, start_ts_idx)
         if sum_only:
@@ -11,6 +11,8 @@ from homeassistant.core import HomeAssistant, callback
 from .. import get_instance
 from ..const import SupportedDialect
 from ..core import Recorder
+from ..read_queue import ReadQueueStats
+from ..table_managers import LRUCacheStats
 from ..util import session_scope
 from .mysql import db_size_bytes as mysql_db_size_bytes
 from .postgresql import db_size_bytes as postgresql_db_size_bytes
@@ -22,6 +24,14 @@ DIALECT_TO_GET_SIZE = {
     SupportedDialect.POSTGRESQL: postgresql_db_size_bytes,
 }
 
+CACHE_MANAGERS = {
+    "states_meta_cache": "states_meta_manager",
+    "state_attributes_cache": "state_attributes_manager",
+    "event_types_cache": "event_type_manager",
+    "event_data_cache": "event_data_manager",
+    "statistics_meta_cache": "statistics_meta_manager",
+}
+
 
 @callback
 def async_register(
@@ -44,6 +54,35 @@ def _get_db_stats(instance: Recorder, database_name: str) -> dict[str, Any]:
     return db_stats
 
 
+def _format_cache_stats(stats: LRUCacheStats) -> str:
+    """Format the stats of an LRU cache."""
+    return (
+        f"{stats.entries}/{stats.max_entries} entries, "
+        f"{stats.estimated_bytes/1024/1024:.2f}/{stats.max_bytes/1024/1024:.2f} MiB, "
+        f"{stats.hits} hits, {stats.misses} misses, {stats.evictions} evictions"
+    )
+
+
+def _get_cache_stats(instance: Recorder) -> dict[str, Any]:
+    """Get the stats about the table manager caches."""
+    return {
+        key: _format_cache_stats(getattr(instance, manager).cache_stats())
+        for key, manager in CACHE_MANAGERS.items()
+    }
+
+
+def _format_read_queue_stats(stats: ReadQueueStats) -> str:
+    """Format the stats of the read queue."""
+    started = stats.completed + stats.running
+    average_wait = stats.total_wait / started if started else 0
+    return (
+        f"{stats.queued} queued, {stats.running} running, "
+        f"{stats.completed} completed, {stats.cancelled} cancelled, "
+        f"{average_wait*1000:.1f} ms average wait, "
+        f"{stats.max_wait*1000:.1f} ms max wait"
+    )
+
+
 @callback
 def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     """Get database engine info."""
@@ -68,6 +107,10 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         db_stats = await instance.async_add_executor_job(
             _get_db_stats, instance, database_name
         )
+        db_stats |= await instance.async_add_executor_job(_get_cache_stats, instance)
+        db_stats["read_queue"] = _format_read_queue_stats(
+            instance.read_queue.async_stats()
+        )
         db_runs = {
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from dataclasses import dataclass
+from sys import getsizeof
 from typing import TYPE_CHECKING, Any
 
 from lru import LRU
@@ -11,6 +14,74 @@ from homeassistant.util.event_type import EventType
 if TYPE_CHECKING:
     from ..core import Recorder
 
+# Approximate memory used by each LRU node in addition to the
+# key and the value (hash table slot and linked list node)
+LRU_NODE_OVERHEAD = 96
+
+# The minimum number of entries to keep when a cache has to shrink
+# to fit in its memory budget to avoid thrashing
+MIN_LRU_SIZE = 256
+
+# The maximum number of entries measured to estimate the memory
+# used by an LRU cache
+LRU_SIZE_SAMPLE = 128
+
+
+@dataclass(frozen=True, slots=True)
+class LRUCacheStats:
+    """Statistics for an LRU cache."""
+
+    entries: int
+    max_entries: int
+    estimated_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+def estimate_entry_bytes(key: Any, value: Any) -> int:
+    """Estimate the memory used by a single LRU entry."""
+    size = getsizeof(key) + getsizeof(value) + LRU_NODE_OVERHEAD
+    if type(value) is tuple:
+        size += sum(getsizeof(item) for item in value)
+    return size
+
+
+def estimate_lru_bytes(lru: LRU) -> int:
+    """Estimate the memory used by an LRU cache.
+
+    Only up to LRU_SIZE_SAMPLE entries, spread over the cache, are
+    measured and their average size is used for the other entries.
+    """
+    if not (items := lru.items()):
+        return 0
+    sample = items[:: len(items) // LRU_SIZE_SAMPLE or 1][:LRU_SIZE_SAMPLE]
+    sample_bytes = sum(estimate_entry_bytes(key, value) for key, value in sample)
+    return sample_bytes * len(items) // len(sample)
+
+
+def adjust_lru_size_to_budget(lru: LRU, new_size: int, max_bytes: int) -> None:
+    """Grow an LRU to new_size as long as it stays within its memory budget.
+
+    If the cached entries turned out to be larger than expected, the LRU
+    is shrunk instead so the estimated memory use stays within the budget.
+    It is never shrunk below MIN_LRU_SIZE entries, or its current size if
+    that is smaller, so a cache of very large entries can use more than
+    its budget.
+    """
+    current_size = lru.get_size()
+    if entries := len(lru):
+        max_entries = max_bytes * entries // (estimate_lru_bytes(lru) or 1)
+    else:
+        max_entries = max_bytes // LRU_NODE_OVERHEAD
+    if max_entries < current_size:
+        # The cached entries are larger than expected so shrink
+        # the LRU to keep it within its memory budget
+        lru.set_size(max(max_entries, min(MIN_LRU_SIZE, current_size)))
+    elif (new_size := min(new_size, max_entries)) > current_size:
+        lru.set_size(new_size)
+
 
 class BaseTableManager[_DataT]:
     """Base class for table managers."""
@@ -56,14 +127,23 @@ class BaseTableManager[_DataT]:
 class BaseLRUTableManager[_DataT](BaseTableManager[_DataT]):
     """Base class for LRU table managers."""
 
-    def __init__(self, recorder: Recorder, lru_size: int) -> None:
+    def __init__(self, recorder: Recorder, lru_size: int, max_bytes: int) -> None:
         """Initialize the LRU table manager.
 
         We keep track of the most recently used items
         and evict the least recently used items when the cache is full.
+
+        The cache is allowed to grow with the number of entities as
+        long as its estimated memory use stays below max_bytes.
         """
         super().__init__(recorder)
-        self._id_map = LRU(lru_size)
+        self.max_bytes = max_bytes
+        self._evictions = 0
+        self._id_map = LRU(lru_size, self._on_evict)
+
+    def _on_evict(self, key: EventType[Any] | str, value: int) -> None:
+        """Count an item evicted from the LRU."""
+        self._evictions += 1
 
     def adjust_lru_size(self, new_size: int) -> None:
         """Adjust the LRU cache size.
@@ -71,6 +151,44 @@ class BaseLRUTableManager[_DataT](BaseTableManager[_DataT]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        adjust_lru_size_to_budget(self._id_map, new_size, self.max_bytes)
+
+    def cache_stats(self) -> LRUCacheStats:
+        """Return statistics about the LRU cache.
+
+        This call is thread-safe.
+        """
         lru = self._id_map
-        if new_size > lru.get_size():
-            lru.set_size(new_size)
+        hits, misses = lru.get_stats()
+        return LRUCacheStats(
+            entries=len(lru),
+            max_entries=lru.get_size(),
+            estimated_bytes=estimate_lru_bytes(lru),
+            max_bytes=self.max_bytes,
+            hits=hits,
+            misses=misses,
+            evictions=self._evictions,
+        )
+
+    def _prime_from_rows(self, rows: Iterable[tuple[int, str]]) -> None:
+        """Prime the LRU from rows ordered from the most to least recent.
+
+        Rows are only added until the LRU is full or its memory budget
+        is exhausted. The most recent rows are inserted last so they are
+        the last ones to be evicted.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        id_map = self._id_map
+        max_entries = id_map.get_size()
+        budget = self.max_bytes
+        primed: list[tuple[int, str]] = []
+        for row_id, data in rows:
+            if (budget := budget - estimate_entry_bytes(data, row_id)) < 0:
+                break
+            primed.append((row_id, data))
+            if len(primed) >= max_entries:
+                break
+        for row_id, data in reversed(primed):
+            id_map[data] = row_id
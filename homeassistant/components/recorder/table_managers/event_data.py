@@ -13,7 +13,7 @@ from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..db_schema import EventData
-from ..queries import get_shared_event_datas
+from ..queries import find_recent_shared_event_datas, get_shared_event_datas
 from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -23,6 +23,9 @@ if TYPE_CHECKING:
 
 CACHE_SIZE = 2048
 
+# The maximum estimated memory the cache may use
+CACHE_MAX_BYTES = 8 * 1024 * 1024
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -31,7 +34,7 @@ class EventDataManager(BaseLRUTableManager[EventData]):
 
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
-        super().__init__(recorder, CACHE_SIZE)
+        super().__init__(recorder, CACHE_SIZE, CACHE_MAX_BYTES)
 
     def serialize_from_event(self, event: Event) -> bytes | None:
         """Serialize event data."""
@@ -56,6 +59,21 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         }:
             self._load_from_hashes(hashes, session)
 
+    def prime_cache(self, session: Session) -> None:
+        """Prime the cache with the most recently added shared_datas in bulk.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        with session.no_autoflush:
+            self._prime_from_rows(
+                execute_stmt_lambda_element(
+                    session,
+                    find_recent_shared_event_datas(self._id_map.get_size()),
+                    orm_rows=False,
+                )
+            )
+
     def get(self, shared_data: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_datas to the data_id.
 
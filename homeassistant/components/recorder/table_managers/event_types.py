@@ -13,7 +13,7 @@ from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.event_type import EventType
 
 from ..db_schema import EventTypes
-from ..queries import find_event_type_ids
+from ..queries import find_event_type_ids, find_recent_event_type_ids
 from ..tasks import RefreshEventTypesTask
 from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
@@ -24,13 +24,16 @@ if TYPE_CHECKING:
 
 CACHE_SIZE = 2048
 
+# The maximum estimated memory the cache may use
+CACHE_MAX_BYTES = 2 * 1024 * 1024
+
 
 class EventTypeManager(BaseLRUTableManager[EventTypes]):
     """Manage the EventTypes table."""
 
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
-        super().__init__(recorder, CACHE_SIZE)
+        super().__init__(recorder, CACHE_SIZE, CACHE_MAX_BYTES)
         self._non_existent_event_types: LRU[EventType[Any] | str, None] = LRU(
             CACHE_SIZE
         )
@@ -47,6 +50,21 @@ class EventTypeManager(BaseLRUTableManager[EventTypes]):
             True,
         )
 
+    def prime_cache(self, session: Session) -> None:
+        """Prime the cache with the most recently added event_types in bulk.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        with session.no_autoflush:
+            self._prime_from_rows(
+                execute_stmt_lambda_element(
+                    session,
+                    find_recent_event_type_ids(self._id_map.get_size()),
+                    orm_rows=False,
+                )
+            )
+
     def get(
         self,
         event_type: EventType[Any] | str,
@@ -13,7 +13,7 @@ from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
+from ..queries import find_recent_shared_attributes, get_shared_attributes
 from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -28,6 +28,10 @@ if TYPE_CHECKING:
 # - How much memory our low end hardware has
 CACHE_SIZE = 2048
 
+# The maximum estimated memory the cache may use when it
+# grows with the number of entities
+CACHE_MAX_BYTES = 16 * 1024 * 1024
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -36,7 +40,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
 
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
-        super().__init__(recorder, CACHE_SIZE)
+        super().__init__(recorder, CACHE_SIZE, CACHE_MAX_BYTES)
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
@@ -67,6 +71,21 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         }:
             self._load_from_hashes(hashes, session)
 
+    def prime_cache(self, session: Session) -> None:
+        """Prime the cache with the most recently added shared_attrs in bulk.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        with session.no_autoflush:
+            self._prime_from_rows(
+                execute_stmt_lambda_element(
+                    session,
+                    find_recent_shared_attributes(self._id_map.get_size()),
+                    orm_rows=False,
+                )
+            )
+
     def get(self, shared_attr: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_attrs to the attributes_id.
 
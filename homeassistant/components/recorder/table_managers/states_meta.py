@@ -11,7 +11,11 @@ from homeassistant.core import Event, EventStateChangedData
 from homeassistant.util.collection import chunked_or_all
 
 from ..db_schema import StatesMeta
-from ..queries import find_all_states_metadata_ids, find_states_metadata_ids
+from ..queries import (
+    find_all_states_metadata_ids,
+    find_recent_states_metadata_ids,
+    find_states_metadata_ids,
+)
 from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -20,6 +24,10 @@ if TYPE_CHECKING:
 
 CACHE_SIZE = 8192
 
+# The maximum estimated memory the cache may use when it
+# grows with the number of entities
+CACHE_MAX_BYTES = 4 * 1024 * 1024
+
 
 class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
     """Manage the StatesMeta table."""
@@ -29,7 +37,7 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the states meta manager."""
         self._did_first_load = False
-        super().__init__(recorder, CACHE_SIZE)
+        super().__init__(recorder, CACHE_SIZE, CACHE_MAX_BYTES)
 
     def load(
         self, events: list[Event[EventStateChangedData]], session: Session
@@ -50,6 +58,21 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
             True,
         )
 
+    def prime_cache(self, session: Session) -> None:
+        """Prime the cache with the most recently added entity_ids in bulk.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        with session.no_autoflush:
+            self._prime_from_rows(
+                execute_stmt_lambda_element(
+                    session,
+                    find_recent_states_metadata_ids(self._id_map.get_size()),
+                    orm_rows=False,
+                )
+            )
+
     def get(self, entity_id: str, session: Session, from_recorder: bool) -> int | None:
         """Resolve entity_id to the metadata_id.
 
@@ -15,12 +15,17 @@ from sqlalchemy.sql.lambdas import StatementLambdaElement
 from ..db_schema import StatisticsMeta
 from ..models import StatisticMetaData
 from ..util import execute_stmt_lambda_element
+from . import LRUCacheStats, adjust_lru_size_to_budget, estimate_lru_bytes
 
 if TYPE_CHECKING:
     from ..core import Recorder
 
 CACHE_SIZE = 8192
 
+# The maximum estimated memory the cache may use when it
+# grows with the number of entities
+CACHE_MAX_BYTES = 8 * 1024 * 1024
+
 _LOGGER = logging.getLogger(__name__)
 
 QUERY_STATISTIC_META = (
@@ -66,10 +71,18 @@ class StatisticsMetaManager:
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the statistics meta manager."""
         self.recorder = recorder
+        self.max_bytes = CACHE_MAX_BYTES
+        self._evictions = 0
         self._stat_id_to_id_meta: LRU[str, tuple[int, StatisticMetaData]] = LRU(
-            CACHE_SIZE
+            CACHE_SIZE, self._on_evict
         )
 
+    def _on_evict(
+        self, statistic_id: str, id_meta: tuple[int, StatisticMetaData]
+    ) -> None:
+        """Count an item evicted from the LRU."""
+        self._evictions += 1
+
     def _clear_cache(self, statistic_ids: list[str]) -> None:
         """Clear the cache."""
         for statistic_id in statistic_ids:
@@ -186,8 +199,8 @@ class StatisticsMetaManager:
         )
         return statistic_id, metadata_id
 
-    def load(self, session: Session) -> None:
-        """Load the statistic_id to metadata_id mapping into memory.
+    def prime_cache(self, session: Session) -> None:
+        """Prime the cache with the statistic_id to metadata_id mapping in bulk.
 
         This call is not thread-safe and must be called from the
         recorder thread.
@@ -345,6 +358,21 @@ class StatisticsMetaManager:
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        lru: LRU = self._stat_id_to_id_meta
-        if new_size > lru.get_size():
-            lru.set_size(new_size)
+        adjust_lru_size_to_budget(self._stat_id_to_id_meta, new_size, self.max_bytes)
+
+    def cache_stats(self) -> LRUCacheStats:
+        """Return statistics about the LRU cache.
+
+        This call is thread-safe.
+        """
+        lru = self._stat_id_to_id_meta
+        hits, misses = lru.get_stats()
+        return LRUCacheStats(
+            entries=len(lru),
+            max_entries=lru.get_size(),
+            estimated_bytes=estimate_lru_bytes(lru),
+            max_bytes=self.max_bytes,
+            hits=hits,
+            misses=misses,
+            evictions=self._evictions,
+        )
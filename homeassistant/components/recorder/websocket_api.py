@@ -36,6 +36,7 @@ from homeassistant.util.unit_conversion import (
     VolumeFlowRateConverter,
 )
 
+from .export import EXPORT_TABLES, async_export, async_import
 from .models import StatisticPeriod
 from .statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
@@ -86,10 +87,12 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_adjust_sum_statistics)
     websocket_api.async_register_command(hass, ws_change_statistics_unit)
     websocket_api.async_register_command(hass, ws_clear_statistics)
+    websocket_api.async_register_command(hass, ws_export)
     websocket_api.async_register_command(hass, ws_get_statistic_during_period)
     websocket_api.async_register_command(hass, ws_get_statistics_during_period)
     websocket_api.async_register_command(hass, ws_get_statistics_metadata)
     websocket_api.async_register_command(hass, ws_list_statistic_ids)
+    websocket_api.async_register_command(hass, ws_import)
     websocket_api.async_register_command(hass, ws_import_statistics)
     websocket_api.async_register_command(hass, ws_update_statistics_issues)
     websocket_api.async_register_command(hass, ws_update_statistics_metadata)
@@ -140,7 +143,7 @@ async def ws_get_statistic_during_period(
     start_time, end_time = resolve_period(cast(StatisticPeriod, msg))
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_job(
             _ws_get_statistic_during_period,
             hass,
             msg["id"],
@@ -149,6 +152,7 @@ async def ws_get_statistic_during_period(
             msg["statistic_id"],
             msg.get("types"),
             msg.get("units"),
+            owner=connection,
         )
     )
 
@@ -208,7 +212,7 @@ async def ws_handle_get_statistics_during_period(
     if (types := msg.get("types")) is None:
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_job(
             _ws_get_statistics_during_period,
             hass,
             msg["id"],
@@ -218,6 +222,7 @@ async def ws_handle_get_statistics_during_period(
             msg.get("period"),
             msg.get("units"),
             types,
+            owner=connection,
         )
     )
 
@@ -263,11 +268,12 @@ async def ws_handle_list_statistic_ids(
 ) -> None:
     """Fetch a list of available statistic_id."""
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_job(
             _ws_get_list_statistic_ids,
             hass,
             msg["id"],
             msg.get("statistic_type"),
+            owner=connection,
         )
     )
 
@@ -537,3 +543,65 @@ def ws_import_statistics(
     else:
         async_add_external_statistics(hass, metadata, stats)
     connection.send_result(msg["id"])
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/export",
+        vol.Required("filename"): str,
+        vol.Required("entity_ids"): [str],
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("tables", default=list(EXPORT_TABLES)): [vol.In(EXPORT_TABLES)],
+    }
+)
+@websocket_api.async_response
+async def ws_export(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Export states and statistics to a file."""
+    start_time_str = msg["start_time"]
+    end_time_str = msg.get("end_time")
+
+    if start_time := dt_util.parse_datetime(start_time_str):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time_str:
+        if end_time := dt_util.parse_datetime(end_time_str):
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = None
+
+    counts = await async_export(
+        hass,
+        get_instance(hass),
+        hass.config.path(msg["filename"]),
+        start_time,
+        end_time,
+        msg["entity_ids"],
+        msg["tables"],
+    )
+    connection.send_result(msg["id"], {"rows": counts})
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/import",
+        vol.Required("filename"): str,
+    }
+)
+@websocket_api.async_response
+async def ws_import(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Import long-term statistics from an export file."""
+    imported = await async_import(hass, hass.config.path(msg["filename"]))
+    connection.send_result(msg["id"], {"imported": imported})
@@ -11,6 +11,7 @@ import voluptuous as vol
 from voluptuous.humanize import humanize_error
 
 from homeassistant.components.blueprint import (
+    CONF_USE_BLUEPRINT,
     BlueprintException,
     is_blueprint_instance_config,
 )
@@ -22,6 +23,7 @@ from homeassistant.const import (
     CONF_DESCRIPTION,
     CONF_ICON,
     CONF_NAME,
+    CONF_PATH,
     CONF_SELECTOR,
     CONF_SEQUENCE,
     CONF_VARIABLES,
@@ -40,6 +42,11 @@ from homeassistant.helpers.script import (
 )
 from homeassistant.helpers.selector import validate_selector
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.validated_config_cache import (
+    ValidatedConfigCache,
+    async_get_validated_config_cache,
+    config_key,
+)
 from homeassistant.util.yaml.input import UndefinedSubstitution
 
 from .const import (
@@ -272,16 +279,43 @@ class ScriptConfig(dict):
     validation_error: str | None = None
 
 
+async def _async_config_key(
+    hass: HomeAssistant, object_id: str, config: ConfigType
+) -> bytes | None:
+    """Return the key of a script in the validated config cache."""
+    if not is_blueprint_instance_config(config):
+        return config_key(object_id, config)
+    # The script also changes when the blueprint is edited
+    try:
+        blueprint = await async_get_blueprints(hass).async_get_blueprint(
+            config[CONF_USE_BLUEPRINT][CONF_PATH]
+        )
+    except (HomeAssistantError, KeyError, TypeError):
+        return None
+    return config_key(object_id, config, blueprint.data)
+
+
 async def _try_async_validate_config_item(
     hass: HomeAssistant,
     object_id: str,
     config: ConfigType,
+    cache: ValidatedConfigCache[ScriptConfig],
 ) -> ScriptConfig | None:
-    """Validate config item."""
+    """Validate config item, reusing the validated config if it did not change."""
+    key = await _async_config_key(hass, object_id, config)
+    if key is not None and (script_config := cache.async_get(key)) is not None:
+        return script_config
     try:
-        return await _async_validate_config_item(hass, object_id, config, False, True)
+        script_config = await _async_validate_config_item(
+            hass, object_id, config, False, True
+        )
     except (vol.Invalid, HomeAssistantError):
         return None
+    # Invalid scripts are validated again, the referenced devices and
+    # integrations may have been added since
+    if key is not None and script_config.validation_status is ValidationStatus.OK:
+        cache.async_set(key, script_config)
+    return script_config
 
 
 async def async_validate_config_item(
@@ -295,13 +329,17 @@ async def async_validate_config_item(
 
 async def async_validate_config(hass: HomeAssistant, config: ConfigType) -> ConfigType:
     """Validate config."""
+    cache: ValidatedConfigCache[ScriptConfig] = async_get_validated_config_cache(
+        hass, DOMAIN
+    )
+    cache.async_start_validation()
     scripts = {}
     for _, p_config in config_per_platform(config, DOMAIN):
         for object_id, cfg in p_config.items():
             if object_id in scripts:
                 LOGGER.warning("Duplicate script detected with name: '%s'", object_id)
                 continue
-            cfg = await _try_async_validate_config_item(hass, object_id, cfg)
+            cfg = await _try_async_validate_config_item(hass, object_id, cfg, cache)
             if cfg is not None:
                 scripts[object_id] = cfg
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 from typing import Final, cast
 
 from homeassistant.core import HomeAssistant, callback
@@ -62,9 +64,12 @@ def async_register_command(
         schema = handler._ws_schema  # type: ignore[attr-defined]  # noqa: SLF001
     else:
         command = command_or_handler
+    # Handlers wrapped by async_response finish in a task, so the
+    # connection leaves recording their latency to the task
+    is_async = asyncio.iscoroutinefunction(inspect.unwrap(handler))
     if (handlers := hass.data.get(DOMAIN)) is None:
         handlers = hass.data[DOMAIN] = {}
-    handlers[command] = (handler, schema)
+    handlers[command] = (handler, schema, is_async)
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from functools import lru_cache, partial
 import json
@@ -14,6 +15,13 @@ from homeassistant.auth.models import User
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.auth.permissions.events import SUBSCRIBE_ALLOWLIST
 from homeassistant.const import (
+    ATTR_AREA_ID,
+    ATTR_DEVICE_CLASS,
+    ATTR_DEVICE_ID,
+    ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
+    ATTR_FLOOR_ID,
+    ATTR_LABEL_ID,
     EVENT_STATE_CHANGED,
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
@@ -52,6 +60,7 @@ from homeassistant.helpers.json import (
     json_bytes,
     json_fragment,
 )
+from homeassistant.helpers.request_metrics import async_get_request_metrics
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import (
     IntegrationNotFound,
@@ -60,14 +69,24 @@ from homeassistant.loader import (
     async_get_integrations,
 )
 from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.util.blocking_telemetry import (
+    disable_blocking_call_telemetry,
+    enable_blocking_call_telemetry,
+    get_blocking_call_telemetry,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
+from .entity_index import ATTR_ENTITY_GLOB, ENTITY_SELECTORS, EntitySelectorIndex
 from .messages import construct_result_message
+from .snapshot import async_get_states_snapshot
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
+# Longest window a subscribe_entities client can ask changes to be coalesced for
+MAX_ENTITIES_BATCH_WINDOW_MS = 5000
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -77,7 +96,9 @@ def async_register_commands(
     async_reg: Callable[[HomeAssistant, const.WebSocketCommandHandler], None],
 ) -> None:
     """Register commands."""
+    async_reg(hass, handle_blocking_calls)
     async_reg(hass, handle_call_service)
+    async_reg(hass, handle_compression_stats)
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_execute_script)
     async_reg(hass, handle_fire_event)
@@ -86,8 +107,11 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_loop_time)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
+    async_reg(hass, handle_queue_stats)
+    async_reg(hass, handle_request_metrics)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
@@ -116,10 +140,11 @@ def _forward_events_check_permissions(
     # We have to lookup the permissions again because the user might have
     # changed since the subscription was created.
     permissions = user.permissions
+    entity_id = event.data["entity_id"]
     if (
         not user.is_admin
         and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
+        and not permissions.check_entity(entity_id, POLICY_READ)
     ):
         return
     send_message(messages.cached_event_message(message_id_as_bytes, event))
@@ -161,13 +186,15 @@ def handle_subscribe_events(
     if event_type == EVENT_STATE_CHANGED:
         forward_events = partial(
             _forward_events_check_permissions,
-            connection.send_message,
+            connection.send_event_message,
             connection.user,
             message_id_as_bytes,
         )
     else:
         forward_events = partial(
-            _forward_events_unconditional, connection.send_message, message_id_as_bytes
+            _forward_events_unconditional,
+            connection.send_event_message,
+            message_id_as_bytes,
         )
 
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
@@ -330,46 +357,39 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
-    states = _async_get_allowed_states(hass, connection)
-
-    try:
-        serialized_states = [state.as_dict_json for state in states]
-    except (ValueError, TypeError):
-        pass
-    else:
-        _send_handle_get_states_response(connection, msg["id"], serialized_states)
-        return
-
-    # If we can't serialize, we'll filter out unserializable states
-    serialized_states = []
-    for state in states:
-        try:
-            serialized_states.append(state.as_dict_json)
-        except (ValueError, TypeError):
-            connection.logger.error(
-                "Unable to serialize to JSON. Bad data found at %s",
-                format_unserializable_data(
-                    find_paths_unserializable_data(state, dump=JSON_DUMP)
-                ),
-            )
-
-    _send_handle_get_states_response(connection, msg["id"], serialized_states)
-
-
-def _send_handle_get_states_response(
-    connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
-) -> None:
-    """Send handle get states response."""
+    # The serialized states are shared by all connections until the
+    # next state change
     connection.send_message(
         construct_result_message(
-            msg_id, b"".join((b"[", b",".join(serialized_states), b"]"))
+            msg["id"], async_get_states_snapshot(hass).states.async_get(connection.user)
         )
     )
 
 
+def _entity_change_allowed(
+    entity_ids: set[str] | None,
+    entity_filter: Callable[[str], bool] | None,
+    user: User,
+    entity_id: str,
+) -> bool:
+    """Return if a change to an entity should be forwarded to the websocket."""
+    if (entity_ids and entity_id not in entity_ids) or (
+        entity_filter and not entity_filter(entity_id)
+    ):
+        return False
+    # We have to lookup the permissions again because the user might have
+    # changed since the subscription was created.
+    permissions = user.permissions
+    return (
+        user.is_admin
+        or permissions.access_all_entities(POLICY_READ)
+        or permissions.check_entity(entity_id, POLICY_READ)
+    )
+
+
 @callback
 def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
+    connection: ActiveConnection,
     entity_ids: set[str] | None,
     entity_filter: Callable[[str], bool] | None,
     user: User,
@@ -378,20 +398,144 @@ def _forward_entity_changes(
 ) -> None:
     """Forward entity state changed events to websocket."""
     entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
+    if not _entity_change_allowed(entity_ids, entity_filter, user, entity_id):
         return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
+    if not connection.events_lagging:
+        connection.send_event_message(
+            messages.cached_state_diff_message(message_id_as_bytes, event)
+        )
+        return
+    # Diffs depend on the previous state sent to the client. Send the
+    # full state while lagging so intermediate updates can be dropped.
+    connection.send_event_message(
+        messages.cached_state_full_message(message_id_as_bytes, event),
+        (message_id_as_bytes, entity_id),
+    )
+
+
+class _EntityChangesBatcher:
+    """Coalesce entity state changes and send them as one message per window.
+
+    Only the state the client last saw and the newest state are kept
+    for each entity, so an entity that changes many times within the
+    window results in a single diff.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_message_id_as_bytes",
+        "_pending",
+        "_send_message",
+        "_timer",
+        "_window",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        message_id_as_bytes: bytes,
+        window: float,
+    ) -> None:
+        """Initialize the batcher."""
+        self._hass = hass
+        self._send_message = send_message
+        self._message_id_as_bytes = message_id_as_bytes
+        self._window = window
+        self._pending: dict[str, tuple[State | None, State | None]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_add(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state changed event to the batch."""
+        data = event.data
+        self.async_add_change(data["entity_id"], data["old_state"], data["new_state"])
+
+    @callback
+    def async_add_change(
+        self, entity_id: str, old_state: State | None, new_state: State | None
+    ) -> None:
+        """Add a change of an entity to the batch."""
+        if (pending := self._pending.get(entity_id)) is not None:
+            self._pending[entity_id] = (pending[0], new_state)
+            return
+        self._pending[entity_id] = (old_state, new_state)
+        if self._timer is None:
+            self._timer = self._hass.loop.call_later(self._window, self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the pending changes."""
+        self._timer = None
+        pending = self._pending
+        self._pending = {}
+        if message := messages.batched_state_diff_message(
+            self._message_id_as_bytes,
+            [
+                (entity_id, old_state, new_state)
+                for entity_id, (old_state, new_state) in pending.items()
+            ],
+        ):
+            self._send_message(message)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the batcher and drop any pending changes."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending.clear()
+
+
+@callback
+def _batch_entity_changes(
+    batcher: _EntityChangesBatcher,
+    entity_ids: set[str] | None,
+    entity_filter: Callable[[str], bool] | None,
+    user: User,
+    event: Event[EventStateChangedData],
+) -> None:
+    """Add entity state changed events to the batch for the websocket."""
+    if _entity_change_allowed(entity_ids, entity_filter, user, event.data["entity_id"]):
+        batcher.async_add(event)
+
+
+@callback
+def _send_entity_change(
+    connection: ActiveConnection,
+    message_id_as_bytes: bytes,
+    entity_id: str,
+    old_state: State | None,
+    new_state: State | None,
+) -> None:
+    """Send a single entity change to the websocket."""
+    if message := messages.batched_state_diff_message(
+        message_id_as_bytes, [(entity_id, old_state, new_state)]
+    ):
+        connection.send_event_message(message)
+
+
+@callback
+def _entity_selection_changed(
+    hass: HomeAssistant,
+    on_change: Callable[[str, State | None, State | None], None],
+    entity_filter: Callable[[str], bool] | None,
+    user: User,
+    entity_id: str,
+    added: bool,
+) -> None:
+    """Add or remove an entity that started or stopped matching the selector."""
+    if (state := hass.states.get(entity_id)) is None or not _entity_change_allowed(
+        None, entity_filter, user, entity_id
     ):
         return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    if added:
+        on_change(entity_id, None, state)
+    else:
+        on_change(entity_id, state, None)
+
+
+_ENTITY_SELECTOR_LIST = vol.All(cv.ensure_list, [cv.string])
 
 
 @callback
@@ -399,6 +543,16 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("batch_window_ms"): vol.All(
+            int, vol.Range(min=0, max=MAX_ENTITIES_BATCH_WINDOW_MS)
+        ),
+        vol.Optional(ATTR_AREA_ID): _ENTITY_SELECTOR_LIST,
+        vol.Optional(ATTR_DEVICE_ID): _ENTITY_SELECTOR_LIST,
+        vol.Optional(ATTR_FLOOR_ID): _ENTITY_SELECTOR_LIST,
+        vol.Optional(ATTR_LABEL_ID): _ENTITY_SELECTOR_LIST,
+        vol.Optional(ATTR_DOMAIN): _ENTITY_SELECTOR_LIST,
+        vol.Optional(ATTR_DEVICE_CLASS): _ENTITY_SELECTOR_LIST,
+        vol.Optional(ATTR_ENTITY_GLOB): _ENTITY_SELECTOR_LIST,
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -409,44 +563,101 @@ def handle_subscribe_entities(
     entity_ids = set(msg.get("entity_ids", [])) or None
     _filter = convert_include_exclude_filter(msg)
     entity_filter = None if _filter.empty_filter else _filter.get_filter()
+    msg_id = msg["id"]
+    message_id_as_bytes = str(msg_id).encode()
+    user = connection.user
+    # Area, floor, label, device, domain, device class and glob selectors
+    # are resolved into an index so only state changes of the matching
+    # entities reach this subscription
+    if selector := {key: msg[key] for key in ENTITY_SELECTORS if key in msg}:
+        if entity_ids:
+            selector[ATTR_ENTITY_ID] = list(entity_ids)
+        entity_ids = None
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
-    msg_id = msg["id"]
-    message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
+    snapshot: bytes | None = None
+    states: list[State] = []
+    if entity_ids or entity_filter or selector:
+        states = _async_get_allowed_states(hass, connection)
+    else:
+        # Fast path when not filtering, the serialized states are shared
+        # by all connections until the next state change
+        snapshot = async_get_states_snapshot(hass).compressed_states.async_get(user)
+    batcher: _EntityChangesBatcher | None = None
+    forward_entity_changes: Callable[[Event[EventStateChangedData]], None]
+    on_change: Callable[[str, State | None, State | None], None]
+    if batch_window_ms := msg.get("batch_window_ms"):
+        batcher = _EntityChangesBatcher(
+            hass,
+            connection.send_event_message,
+            message_id_as_bytes,
+            batch_window_ms / 1000,
+        )
+        forward_entity_changes = partial(
+            _batch_entity_changes, batcher, entity_ids, entity_filter, user
+        )
+        on_change = batcher.async_add_change
+    else:
+        forward_entity_changes = partial(
             _forward_entity_changes,
-            connection.send_message,
+            connection,
             entity_ids,
             entity_filter,
-            connection.user,
+            user,
             message_id_as_bytes,
-        ),
-    )
+        )
+        on_change = partial(_send_entity_change, connection, message_id_as_bytes)
+
+    unsub: Callable[[], None]
+    if selector:
+        index = EntitySelectorIndex(
+            hass,
+            selector,
+            forward_entity_changes,
+            partial(_entity_selection_changed, hass, on_change, entity_filter, user),
+        )
+        index.async_setup()
+        selected = index.entity_ids
+        states = [state for state in states if state.entity_id in selected]
+        unsub = index.async_remove
+    else:
+        unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, forward_entity_changes)
+
+    if batcher is None:
+        connection.subscriptions[msg_id] = unsub
+    else:
+        cancel_batcher = batcher.async_cancel
+
+        @callback
+        def _async_unsubscribe() -> None:
+            unsub()
+            cancel_batcher()
+
+        connection.subscriptions[msg_id] = _async_unsubscribe
     connection.send_result(msg_id)
 
+    if snapshot is not None:
+        _send_handle_entities_init_response(connection, message_id_as_bytes, snapshot)
+        return
+
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
     try:
-        if entity_ids or entity_filter:
-            serialized_states = [
-                state.as_compressed_state_json
-                for state in states
-                if (not entity_ids or state.entity_id in entity_ids)
-                and (not entity_filter or entity_filter(state.entity_id))
-            ]
-        else:
-            # Fast path when not filtering
-            serialized_states = [state.as_compressed_state_json for state in states]
+        serialized_states = [
+            state.as_compressed_state_json
+            for state in states
+            if (not entity_ids or state.entity_id in entity_ids)
+            and (not entity_filter or entity_filter(state.entity_id))
+        ]
     except (ValueError, TypeError):
         pass
     else:
         _send_handle_entities_init_response(
-            connection, message_id_as_bytes, serialized_states
+            connection,
+            message_id_as_bytes,
+            b"".join((b"{", b",".join(serialized_states), b"}")),
         )
         return
 
@@ -463,24 +674,30 @@ def handle_subscribe_entities(
             )
 
     _send_handle_entities_init_response(
-        connection, message_id_as_bytes, serialized_states
+        connection,
+        message_id_as_bytes,
+        b"".join((b"{", b",".join(serialized_states), b"}")),
     )
 
 
 def _send_handle_entities_init_response(
     connection: ActiveConnection,
     message_id_as_bytes: bytes,
-    serialized_states: list[bytes],
+    serialized_states: bytes,
 ) -> None:
-    """Send handle entities init response."""
-    connection.send_message(
+    """Send handle entities init response.
+
+    serialized_states is the JSON object of the compressed states.
+    """
+    # Queued on the event lane so it is sent before the state changes
+    connection.send_event_message(
         b"".join(
             (
                 b'{"id":',
                 message_id_as_bytes,
-                b',"type":"event","event":{"a":{',
-                b",".join(serialized_states),
-                b"}}}",
+                b',"type":"event","event":{"a":',
+                serialized_states,
+                b"}}",
             )
         )
     )
@@ -915,6 +1132,99 @@ def handle_supported_features(
     connection.send_result(msg["id"])
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "compression_stats"})
+def handle_compression_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle compression stats command."""
+    stats = connection.compression_stats
+    connection.send_result(
+        msg["id"],
+        {
+            "enabled": stats is not None,
+            **(stats.as_dict() if stats is not None else {}),
+        },
+    )
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "queue_stats"})
+def handle_queue_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle queue stats command."""
+    connection.send_result(
+        msg["id"],
+        {
+            name: {"pending": len(lane), **lane.stats.as_dict()}
+            for name, lane in connection.message_lanes.items()
+        },
+    )
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "request_metrics"})
+def handle_request_metrics(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle request metrics command."""
+    connection.send_result(msg["id"], async_get_request_metrics(hass).as_dict())
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command(
+    {vol.Required("type"): "loop_time", vol.Optional("enabled"): bool}
+)
+def handle_loop_time(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle loop time command.
+
+    Optionally enables or disables tracking before returning the event
+    loop time per integration.
+    """
+    if "enabled" in msg:
+        hass.async_set_loop_time_tracking(msg["enabled"])
+    loop_time = hass.loop_time
+    connection.send_result(
+        msg["id"],
+        {
+            "enabled": loop_time is not None,
+            "domains": loop_time.as_dict() if loop_time is not None else {},
+        },
+    )
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command(
+    {vol.Required("type"): "blocking_calls", vol.Optional("enabled"): bool}
+)
+def handle_blocking_calls(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle blocking calls command.
+
+    Optionally enables or disables the telemetry before returning the
+    blocking calls done in the event loop.
+    """
+    if msg.get("enabled"):
+        enable_blocking_call_telemetry(hass.loop)
+    elif "enabled" in msg:
+        disable_blocking_call_telemetry()
+    telemetry = get_blocking_call_telemetry()
+    connection.send_result(
+        msg["id"],
+        {
+            "enabled": telemetry is not None,
+            **(telemetry.as_dict() if telemetry is not None else {}),
+        },
+    )
+
+
 @decorators.require_admin
 @decorators.websocket_command({"type": "integration/descriptions"})
 @decorators.async_response
@@ -0,0 +1,57 @@
+"""Statistics for permessage-deflate compressed websocket connections."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+
+from aiohttp import WSMsgType, web
+
+
+@dataclass(slots=True)
+class CompressionStats:
+    """Compression statistics for a websocket connection."""
+
+    frames: int = 0
+    bytes_in: int = 0
+    compression_time: float = 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        """Return the statistics as a dict."""
+        return {
+            "frames": self.frames,
+            "bytes_in": self.bytes_in,
+            "compression_time": self.compression_time,
+        }
+
+
+class WebSocketCompression:
+    """Send text frames over a connection that negotiated permessage-deflate.
+
+    aiohttp compresses every data frame with the negotiated compressor,
+    which keeps its context between frames and compresses large frames
+    in the executor. The frames are counted as they are handed to
+    aiohttp, so the statistics only cover the uncompressed side.
+
+    aiohttp does not offer a way to send a single frame uncompressed once
+    compression is negotiated, and a frame compressed with its own
+    compressor through the compress argument of send_frame would leave
+    the decompressor of the client out of step with the negotiated
+    compressor, so every frame is sent with the default.
+    """
+
+    __slots__ = ("_wsock", "stats")
+
+    def __init__(self, wsock: web.WebSocketResponse) -> None:
+        """Initialize compression for the negotiated response."""
+        self._wsock = wsock
+        self.stats = CompressionStats()
+
+    async def send_text(self, message: bytes) -> None:
+        """Send a text frame and count it."""
+        stats = self.stats
+        start = time.perf_counter()
+        await self._wsock.send_frame(message, WSMsgType.TEXT)
+        stats.compression_time += time.perf_counter() - start
+        stats.frames += 1
+        stats.bytes_in += len(message)
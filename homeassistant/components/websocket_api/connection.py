@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from collections.abc import Callable, Hashable
 from contextvars import ContextVar
-from typing import TYPE_CHECKING, Any, Literal
+import time
+from typing import TYPE_CHECKING, Any, Literal, Protocol
 
 from aiohttp import web
 import voluptuous as vol
@@ -13,6 +14,10 @@ from homeassistant.auth.models import RefreshToken, User
 from homeassistant.core import Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
 from homeassistant.helpers.http import current_request
+from homeassistant.helpers.request_metrics import (
+    KIND_WEBSOCKET,
+    async_get_request_metrics,
+)
 from homeassistant.util.json import JsonValueType
 
 from . import const, messages
@@ -25,7 +30,9 @@ from .messages import (
 from .util import describe_request
 
 if TYPE_CHECKING:
+    from .compression import CompressionStats
     from .http import WebSocketAdapter
+    from .lanes import MessageLane
 
 
 current_connection = ContextVar["ActiveConnection | None"](
@@ -36,6 +43,19 @@ type MessageHandler = Callable[[HomeAssistant, ActiveConnection, dict[str, Any]]
 type BinaryHandler = Callable[[HomeAssistant, ActiveConnection, bytes], None]
 
 
+class SendMessage(Protocol):
+    """Queue a message on an outbound lane of a connection."""
+
+    def __call__(
+        self,
+        message: bytes | str | dict[str, Any],
+        lane: int = ...,
+        coalesce_key: Hashable | None = ...,
+        /,
+    ) -> None:
+        """Queue the message."""
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
@@ -51,13 +71,17 @@ class ActiveConnection:
         "supported_features",
         "handlers",
         "binary_handlers",
+        "compression_stats",
+        "message_lanes",
+        "events_lagging",
+        "request_metrics",
     )
 
     def __init__(
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[bytes | str | dict[str, Any]], None],
+        send_message: SendMessage,
         user: User,
         refresh_token: RefreshToken,
     ) -> None:
@@ -71,10 +95,15 @@ class ActiveConnection:
         self.last_id = 0
         self.can_coalesce = False
         self.supported_features: dict[str, float] = {}
-        self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
-            self.hass.data[const.DOMAIN]
-        )
+        self.handlers: dict[
+            str, tuple[MessageHandler, vol.Schema | Literal[False], bool]
+        ] = self.hass.data[const.DOMAIN]
         self.binary_handlers: list[BinaryHandler | None] = []
+        self.compression_stats: CompressionStats | None = None
+        self.message_lanes: dict[str, MessageLane] = {}
+        # Set while the client is not keeping up with the event lane
+        self.events_lagging = False
+        self.request_metrics = async_get_request_metrics(hass)
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -139,6 +168,25 @@ class ActiveConnection:
         """Send a event message."""
         self.send_message(message_to_json_bytes(event_message(msg_id, event)))
 
+    @callback
+    def send_event_message(
+        self,
+        message: bytes | str | dict[str, Any],
+        coalesce_key: Hashable | None = None,
+    ) -> None:
+        """Send a subscription event message on the event lane.
+
+        If the client is lagging, a queued message with the same coalesce
+        key is dropped in favour of this one. Only pass a key when the
+        message does not depend on earlier messages with the same key.
+        """
+        self.send_message(message, const.LANE_EVENT, coalesce_key)
+
+    @callback
+    def send_bulk_message(self, message: bytes | str | dict[str, Any]) -> None:
+        """Send a large stream message on the bulk lane."""
+        self.send_message(message, const.LANE_BULK)
+
     @callback
     def send_error(
         self,
@@ -184,8 +232,12 @@ class ActiveConnection:
             self.binary_handlers[index] = None
 
     @callback
-    def async_handle(self, msg: JsonValueType) -> None:
-        """Handle a single incoming message."""
+    def async_handle(self, msg: JsonValueType, size: int | None = None) -> None:
+        """Handle a single incoming message.
+
+        size is the size of the received message, if it was not sent
+        together with other messages.
+        """
         if (
             # Not using isinstance as we don't care about children
             # as these are always coming from JSON
@@ -226,7 +278,11 @@ class ActiveConnection:
             )
             return
 
-        handler, schema = handler_schema
+        handler, schema, is_async = handler_schema
+        metrics = self.request_metrics.async_get(KIND_WEBSOCKET, type_)
+        if size is not None:
+            metrics.sizes.observe(size)
+        start = time.perf_counter()
 
         try:
             if schema is False:
@@ -238,6 +294,9 @@ class ActiveConnection:
         except Exception as err:  # noqa: BLE001
             self.async_handle_exception(msg, err)
 
+        # Async handlers record their latency once they are done
+        if not is_async:
+            metrics.latency.observe(time.perf_counter() - start)
         self.last_id = cur_id
 
     @callback
@@ -258,7 +317,7 @@ class ActiveConnection:
 
     @callback
     def _connect_closed_error(
-        self, msg: bytes | str | dict[str, Any] | Callable[[], str]
+        self, msg: bytes | str | dict[str, Any] | Callable[[], str], *args: Any
     ) -> None:
         """Send a message when the connection is closed."""
         self.logger.debug("Tried to send message %s on closed connection", msg)
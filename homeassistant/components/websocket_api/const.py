@@ -34,6 +34,14 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Outbound message lanes, in priority order. Results of commands,
+# events of subscriptions and large streams such as history and
+# logbook are queued separately.
+LANE_RESULT: Final = 0
+LANE_EVENT: Final = 1
+LANE_BULK: Final = 2
+LANE_NAMES: Final = ("result", "event", "bulk")
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
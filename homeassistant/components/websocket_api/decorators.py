@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from functools import wraps
+import time
 from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
@@ -11,6 +12,7 @@ import voluptuous as vol
 from homeassistant.const import HASSIO_USER_NAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import Unauthorized
+from homeassistant.helpers.request_metrics import KIND_WEBSOCKET
 from homeassistant.helpers.typing import VolDictType
 
 from . import const, messages
@@ -24,10 +26,16 @@ async def _handle_async_response(
     msg: dict[str, Any],
 ) -> None:
     """Create a response and handle exception."""
+    metrics = connection.request_metrics.async_get(KIND_WEBSOCKET, msg["type"])
+    metrics.in_flight += 1
+    start = time.perf_counter()
     try:
         await func(hass, connection, msg)
     except Exception as err:  # noqa: BLE001
         connection.async_handle_exception(msg, err)
+    finally:
+        metrics.latency.observe(time.perf_counter() - start)
+        metrics.in_flight -= 1
 
 
 def async_response(
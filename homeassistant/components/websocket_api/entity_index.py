@@ -0,0 +1,265 @@
+"""Index of the entities matched by an entity subscription selector."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import fnmatch
+from functools import partial
+import re
+from typing import Any, Final
+
+from homeassistant.const import (
+    ATTR_AREA_ID,
+    ATTR_DEVICE_CLASS,
+    ATTR_DEVICE_ID,
+    ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
+    ATTR_FLOOR_ID,
+    ATTR_LABEL_ID,
+    MATCH_ALL,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HassJobType,
+    HomeAssistant,
+    ServiceCall,
+    callback,
+    split_entity_id,
+)
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+    floor_registry as fr,
+    label_registry as lr,
+)
+from homeassistant.helpers.event import (
+    async_track_state_added_domain,
+    async_track_state_change_event,
+)
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+from .const import DOMAIN
+
+ATTR_ENTITY_GLOB: Final = "entity_glob"
+
+# Selectors resolved against the registries, matching entities are combined
+TARGET_SELECTORS: Final = (ATTR_AREA_ID, ATTR_DEVICE_ID, ATTR_FLOOR_ID, ATTR_LABEL_ID)
+# Selectors that restrict the matching entities
+RESTRICTION_SELECTORS: Final = (ATTR_DOMAIN, ATTR_DEVICE_CLASS, ATTR_ENTITY_GLOB)
+ENTITY_SELECTORS: Final = TARGET_SELECTORS + RESTRICTION_SELECTORS
+
+
+class EntitySelectorIndex:
+    """Keep the set of entities matching a selector up to date.
+
+    Area, floor, label and device selectors are resolved against the
+    registries the same way as service call targets, together with any
+    explicit entity ids. Domain, device class and entity glob selectors
+    restrict the result, or all entities when there is no target.
+
+    A state change listener is registered for each matching entity, so
+    a state change costs one dict lookup regardless of the number of
+    subscriptions. The index is updated when the registries change, and
+    when a new entity is added if there are only restrictions.
+    """
+
+    __slots__ = (
+        "_action",
+        "_device_classes",
+        "_domains",
+        "_entity_listeners",
+        "_glob",
+        "_hass",
+        "_on_change",
+        "_target",
+        "_unsubs",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        selector: dict[str, Any],
+        action: Callable[[Event[EventStateChangedData]], None],
+        on_change: Callable[[str, bool], None],
+    ) -> None:
+        """Initialize the index.
+
+        action is called for state changes of the matching entities and
+        on_change when an entity starts or stops matching the selector.
+        """
+        self._hass = hass
+        self._action = action
+        self._on_change = on_change
+        self._target = {
+            key: selector[key]
+            for key in (*TARGET_SELECTORS, ATTR_ENTITY_ID)
+            if selector.get(key)
+        }
+        self._domains: set[str] = set(selector.get(ATTR_DOMAIN, ()))
+        self._device_classes: set[str] = set(selector.get(ATTR_DEVICE_CLASS, ()))
+        self._glob: re.Pattern[str] | None = None
+        if globs := selector.get(ATTR_ENTITY_GLOB):
+            self._glob = re.compile(
+                "|".join(fnmatch.translate(glob) for glob in set(globs))
+            )
+        self._entity_listeners: dict[str, CALLBACK_TYPE] = {}
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @property
+    def entity_ids(self) -> set[str]:
+        """Return the matching entity ids."""
+        return set(self._entity_listeners)
+
+    @callback
+    def async_setup(self) -> None:
+        """Resolve the selector and listen for changes."""
+        hass = self._hass
+        bus = hass.bus
+        target = self._target
+        self._async_update(self._async_resolve(), notify=False)
+        if target:
+            self._unsubs.append(
+                bus.async_listen(
+                    er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_registry_updated
+                )
+            )
+            for key, event_type in (
+                (ATTR_AREA_ID, ar.EVENT_AREA_REGISTRY_UPDATED),
+                (ATTR_FLOOR_ID, fr.EVENT_FLOOR_REGISTRY_UPDATED),
+                (ATTR_LABEL_ID, lr.EVENT_LABEL_REGISTRY_UPDATED),
+            ):
+                if key in target:
+                    self._unsubs.append(
+                        bus.async_listen(event_type, self._async_registry_updated)
+                    )
+            if target.keys() - {ATTR_ENTITY_ID}:
+                self._unsubs.append(
+                    bus.async_listen(
+                        dr.EVENT_DEVICE_REGISTRY_UPDATED,
+                        self._async_registry_updated,
+                    )
+                )
+            return
+        self._unsubs.append(
+            async_track_state_added_domain(
+                hass, self._domains or MATCH_ALL, self._async_state_added
+            )
+        )
+        if self._device_classes:
+            self._unsubs.append(
+                bus.async_listen(
+                    er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_updated
+                )
+            )
+
+    @callback
+    def async_remove(self) -> None:
+        """Stop listening for changes."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+        for unsub in self._entity_listeners.values():
+            unsub()
+        self._entity_listeners.clear()
+
+    @callback
+    def _async_resolve(self) -> set[str]:
+        """Return the entity ids matching the selector."""
+        if self._target:
+            selected = async_extract_referenced_entity_ids(
+                self._hass,
+                ServiceCall(self._hass, DOMAIN, "subscribe_entities", self._target),
+                expand_group=False,
+            )
+            candidates = selected.referenced | selected.indirectly_referenced
+        elif self._domains:
+            candidates = set(self._hass.states.async_entity_ids(self._domains))
+        else:
+            candidates = set(self._hass.states.async_entity_ids())
+        return {
+            entity_id for entity_id in candidates if self._async_restricted(entity_id)
+        }
+
+    @callback
+    def _async_restricted(self, entity_id: str) -> bool:
+        """Return if an entity passes the restrictions of the selector."""
+        if self._domains and split_entity_id(entity_id)[0] not in self._domains:
+            return False
+        if self._glob and not self._glob.match(entity_id):
+            return False
+        if not self._device_classes:
+            return True
+        if entry := er.async_get(self._hass).async_get(entity_id):
+            device_class = entry.device_class or entry.original_device_class
+        elif state := self._hass.states.get(entity_id):
+            device_class = state.attributes.get(ATTR_DEVICE_CLASS)
+        else:
+            return False
+        return device_class in self._device_classes
+
+    @callback
+    def _async_update(self, entity_ids: set[str], notify: bool = True) -> None:
+        """Update the state change listeners to the matching entity ids."""
+        listeners = self._entity_listeners
+        for entity_id in listeners.keys() - entity_ids:
+            listeners.pop(entity_id)()
+            if notify:
+                self._on_change(entity_id, False)
+        for entity_id in entity_ids - listeners.keys():
+            listeners[entity_id] = async_track_state_change_event(
+                self._hass, entity_id, self._action, HassJobType.Callback
+            )
+            if notify:
+                self._on_change(entity_id, True)
+
+    @callback
+    def _async_registry_updated(self, event: Event[Any]) -> None:
+        """Resolve the selector again when a registry changes."""
+        self._async_update(self._async_resolve())
+
+    @callback
+    def _async_state_added(self, event: Event[EventStateChangedData]) -> None:
+        """Add a new entity if it matches the selector."""
+        entity_id = event.data["entity_id"]
+        if entity_id in self._entity_listeners:
+            return
+        if self._async_restricted(entity_id):
+            # The new listener may or may not see the event that added
+            # the entity, depending on the order of the bus listeners
+            self._entity_listeners[entity_id] = async_track_state_change_event(
+                self._hass,
+                entity_id,
+                partial(self._async_forward_after, event),
+                HassJobType.Callback,
+            )
+            self._action(event)
+
+    @callback
+    def _async_forward_after(
+        self,
+        added_event: Event[EventStateChangedData],
+        event: Event[EventStateChangedData],
+    ) -> None:
+        """Forward state changes except the one that added the entity."""
+        if event is not added_event:
+            self._action(event)
+
+    @callback
+    def _async_entity_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Check if an entity matches the device class selector again."""
+        data = event.data
+        entity_ids = {data["entity_id"]}
+        if data["action"] == "update" and "old_entity_id" in data:
+            entity_ids.add(data["old_entity_id"])
+        matching = set(self._entity_listeners)
+        for entity_id in entity_ids:
+            if self._hass.states.get(entity_id) and self._async_restricted(entity_id):
+                matching.add(entity_id)
+            else:
+                matching.discard(entity_id)
+        self._async_update(matching)
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-from collections import deque
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Hashable
 import datetime as dt
 from functools import partial
+from heapq import merge
 import logging
 from typing import TYPE_CHECKING, Any, Final
 
@@ -22,8 +22,13 @@ from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
+from .compression import WebSocketCompression
 from .const import (
     DATA_CONNECTIONS,
+    LANE_BULK,
+    LANE_EVENT,
+    LANE_NAMES,
+    LANE_RESULT,
     MAX_PENDING_MSG,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
@@ -33,6 +38,7 @@ from .const import (
     URL,
 )
 from .error import Disconnect
+from .lanes import MessageLane
 from .messages import message_to_json_bytes
 from .util import describe_request
 
@@ -81,7 +87,8 @@ class WebSocketHandler:
         "_logger",
         "_peak_checker_unsub",
         "_connection",
-        "_message_queue",
+        "_lanes",
+        "_sequence",
         "_ready_future",
         "_release_ready_queue_size",
     )
@@ -102,10 +109,17 @@ class WebSocketHandler:
 
         # The WebSocketHandler has a single consumer and path
         # to where messages are queued. This allows the implementation
-        # to use a deque and an asyncio.Future to avoid the overhead of
-        # an asyncio.Queue.
-        self._message_queue: deque[bytes] = deque()
-        self._ready_future: asyncio.Future[int] | None = None
+        # to use a deque per lane and an asyncio.Future to avoid the
+        # overhead of an asyncio.Queue.
+        #
+        # Command results, subscription events and bulk streams are
+        # queued in separate lanes so results are not stuck behind
+        # a large stream and superseded entity updates can be dropped
+        # for a lagging client. Results and events are still written
+        # in the order they were queued.
+        self._lanes: tuple[MessageLane, ...] = tuple(MessageLane() for _ in LANE_NAMES)
+        self._sequence = 0
+        self._ready_future: asyncio.Future[None] | None = None
         self._release_ready_queue_size: int = 0
 
     def __repr__(self) -> str:
@@ -131,22 +145,28 @@ class WebSocketHandler:
         connection: ActiveConnection,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> None:
-        """Write outgoing messages."""
+        """Write outgoing messages.
+
+        Results and events are written in the order they were queued,
+        and together in one frame when the client supports coalescing.
+        Bulk messages wait for pending results, and alternate with events
+        so a busy subscription does not starve a stream.
+        """
         # Variables are set locally to avoid lookups in the loop
-        message_queue = self._message_queue
+        results, events, bulk = self._lanes
         logger = self._logger
         wsock = self._wsock
         loop = self._loop
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
         can_coalesce = connection.can_coalesce
-        ready_message_count = len(message_queue)
+        prefer_bulk = False
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
             while not wsock.closed:
-                if not message_queue:
+                if not (results.queue or events.queue or bulk.queue):
                     self._ready_future = loop.create_future()
-                    ready_message_count = await self._ready_future
+                    await self._ready_future
 
                 if self._closing:
                     return
@@ -155,15 +175,52 @@ class WebSocketHandler:
                     # coalesce may be enabled later in the connection
                     can_coalesce = connection.can_coalesce
 
-                if not can_coalesce or ready_message_count == 1:
-                    message = message_queue.popleft()
+                if (
+                    bulk.queue
+                    and not results.queue
+                    and (prefer_bulk or not events.queue)
+                ):
+                    # Bulk messages are large, so they are never coalesced
+                    prefer_bulk = False
+                    message = bulk.popleft()
+                    if is_debug_log_enabled():
+                        debug("%s: Sending %s", self.description, message)
+                    await send_bytes_text(message)
+                    continue
+
+                if not can_coalesce:
+                    if results.queue and (
+                        not events.queue
+                        or results.next_sequence() < events.next_sequence()
+                    ):
+                        message = results.popleft()
+                    else:
+                        message = events.popleft()
+                        prefer_bulk = True
+                        if not events.queue:
+                            # The client caught up with the event lane
+                            connection.events_lagging = False
+                    if is_debug_log_enabled():
+                        debug("%s: Sending %s", self.description, message)
+                    await send_bytes_text(message)
+                    continue
+
+                pending = results.pop_all()
+                if events.queue:
+                    pending = list(merge(pending, events.pop_all()))
+                    prefer_bulk = True
+                    # The client caught up with the event lane
+                    connection.events_lagging = False
+                pending_messages = [message for _, message in pending]
+
+                if len(pending_messages) == 1:
+                    message = pending_messages[0]
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
                     continue
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
+                coalesced_messages = b"".join((b"[", b",".join(pending_messages), b"]"))
                 if is_debug_log_enabled():
                     debug("%s: Sending %s", self.description, coalesced_messages)
                 await send_bytes_text(coalesced_messages)
@@ -185,10 +242,17 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | bytes | dict[str, Any]) -> None:
+    def _send_message(
+        self,
+        message: str | bytes | dict[str, Any],
+        lane: int = LANE_RESULT,
+        coalesce_key: Hashable | None = None,
+    ) -> None:
         """Queue sending a message to the client.
 
-        Closes connection if the client is not reading the messages.
+        Closes connection if the client is not reading the messages, except
+        on the event lane where messages with a coalesce key replace older
+        queued messages with the same key once the client is lagging.
 
         Async friendly.
         """
@@ -203,9 +267,15 @@ class WebSocketHandler:
             elif isinstance(message, str):
                 message = message.encode("utf-8")
 
-        message_queue = self._message_queue
-        message_queue.append(message)
-        if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
+        message_lane = self._lanes[lane]
+        self._sequence += 1
+        queue_size_after_add = message_lane.append(
+            message,
+            self._sequence,
+            coalesce_key,
+            lane == LANE_EVENT and len(message_lane) >= PENDING_MSG_PEAK,
+        )
+        if queue_size_after_add >= MAX_PENDING_MSG:
             self._logger.error(
                 (
                     "%s: Client unable to keep up with pending messages. Reached %s pending"
@@ -221,9 +291,19 @@ class WebSocketHandler:
 
         if self._release_ready_queue_size == 0:
             # Try to coalesce more messages to reduce the number of writes
-            self._release_ready_queue_size = queue_size_after_add
+            self._release_ready_queue_size = self._async_pending_messages()
             self._loop.call_soon(self._release_ready_future_or_reschedule)
 
+        if lane == LANE_EVENT:
+            # The event lane drops superseded messages instead of
+            # disconnecting a lagging client so it is not peak checked
+            if queue_size_after_add >= PENDING_MSG_PEAK and (
+                connection := self._connection
+            ):
+                connection.events_lagging = True
+            return
+
+        queue_size_after_add = self._async_peak_checked_messages()
         peak_checker_active = self._peak_checker_unsub is not None
 
         if queue_size_after_add <= PENDING_MSG_PEAK:
@@ -236,6 +316,17 @@ class WebSocketHandler:
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    @callback
+    def _async_pending_messages(self) -> int:
+        """Return the number of pending messages in all lanes."""
+        return sum(len(lane) for lane in self._lanes)
+
+    @callback
+    def _async_peak_checked_messages(self) -> int:
+        """Return the number of pending messages in the peak checked lanes."""
+        lanes = self._lanes
+        return len(lanes[LANE_RESULT]) + len(lanes[LANE_BULK])
+
     @callback
     def _release_ready_future_or_reschedule(self) -> None:
         """Release the ready future or reschedule.
@@ -247,7 +338,7 @@ class WebSocketHandler:
         immediately so avoid the coalesced messages from growing too large.
         """
         if not (ready_future := self._ready_future) or not (
-            queue_size := len(self._message_queue)
+            queue_size := self._async_pending_messages()
         ):
             self._release_ready_queue_size = 0
             return
@@ -260,16 +351,18 @@ class WebSocketHandler:
             return
         self._release_ready_queue_size = 0
         if not ready_future.done():
-            ready_future.set_result(queue_size)
+            ready_future.set_result(None)
 
     @callback
     def _check_write_peak(self, _utc_time: dt.datetime) -> None:
         """Check that we are no longer above the write peak."""
         self._peak_checker_unsub = None
 
-        if len(self._message_queue) < PENDING_MSG_PEAK:
+        if self._async_peak_checked_messages() < PENDING_MSG_PEAK:
             return
 
+        lanes = self._lanes
+
         self._logger.error(
             (
                 "%s: Client unable to keep up with pending messages. Stayed over %s for %s"
@@ -279,7 +372,7 @@ class WebSocketHandler:
             self.description,
             PENDING_MSG_PEAK,
             PENDING_MSG_PEAK_TIME,
-            self._message_queue[-1],
+            (lanes[LANE_RESULT].queue or lanes[LANE_BULK].queue)[-1],
         )
         self._cancel()
 
@@ -330,7 +423,14 @@ class WebSocketHandler:
         if TYPE_CHECKING:
             assert writer is not None
 
-        send_bytes_text = partial(writer.send_frame, opcode=WSMsgType.TEXT)
+        compression: WebSocketCompression | None = None
+        send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]]
+        if wsock.compress:
+            # The client negotiated permessage-deflate
+            compression = WebSocketCompression(wsock)
+            send_bytes_text = compression.send_text
+        else:
+            send_bytes_text = partial(writer.send_frame, opcode=WSMsgType.TEXT)
         auth = AuthPhase(
             logger, hass, self._send_message, self._cancel, request, send_bytes_text
         )
@@ -339,6 +439,9 @@ class WebSocketHandler:
 
         try:
             connection = await self._async_handle_auth_phase(auth, send_bytes_text)
+            if compression is not None:
+                connection.compression_stats = compression.stats
+            connection.message_lanes = dict(zip(LANE_NAMES, self._lanes, strict=True))
             self._async_increase_writer_limit(writer)
             await self._async_websocket_command_phase(connection)
         except asyncio.CancelledError:
@@ -363,7 +466,7 @@ class WebSocketHandler:
 
             self._closing = True
             if self._ready_future and not self._ready_future.done():
-                self._ready_future.set_result(len(self._message_queue))
+                self._ready_future.set_result(None)
 
             await self._async_cleanup_writer_and_close(disconnect_warn, connection)
 
@@ -491,7 +594,7 @@ class WebSocketHandler:
 
             # command_msg_data is always deserialized from JSON as a list
             if type(command_msg_data) is not list:  # noqa: E721
-                async_handle_str(command_msg_data)
+                async_handle_str(command_msg_data, len(msg_data))
                 continue
 
             for split_msg in command_msg_data:
@@ -523,6 +626,19 @@ class WebSocketHandler:
                     )
 
                 if connection is not None:
+                    if (stats := connection.compression_stats) is not None:
+                        logger.debug(
+                            "%s: Compressed %s bytes in %s frames in %.3fs",
+                            self.description,
+                            stats.bytes_in,
+                            stats.frames,
+                            stats.compression_time,
+                        )
+                    logger.debug(
+                        "%s: Dropped %s superseded event messages",
+                        self.description,
+                        self._lanes[LANE_EVENT].stats.dropped,
+                    )
                     hass.data[DATA_CONNECTIONS] -= 1
                     self._connection = None
 
@@ -533,7 +649,7 @@ class WebSocketHandler:
                 self._request = None  # type: ignore[assignment]
                 self._hass = None  # type: ignore[assignment]
                 self._logger = None  # type: ignore[assignment]
-                self._message_queue = None  # type: ignore[assignment]
+                self._lanes = None  # type: ignore[assignment]
                 self._handle_task = None
                 self._writer_task = None
                 self._ready_future = None
@@ -0,0 +1,134 @@
+"""Prioritized outbound message lanes for websocket connections."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class LaneStats:
+    """Statistics for an outbound message lane."""
+
+    sent: int = 0
+    dropped: int = 0
+    max_pending: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the statistics as a dict."""
+        return {
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "max_pending": self.max_pending,
+        }
+
+
+class MessageLane:
+    """A queue of outgoing messages with the same priority.
+
+    Messages can be queued with a coalesce key. When superseded messages
+    are dropped, a queued message with the same key is removed from the
+    queue, so a lagging client only receives the newest message for each
+    key. Messages queued with a key must therefore not depend on earlier
+    messages with the same key.
+
+    Each message is queued with a sequence number so messages from
+    several lanes can be written in the order they were queued.
+    """
+
+    __slots__ = ("_holes", "_keys", "_popped", "_sequences", "queue", "stats")
+
+    def __init__(self) -> None:
+        """Initialize the lane."""
+        self.queue: deque[bytes] = deque()
+        self._sequences: deque[int] = deque()
+        self.stats = LaneStats()
+        # Position of the newest message for each coalesce key,
+        # counted from the first message ever queued
+        self._keys: dict[Hashable, int] = {}
+        # Number of messages removed from the front of the queue
+        self._popped = 0
+        # Number of dropped messages still in the queue
+        self._holes = 0
+
+    def __len__(self) -> int:
+        """Return the number of pending messages."""
+        return len(self.queue) - self._holes
+
+    def append(
+        self,
+        message: bytes,
+        sequence: int,
+        coalesce_key: Hashable | None,
+        drop_superseded: bool,
+    ) -> int:
+        """Queue a message and return the number of pending messages."""
+        queue = self.queue
+        if coalesce_key is not None:
+            keys = self._keys
+            if (
+                drop_superseded
+                and (position := keys.get(coalesce_key)) is not None
+                and (index := position - self._popped) >= 0
+            ):
+                # Blank the superseded message instead of removing it
+                # so the positions of the other messages do not change
+                queue[index] = b""
+                self._holes += 1
+                self.stats.dropped += 1
+            keys[coalesce_key] = self._popped + len(queue)
+        queue.append(message)
+        self._sequences.append(sequence)
+        pending = len(queue) - self._holes
+        self.stats.max_pending = max(self.stats.max_pending, pending)
+        return pending
+
+    def next_sequence(self) -> int:
+        """Return the sequence number of the oldest pending message."""
+        queue = self.queue
+        sequences = self._sequences
+        # A dropped message is always followed by the message
+        # that superseded it, so the queue never runs out here
+        while not queue[0]:
+            queue.popleft()
+            sequences.popleft()
+            self._popped += 1
+            self._holes -= 1
+        return sequences[0]
+
+    def popleft(self) -> bytes:
+        """Remove and return the oldest pending message."""
+        queue = self.queue
+        sequences = self._sequences
+        message = queue.popleft()
+        sequences.popleft()
+        self._popped += 1
+        while not message:
+            self._holes -= 1
+            message = queue.popleft()
+            sequences.popleft()
+            self._popped += 1
+        if not queue:
+            self._clear()
+        self.stats.sent += 1
+        return message
+
+    def pop_all(self) -> list[tuple[int, bytes]]:
+        """Remove and return all pending messages with their sequence numbers."""
+        messages = [
+            (sequence, message)
+            for sequence, message in zip(self._sequences, self.queue, strict=True)
+            if message
+        ]
+        self.queue.clear()
+        self._sequences.clear()
+        self._clear()
+        self.stats.sent += len(messages)
+        return messages
+
+    def _clear(self) -> None:
+        """Reset the bookkeeping once the queue is empty."""
+        self._keys.clear()
+        self._popped = 0
+        self._holes = 0
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from functools import lru_cache
 import logging
 from typing import Any, Final
@@ -15,7 +16,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -177,6 +178,46 @@ def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> b
     )
 
 
+def cached_state_full_message(
+    message_id_as_bytes: bytes, event: Event[EventStateChangedData]
+) -> bytes:
+    """Return an event message with the full new state of an entity.
+
+    Unlike a state diff the message does not depend on the states
+    previously sent to the client, so older messages for the same
+    entity can be dropped when the client is lagging.
+    """
+    return b"".join(
+        (
+            _partial_cached_state_full_message(event)[:-1],
+            b',"id":',
+            message_id_as_bytes,
+            b"}",
+        )
+    )
+
+
+@lru_cache(maxsize=128)
+def _partial_cached_state_full_message(
+    event: Event[EventStateChangedData],
+) -> bytes:
+    """Cache and serialize the full state event to json.
+
+    The message is constructed without the id which
+    will be appended in cached_state_full_message
+    """
+    if (new_state := event.data["new_state"]) is None:
+        full_event: dict[str, Any] = {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
+    else:
+        full_event = {
+            ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}
+        }
+    return (
+        _message_to_json_bytes_or_none({"type": "event", "event": full_event})
+        or INVALID_JSON_PARTIAL_MESSAGE
+    )
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
 ) -> dict[
@@ -199,6 +240,13 @@ def _state_diff_event(
         return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
     if (old_state := event.data["old_state"]) is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
+    return {
+        ENTITY_EVENT_CHANGE: {new_state.entity_id: _state_diff(old_state, new_state)}
+    }
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, dict[str, Any]]:
+    """Return the compressed diff between two states of an entity."""
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
     new_state_context = new_state.context
@@ -235,7 +283,7 @@ def _state_diff_event(
             # here if there are any values to avoid jumping into the json_encoder_default
             # for every state diff with a removed attribute
             diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: list(removed)}
-    return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
+    return diff
 
 
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
@@ -259,3 +307,41 @@ def message_to_json_bytes(message: dict[str, Any]) -> bytes:
             message["id"], const.ERR_UNKNOWN_ERROR, "Invalid JSON in response"
         )
     )
+
+
+def batched_state_diff_message(
+    message_id_as_bytes: bytes,
+    changes: Iterable[tuple[str, State | None, State | None]],
+) -> bytes | None:
+    """Return one event message for a batch of entity changes.
+
+    Each change is the state the client last saw and the newest state
+    of an entity, so intermediate states are never sent. Returns None
+    when the batch cancels out, such as an entity added and removed
+    within the same batch.
+    """
+    additions: dict[str, CompressedState] = {}
+    changed: dict[str, dict[str, dict[str, Any]]] = {}
+    removals: list[str] = []
+    for entity_id, old_state, new_state in changes:
+        if new_state is None:
+            if old_state is not None:
+                removals.append(entity_id)
+        elif old_state is None:
+            additions[entity_id] = new_state.as_compressed_state
+        else:
+            changed[entity_id] = _state_diff(old_state, new_state)
+    event: dict[str, Any] = {}
+    if additions:
+        event[ENTITY_EVENT_ADD] = additions
+    if changed:
+        event[ENTITY_EVENT_CHANGE] = changed
+    if removals:
+        event[ENTITY_EVENT_REMOVE] = removals
+    if not event:
+        return None
+    partial_message = (
+        _message_to_json_bytes_or_none({"type": "event", "event": event})
+        or INVALID_JSON_PARTIAL_MESSAGE
+    )
+    return b"".join((partial_message[:-1], b',"id":', message_id_as_bytes, b"}"))
@@ -0,0 +1,206 @@
+"""Shared snapshot of the serialized state machine for websocket clients."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+import logging
+from typing import Final
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions import AbstractPermissions
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.json import JSON_DUMP, find_paths_unserializable_data
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import format_unserializable_data
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STATES_SNAPSHOT: HassKey[StatesSnapshot] = HassKey(f"{DOMAIN}.states_snapshot")
+
+# Maximum number of permission filtered payloads kept per table
+MAX_FILTERED_PAYLOADS: Final = 16
+
+
+class _StateFragmentTable:
+    """Serialized states of all entities, patched from state changes.
+
+    The payload is the serialized states joined by commas between a
+    prefix and a suffix, such as the brackets of a JSON list. It is built
+    once per version of the state machine and shared by all requests
+    until the next state change. Only the entities that changed since
+    the last build are serialized again.
+    """
+
+    __slots__ = (
+        "_changed",
+        "_filtered",
+        "_fragments",
+        "_hass",
+        "_payload",
+        "_prefix",
+        "_serialize",
+        "_suffix",
+        "builds",
+        "hits",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        serialize: Callable[[State], bytes],
+        prefix: bytes,
+        suffix: bytes,
+    ) -> None:
+        """Initialize the table."""
+        self._hass = hass
+        self._serialize = serialize
+        self._prefix = prefix
+        self._suffix = suffix
+        self._fragments: dict[str, bytes] = {}
+        # Entities changed since the last build in the order they were
+        # added to the state machine, None before the first build
+        self._changed: dict[str, None] | None = None
+        self._payload: bytes | None = None
+        self._filtered: OrderedDict[str, tuple[AbstractPermissions, bytes]] = (
+            OrderedDict()
+        )
+        self.builds = 0
+        self.hits = 0
+
+    @callback
+    def async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Invalidate the payloads and mark the entity as changed."""
+        if (changed := self._changed) is None:
+            return
+        self._payload = None
+        self._filtered.clear()
+        data = event.data
+        entity_id = data["entity_id"]
+        if data["old_state"] is None or data["new_state"] is None:
+            # Added or removed entities move to the end of the state
+            # machine, keep the same order here
+            self._fragments.pop(entity_id, None)
+            changed.pop(entity_id, None)
+        changed[entity_id] = None
+
+    @callback
+    def async_get(self, user: User) -> bytes:
+        """Return the serialized states the user is allowed to read."""
+        if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
+            if (payload := self._payload) is None:
+                payload = self._payload = self._async_join(
+                    self._async_fragments().values()
+                )
+                self.builds += 1
+            else:
+                self.hits += 1
+            return payload
+        permissions = user.permissions
+        filtered = self._filtered
+        if (cached := filtered.get(user.id)) is not None and cached[0] is permissions:
+            filtered.move_to_end(user.id)
+            self.hits += 1
+            return cached[1]
+        entity_perm = permissions.check_entity
+        payload = self._async_join(
+            [
+                fragment
+                for entity_id, fragment in self._async_fragments().items()
+                if entity_perm(entity_id, POLICY_READ)
+            ]
+        )
+        self.builds += 1
+        filtered[user.id] = (permissions, payload)
+        if len(filtered) > MAX_FILTERED_PAYLOADS:
+            filtered.popitem(last=False)
+        return payload
+
+    @callback
+    def _async_join(self, fragments: Iterable[bytes]) -> bytes:
+        """Join the serialized states into a payload."""
+        return b"".join((self._prefix, b",".join(fragments), self._suffix))
+
+    @callback
+    def _async_fragments(self) -> dict[str, bytes]:
+        """Return the serialized states, serializing the changed entities."""
+        fragments = self._fragments
+        states = self._hass.states
+        if (changed := self._changed) is None:
+            self._changed = {}
+            for state in states.async_all():
+                self._async_add_fragment(state)
+            return fragments
+        for entity_id in changed:
+            if (state := states.get(entity_id)) is None:
+                fragments.pop(entity_id, None)
+            else:
+                self._async_add_fragment(state)
+        changed.clear()
+        return fragments
+
+    @callback
+    def _async_add_fragment(self, state: State) -> None:
+        """Serialize a state, skipping states that cannot be serialized."""
+        try:
+            self._fragments[state.entity_id] = self._serialize(state)
+        except (ValueError, TypeError):
+            self._fragments.pop(state.entity_id, None)
+            _LOGGER.error(
+                "Unable to serialize to JSON. Bad data found at %s",
+                format_unserializable_data(
+                    find_paths_unserializable_data(state, dump=JSON_DUMP)
+                ),
+            )
+
+
+class StatesSnapshot:
+    """Serialized states shared by the initial payload of all clients.
+
+    The full states are a JSON list used by get_states and the compressed
+    states a JSON object used by subscribe_entities.
+    """
+
+    __slots__ = ("compressed_states", "states")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the snapshot."""
+        self.states = _StateFragmentTable(hass, _as_dict_json, b"[", b"]")
+        self.compressed_states = _StateFragmentTable(
+            hass, _as_compressed_state_json, b"{", b"}"
+        )
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Patch the tables from a state change."""
+        self.states.async_state_changed(event)
+        self.compressed_states.async_state_changed(event)
+
+
+def _as_dict_json(state: State) -> bytes:
+    """Return the full serialized state."""
+    return state.as_dict_json
+
+
+def _as_compressed_state_json(state: State) -> bytes:
+    """Return the compressed serialized state."""
+    return state.as_compressed_state_json
+
+
+@callback
+@singleton(DATA_STATES_SNAPSHOT)
+def async_get_states_snapshot(hass: HomeAssistant) -> StatesSnapshot:
+    """Return the shared states snapshot."""
+    return StatesSnapshot(hass)
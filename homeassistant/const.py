@@ -268,6 +268,7 @@ CONF_SERVICE_DATA: Final = "data"
 CONF_SERVICE_DATA_TEMPLATE: Final = "data_template"
 CONF_SERVICE_TEMPLATE: Final = "service_template"
 CONF_SET_CONVERSATION_RESPONSE: Final = "set_conversation_response"
+CONF_SETUP_PRIORITY: Final = "setup_priority"
 CONF_SHOW_ON_MAP: Final = "show_on_map"
 CONF_SLAVE: Final = "slave"
 CONF_SOURCE: Final = "source"
@@ -12,12 +12,14 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Hashable,
     Iterable,
     KeysView,
     Mapping,
     ValuesView,
 )
 import concurrent.futures
+from contextlib import suppress
 from dataclasses import dataclass
 import datetime
 import enum
@@ -25,6 +27,7 @@ import functools
 import inspect
 import logging
 import re
+import sys
 import threading
 import time
 from time import monotonic
@@ -39,6 +42,7 @@ from typing import (
     cast,
     overload,
 )
+import weakref
 
 from propcache import cached_property, under_cached_property
 from typing_extensions import TypeVar
@@ -46,10 +50,12 @@ import voluptuous as vol
 
 from . import util
 from .const import (
+    ATTR_DEVICE_CLASS,
     ATTR_DOMAIN,
     ATTR_FRIENDLY_NAME,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
+    ATTR_UNIT_OF_MEASUREMENT,
     COMPRESSED_STATE_ATTRIBUTES,
     COMPRESSED_STATE_CONTEXT,
     COMPRESSED_STATE_LAST_CHANGED,
@@ -103,6 +109,7 @@ from .util.event_type import EventType
 from .util.executor import InterruptibleThreadPoolExecutor
 from .util.hass_dict import HassDict
 from .util.json import JsonObjectType
+from .util.loop_time import LoopTimeTracker
 from .util.read_only_dict import ReadOnlyDict
 from .util.timeout import TimeoutManager
 from .util.ulid import ulid_at_time, ulid_now
@@ -455,6 +462,8 @@ class HomeAssistant:
             max_workers=1, thread_name_prefix="ImportExecutor"
         )
         self.loop_thread_id = getattr(self.loop, "_thread_id")
+        # Attributes the event loop time to integrations when enabled
+        self.loop_time: LoopTimeTracker | None = None
 
     def verify_event_loop_thread(self, what: str) -> None:
         """Report and raise if we are not running in the event loop thread."""
@@ -464,6 +473,18 @@ class HomeAssistant:
 
             frame.report_non_thread_safe_operation(what)
 
+    @callback
+    def async_set_loop_time_tracking(self, enabled: bool) -> None:
+        """Enable or disable attributing the event loop time to integrations.
+
+        The histograms are kept while tracking stays enabled and discarded
+        when it is disabled.
+        """
+        if not enabled:
+            self.loop_time = None
+        elif self.loop_time is None:
+            self.loop_time = LoopTimeTracker()
+
     @property
     def _active_tasks(self) -> set[asyncio.Future[Any]]:
         """Return all active tasks.
@@ -755,15 +776,19 @@ class HomeAssistant:
         if hassjob.job_type is HassJobType.Coroutinefunction:
             if TYPE_CHECKING:
                 hassjob = cast(HassJob[..., Coroutine[Any, Any, _R]], hassjob)
-            task = create_eager_task(
-                hassjob.target(*args), name=hassjob.name, loop=self.loop
-            )
+            coro = hassjob.target(*args)
+            if (loop_time := self.loop_time) is not None:
+                coro = loop_time.wrap_coroutine(coro)
+            task = create_eager_task(coro, name=hassjob.name, loop=self.loop)
             if task.done():
                 return task
         elif hassjob.job_type is HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob = cast(HassJob[..., _R], hassjob)
-            self.loop.call_soon(hassjob.target, *args)
+            if (loop_time := self.loop_time) is not None:
+                self.loop.call_soon(loop_time.async_run, hassjob.target, *args)
+            else:
+                self.loop.call_soon(hassjob.target, *args)
             return None
         else:
             if TYPE_CHECKING:
@@ -828,6 +853,8 @@ class HomeAssistant:
 
         target: target to call.
         """
+        if (loop_time := self.loop_time) is not None:
+            target = loop_time.wrap_coroutine(target)
         if eager_start:
             task = create_eager_task(target, name=name, loop=self.loop)
             if task.done():
@@ -860,6 +887,8 @@ class HomeAssistant:
 
         This method must be run in the event loop.
         """
+        if (loop_time := self.loop_time) is not None:
+            target = loop_time.wrap_coroutine(target)
         if eager_start:
             task = create_eager_task(target, name=name, loop=self.loop)
             if task.done():
@@ -937,7 +966,10 @@ class HomeAssistant:
         if hassjob.job_type is HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob = cast(HassJob[..., _R], hassjob)
-            hassjob.target(*args)
+            if (loop_time := self.loop_time) is not None:
+                loop_time.async_run(hassjob.target, *args)
+            else:
+                hassjob.target(*args)
             return None
 
         return self._async_add_hass_job(hassjob, *args, background=background)
@@ -1446,6 +1478,59 @@ class _OneTimeListener(Generic[_DataT]):
         return f"<_OneTimeListener {self.listener_job.target}>"
 
 
+class _BatchedListener(Generic[_DataT]):
+    """Collect events and pass them to a listener in batches."""
+
+    __slots__ = ("_events", "_handle", "hass", "listener_job", "window")
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        listener_job: HassJob[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None],
+        window: float,
+    ) -> None:
+        """Initialize the batched listener."""
+        self.hass = hass
+        self.listener_job = listener_job
+        self.window = window
+        self._events: list[Event[_DataT]] = []
+        self._handle: asyncio.Handle | asyncio.TimerHandle | None = None
+
+    @callback
+    def async_add(self, event: Event[_DataT]) -> None:
+        """Add an event to the batch, scheduling its delivery if needed."""
+        self._events.append(event)
+        if self._handle is None:
+            loop = self.hass.loop
+            if self.window:
+                self._handle = loop.call_later(self.window, self._async_deliver)
+            else:
+                self._handle = loop.call_soon(self._async_deliver)
+
+    @callback
+    def _async_deliver(self) -> None:
+        """Pass the collected events to the listener."""
+        self._handle = None
+        events = self._events
+        self._events = []
+        self.hass.async_run_hass_job(self.listener_job, events)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the events that were not delivered yet."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._events = []
+
+    def __repr__(self) -> str:
+        """Return the representation of the listener and source module."""
+        module = inspect.getmodule(self.listener_job.target)
+        if module:
+            return f"<_BatchedListener {module.__name__}:{self.listener_job.target}>"
+        return f"<_BatchedListener {self.listener_job.target}>"
+
+
 # Empty list, used by EventBus.async_fire_internal
 EMPTY_LIST: list[Any] = []
 
@@ -1642,6 +1727,61 @@ class EventBus:
                 )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def async_listen_batched(
+        self,
+        event_type: EventType[_DataT] | str,
+        listener: Callable[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[_DataT], bool] | None = None,
+        window: float = 0,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type, delivered in batches.
+
+        The listener is called with a list of the events collected since
+        the previous call instead of once per event. Without a window the
+        events fired during the current iteration of the event loop are
+        delivered in the next iteration, with a window in seconds the
+        events fired in that window after the first one.
+
+        The events of a batch are in the order they were fired and
+        batches are delivered in order. A batch is delivered after the
+        callbacks listening to its events without batching were called.
+        Batches for a coroutine function listener are run as separate
+        tasks, so they may overlap. Events not yet delivered when the
+        listener is removed are dropped.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, determines if an event
+        is added to the batch.
+
+        This method must be run in the event loop.
+        """
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        if event_type == EVENT_STATE_REPORTED and not event_filter:
+            raise HomeAssistantError(f"Event filter is required for event {event_type}")
+        batched_listener: _BatchedListener[_DataT] = _BatchedListener(
+            self._hass, HassJob(listener, f"batched listen {event_type}"), window
+        )
+        remove = self._async_listen_filterable_job(
+            event_type,
+            (
+                HassJob(
+                    batched_listener.async_add,
+                    f"batched listen {event_type} {listener}",
+                    job_type=HassJobType.Callback,
+                ),
+                event_filter,
+            ),
+        )
+
+        @callback
+        def _async_remove() -> None:
+            remove()
+            batched_listener.async_cancel()
+
+        return _async_remove
+
     @callback
     def _async_listen_filterable_job(
         self,
@@ -2022,17 +2162,30 @@ class State:
         )
 
 
+# Attributes the states are indexed by, see States
+INDEXED_ATTRIBUTES: Final = (ATTR_DEVICE_CLASS, ATTR_UNIT_OF_MEASUREMENT, "state_class")
+
+
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
-    Maintains an additional index:
+    Maintains additional indexes:
     - domain -> dict[str, State]
+    - attribute -> value -> entity id -> position, for the INDEXED_ATTRIBUTES
+
+    The position is the order the entity_id was added in, it is used to
+    return the indexed entity_ids in the same order as the states.
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        self._attribute_index: dict[str, dict[Hashable, dict[str, int]]] = {
+            attribute: {} for attribute in INDEXED_ATTRIBUTES
+        }
+        self._positions: dict[str, int] = {}
+        self._next_position = 0
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -2040,15 +2193,55 @@ class States(UserDict[str, State]):
 
     def __setitem__(self, key: str, entry: State) -> None:
         """Add an item."""
+        old_entry = self.data.get(key)
         self.data[key] = entry
+        if old_entry is None:
+            self._positions[key] = self._next_position
+            self._next_position += 1
         self._domain_index[entry.domain][entry.entity_id] = entry
+        # The attributes are the same object when they did not change
+        if old_entry is None or old_entry.attributes is not entry.attributes:
+            self._update_attribute_index(key, old_entry, entry)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._domain_index[entry.domain][entry.entity_id]
+        self._update_attribute_index(key, entry, None)
+        del self._positions[key]
         super().__delitem__(key)
 
+    def _update_attribute_index(
+        self, key: str, old_entry: State | None, entry: State | None
+    ) -> None:
+        """Move an entity to the index entries of its new attribute values."""
+        for attribute, index in self._attribute_index.items():
+            old_value = (
+                None if old_entry is None else old_entry.attributes.get(attribute)
+            )
+            value = None if entry is None else entry.attributes.get(attribute)
+            if old_value == value:
+                continue
+            # Unhashable values are not indexed
+            if old_value is not None:
+                with suppress(KeyError, TypeError):
+                    entity_ids = index[old_value]
+                    del entity_ids[key]
+                    if not entity_ids:
+                        del index[old_value]
+            if value is not None:
+                with suppress(TypeError):
+                    index.setdefault(value, {})[key] = self._positions[key]
+
+    def attribute_entity_ids(self, attribute: str, value: Hashable) -> list[str]:
+        """Get all entity_ids with an indexed attribute set to a value.
+
+        The entity_ids are in the same order as the states.
+        """
+        if (entity_ids := self._attribute_index[attribute].get(value)) is None:
+            return []
+        return sorted(entity_ids, key=entity_ids.__getitem__)
+
     def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
         """Get all entity_ids for a domain."""
         # Avoid polluting _domain_index with non-existing domains
@@ -2064,10 +2257,120 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+# Types of the attribute values hashed to find an equal attribute mapping
+_ATTRIBUTES_HASHED_TYPES: Final = frozenset({str, int, float, bool, type(None)})
+
+
+class AttributesInterner:
+    """Share equal attribute mappings between states.
+
+    Mappings are looked up by a hash of their keys and scalar values. A
+    mapping is only shared when its items are equal and have the same
+    order and types, also inside lists, tuples, dicts and sets, so a hash
+    collision costs a new mapping. Values of other types are only shared
+    when they are the same object. The keys of new mappings are interned,
+    values are not so they are freed with the last state using them.
+    Mappings are held weakly and forgotten once no state uses them.
+    """
+
+    __slots__ = ("_mappings", "hits", "misses")
+
+    def __init__(self) -> None:
+        """Initialize the interner."""
+        self._mappings: weakref.WeakValueDictionary[int, ReadOnlyDict[str, Any]] = (
+            weakref.WeakValueDictionary()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def intern(self, attributes: Mapping[str, Any] | None) -> ReadOnlyDict[str, Any]:
+        """Return a shared mapping equal to the attributes."""
+        if not attributes:
+            return _EMPTY_ATTRIBUTES
+        hashed_types = _ATTRIBUTES_HASHED_TYPES
+        key = hash(
+            tuple(
+                (name, value) if type(value) in hashed_types else name
+                for name, value in attributes.items()
+            )
+        )
+        if (mapping := self._mappings.get(key)) is not None and _same_attributes(
+            mapping, attributes
+        ):
+            self.hits += 1
+            return mapping
+        self.misses += 1
+        mapping = ReadOnlyDict(
+            {_intern(name): value for name, value in attributes.items()}
+        )
+        self._mappings[key] = mapping
+        return mapping
+
+
+def _intern(name: Any) -> Any:
+    """Intern a string attribute name, other names are returned unchanged."""
+    return sys.intern(name) if type(name) is str else name
+
+
+def _same_attributes(mapping: Mapping[str, Any], attributes: Mapping[str, Any]) -> bool:
+    """Return if two attribute mappings are equal with the same order and types."""
+    return mapping == attributes and _same_items(attributes, mapping)
+
+
+def _same_items(value: Mapping[Any, Any], other: Mapping[Any, Any]) -> bool:
+    """Return if the items of two equal mappings have the same order and types."""
+    return all(
+        key == other_key
+        and _same_types(key, other_key)
+        and _same_types(item, other_item)
+        for (key, item), (other_key, other_item) in zip(
+            value.items(), other.items(), strict=True
+        )
+    )
+
+
+def _same_types(value: Any, other: Any) -> bool:
+    """Return if two equal values have the same types, including nested values.
+
+    Objects of other types than the hashed scalars and the containers may be
+    equal but represented differently, like datetimes in other timezones, so
+    they must be the same object.
+    """
+    if value is other:
+        return True
+    value_type = type(value)
+    if value_type is not type(other):
+        return False
+    if value_type in _ATTRIBUTES_HASHED_TYPES:
+        return True
+    if value_type is list or value_type is tuple:
+        return all(map(_same_types, value, other))
+    if value_type is dict or value_type is ReadOnlyDict:
+        return _same_items(value, other)
+    if value_type is set or value_type is frozenset:
+        # Set items are compared with their type, which is only enough for
+        # the scalars
+        hashed_types = _ATTRIBUTES_HASHED_TYPES
+        return all(type(item) in hashed_types for item in value) and {
+            (type(item), item) for item in value
+        } == {(type(item), item) for item in other}
+    return False
+
+
+_EMPTY_ATTRIBUTES: ReadOnlyDict[str, Any] = ReadOnlyDict()
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "attributes_interner",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2078,6 +2381,7 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        self.attributes_interner = AttributesInterner()
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2148,6 +2452,44 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_all_with_attribute(
+        self,
+        attribute: str,
+        value: Any,
+        domain_filter: str | Iterable[str] | None = None,
+    ) -> list[State]:
+        """Create a list of the states with an attribute set to a value.
+
+        Attributes in INDEXED_ATTRIBUTES are looked up in an index, other
+        attributes are compared for all states matching the filter. The
+        states are in the order of the state machine in both cases.
+
+        This method must be run in the event loop.
+        """
+        if attribute in INDEXED_ATTRIBUTES:
+            # Unhashable values are not indexed
+            with suppress(TypeError):
+                entity_ids = self._states.attribute_entity_ids(attribute, value)
+                states_data = self._states_data
+                if domain_filter is None:
+                    return [states_data[entity_id] for entity_id in entity_ids]
+                domains = (
+                    {domain_filter.lower()}
+                    if isinstance(domain_filter, str)
+                    else set(domain_filter)
+                )
+                return [
+                    state
+                    for entity_id in entity_ids
+                    if (state := states_data[entity_id]).domain in domains
+                ]
+        return [
+            state
+            for state in self.async_all(domain_filter)
+            if state.attributes.get(attribute, _SENTINEL) == value
+        ]
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -2358,6 +2700,14 @@ class StateMachine:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        elif (
+            old_state is None
+            or not attributes
+            or old_state.attributes.keys() != attributes.keys()
+        ):
+            # Attributes that keep their names between writes usually keep
+            # changing their values, so they are unlikely to be shared
+            attributes = self.attributes_interner.intern(attributes)
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -45,6 +45,7 @@ from .const import (
     CONF_NAME,
     CONF_PACKAGES,
     CONF_RADIUS,
+    CONF_SETUP_PRIORITY,
     CONF_TEMPERATURE_UNIT,
     CONF_TIME_ZONE,
     CONF_TYPE,
@@ -324,6 +325,9 @@ CORE_CONFIG_SCHEMA = vol.All(
             vol.Optional(CONF_COUNTRY): cv.country,
             vol.Optional(CONF_LANGUAGE): cv.language,
             vol.Optional(CONF_DEBUG): cv.boolean,
+            vol.Optional(CONF_SETUP_PRIORITY): cv.schema_with_slug_keys(
+                vol.Coerce(int)
+            ),
             vol.Optional(CONF_WEBRTC): vol.Schema(
                 {
                     vol.Required(CONF_ICE_SERVERS): vol.All(
@@ -409,6 +413,7 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: dict) -> Non
         (CONF_MEDIA_DIRS, "media_dirs"),
         (CONF_NAME, "location_name"),
         (CONF_RADIUS, "radius"),
+        (CONF_SETUP_PRIORITY, "setup_priority"),
     ):
         if key in config:
             setattr(hac, attr, config[key])
@@ -600,6 +605,9 @@ class Config:
         # Dictionary of Media folders that integrations may use
         self.media_dirs: dict[str, str] = {}
 
+        # Priority of the integrations set up during startup, by domain
+        self.setup_priority: dict[str, int] = {}
+
         # If Home Assistant is running in recovery mode
         self.recovery_mode: bool = False
 
@@ -1020,6 +1020,14 @@ class Entity(
             self._async_verify_state_writable()
         if self.hass.loop_thread_id != threading.get_ident():
             report_non_thread_safe_operation("async_write_ha_state")
+        if (loop_time := self.hass.loop_time) is not None:
+            domain = (
+                self.platform.platform_name
+                if self.platform
+                else loop_time.domain(type(self))
+            )
+            loop_time.async_run_for(domain, self._async_write_ha_state)
+            return
         self._async_write_ha_state()
 
     def _stringify_state(self, available: bool) -> str:
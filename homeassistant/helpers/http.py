@@ -7,6 +7,7 @@ from collections.abc import Awaitable, Callable
 from contextvars import ContextVar
 from http import HTTPStatus
 import logging
+import time
 from typing import Any, Final
 
 from aiohttp import web
@@ -26,6 +27,7 @@ from homeassistant.core import Context, HomeAssistant, is_callback
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS, format_unserializable_data
 
 from .json import find_paths_unserializable_data, json_bytes, json_dumps
+from .request_metrics import KIND_HTTP, RequestMetrics, RequestMetricsRegistry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +37,7 @@ KEY_AUTHENTICATED: Final = "ha_authenticated"
 KEY_ALLOW_ALL_CORS = AppKey[AllowCorsType]("allow_all_cors")
 KEY_ALLOW_CONFIGURED_CORS = AppKey[AllowCorsType]("allow_configured_cors")
 KEY_HASS: AppKey[HomeAssistant] = AppKey("hass")
+KEY_REQUEST_METRICS = AppKey[RequestMetricsRegistry]("request_metrics")
 
 current_request: ContextVar[Request | None] = ContextVar(
     "current_request", default=None
@@ -42,9 +45,16 @@ current_request: ContextVar[Request | None] = ContextVar(
 
 
 def request_handler_factory(
-    hass: HomeAssistant, view: HomeAssistantView, handler: Callable
+    hass: HomeAssistant,
+    view: HomeAssistantView,
+    handler: Callable,
+    metrics: RequestMetrics | None = None,
 ) -> Callable[[web.Request], Awaitable[web.StreamResponse]]:
-    """Wrap the handler classes."""
+    """Wrap the handler classes.
+
+    If metrics are passed, the latency and response size of the handler
+    are recorded in them.
+    """
     is_coroutinefunction = asyncio.iscoroutinefunction(handler)
     assert is_coroutinefunction or is_callback(
         handler
@@ -101,7 +111,23 @@ def request_handler_factory(
             f"Result should be None, string, bytes or StreamResponse. Got: {result}"
         )
 
-    return handle
+    if metrics is None:
+        return handle
+
+    async def handle_with_metrics(request: web.Request) -> web.StreamResponse:
+        """Handle incoming request and record its metrics."""
+        metrics.in_flight += 1
+        start = time.perf_counter()
+        try:
+            response = await handle(request)
+        finally:
+            metrics.latency.observe(time.perf_counter() - start)
+            metrics.in_flight -= 1
+        if (size := response.content_length) is not None:
+            metrics.sizes.observe(size)
+        return response
+
+    return handle_with_metrics
 
 
 class HomeAssistantView:
@@ -168,12 +194,18 @@ class HomeAssistantView:
         assert self.url is not None, "No url set for view"
         urls = [self.url, *self.extra_urls]
         routes: list[AbstractRoute] = []
+        metrics: RequestMetrics | None = None
+        # Use `get` because request metrics are only kept for the http component
+        if registry := app.get(KEY_REQUEST_METRICS):
+            metrics = registry.async_get(
+                KIND_HTTP, getattr(self, "name", None) or self.url
+            )
 
         for method in ("get", "post", "delete", "put", "patch", "head", "options"):
             if not (handler := getattr(self, method, None)):
                 continue
 
-            handler = request_handler_factory(hass, self, handler)
+            handler = request_handler_factory(hass, self, handler, metrics)
 
             routes.extend(router.add_route(method, url, handler) for url in urls)
 
@@ -0,0 +1,138 @@
+"""Latency and payload size metrics of HTTP views and websocket commands."""
+
+from __future__ import annotations
+
+from typing import Any, Final
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.histogram import Histogram
+
+from .singleton import singleton
+
+DATA_REQUEST_METRICS: HassKey[RequestMetricsRegistry] = HassKey("request_metrics")
+
+KIND_HTTP: Final = "http"
+KIND_WEBSOCKET: Final = "websocket"
+
+# Upper bounds of the histogram buckets, in seconds and bytes
+LATENCY_BUCKETS: Final = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+SIZE_BUCKETS: Final = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# Metric prefix, label name and measured payload per kind of request
+_EXPOSITION: Final = {
+    KIND_HTTP: ("homeassistant_http_request", "view", "response_size_bytes"),
+    KIND_WEBSOCKET: (
+        "homeassistant_websocket_command",
+        "command",
+        "message_size_bytes",
+    ),
+}
+
+
+class RequestMetrics:
+    """Metrics of a single HTTP view or websocket command."""
+
+    __slots__ = ("in_flight", "latency", "sizes")
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.in_flight = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.sizes = Histogram(SIZE_BUCKETS)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dict."""
+        return {
+            "in_flight": self.in_flight,
+            "latency": self.latency.as_dict(),
+            "size": self.sizes.as_dict(),
+        }
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class RequestMetricsRegistry:
+    """Metrics of the HTTP views and websocket commands by name.
+
+    For HTTP views the size is the size of the response body, for
+    websocket commands the size of the received message.
+    """
+
+    __slots__ = ("_metrics",)
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._metrics: dict[str, dict[str, RequestMetrics]] = {
+            kind: {} for kind in _EXPOSITION
+        }
+
+    @callback
+    def async_get(self, kind: str, name: str) -> RequestMetrics:
+        """Return the metrics of a view or command, creating them if needed."""
+        metrics = self._metrics[kind]
+        if (request_metrics := metrics.get(name)) is None:
+            request_metrics = metrics[name] = RequestMetrics()
+        return request_metrics
+
+    @callback
+    def as_dict(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the metrics of all views and commands."""
+        return {
+            kind: {name: metrics.as_dict() for name, metrics in kind_metrics.items()}
+            for kind, kind_metrics in self._metrics.items()
+        }
+
+    @callback
+    def as_prometheus(self) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for kind, kind_metrics in self._metrics.items():
+            prefix, label, size_name = _EXPOSITION[kind]
+            labels = {name: f'{label}="{_escape_label(name)}"' for name in kind_metrics}
+            lines.append(f"# TYPE {prefix}s_in_flight gauge")
+            lines.extend(
+                f"{prefix}s_in_flight{{{labels[name]}}} {metrics.in_flight}"
+                for name, metrics in kind_metrics.items()
+            )
+            for metric, attr in (
+                ("duration_seconds", "latency"),
+                (size_name, "sizes"),
+            ):
+                metric_name = f"{prefix}_{metric}"
+                lines.append(f"# TYPE {metric_name} histogram")
+                for name, metrics in kind_metrics.items():
+                    histogram: Histogram = getattr(metrics, attr)
+                    lines.extend(
+                        f'{metric_name}_bucket{{{labels[name]},le="{bound}"}} {count}'
+                        for bound, count in histogram.cumulative_buckets()
+                    )
+                    lines.append(f"{metric_name}_sum{{{labels[name]}}} {histogram.sum}")
+                    lines.append(
+                        f"{metric_name}_count{{{labels[name]}}} {histogram.count}"
+                    )
+        return "\n".join(lines) + "\n"
+
+
+@callback
+@singleton(DATA_REQUEST_METRICS)
+def async_get_request_metrics(hass: HomeAssistant) -> RequestMetricsRegistry:
+    """Return the request metrics registry."""
+    return RequestMetricsRegistry()
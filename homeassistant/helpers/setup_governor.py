@@ -0,0 +1,293 @@
+"""Limit the number of config entries set up at once during startup."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Callable, Mapping
+from contextlib import AbstractContextManager, asynccontextmanager, nullcontext
+from contextvars import ContextVar
+from enum import StrEnum
+import heapq
+from itertools import count
+import logging
+import time
+from typing import TYPE_CHECKING, Final
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .startup_trace import async_add_startup_span
+
+if TYPE_CHECKING:
+    from homeassistant.loader import Integration
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SETUP_GOVERNOR: HassKey[SetupGovernor] = HassKey("setup_governor")
+
+
+class ResourceClass(StrEnum):
+    """Resource the setup of an integration mostly waits for."""
+
+    SERIAL = "serial"
+    """Serial hardware, such as Zigbee and Z-Wave sticks."""
+    LOCAL = "local"
+    """Devices and services on the local network."""
+    CLOUD = "cloud"
+    """Cloud services, most of them polled with blocking libraries in the executor."""
+
+
+# Order of the resource classes when the priorities are the same,
+# so the local integrations start first
+_RESOURCE_CLASS_RANK: Final = {
+    resource_class: rank for rank, resource_class in enumerate(ResourceClass)
+}
+
+# Maximum number of config entries set up at once per resource class,
+# the classes not listed are not limited
+MAX_CONCURRENT_SETUPS: Final = {
+    ResourceClass.SERIAL: 2,
+    ResourceClass.CLOUD: 6,
+}
+
+# Seconds a config entry setup holds its slot, a setup still running after
+# it, like one waiting for an unreachable cloud service, continues without
+# a slot so it can't starve the other setups of its resource class
+MAX_SLOT_TIME: Final = 30
+
+# Set while a config entry holds a slot, the setups it starts never wait
+# for a slot so they can't wait for their own parent
+_holding_slot: ContextVar[bool] = ContextVar(
+    "setup_governor_holding_slot", default=False
+)
+
+
+def integration_resource_class(integration: Integration) -> ResourceClass:
+    """Return the resource class of an integration from its manifest."""
+    if integration.usb:
+        return ResourceClass.SERIAL
+    if (iot_class := integration.iot_class) is not None and iot_class.startswith(
+        "cloud"
+    ):
+        return ResourceClass.CLOUD
+    return ResourceClass.LOCAL
+
+
+class SetupGovernor:
+    """Queue the config entry setups of the resource classes that are limited.
+
+    Queued setups start by the priority set by the user, then by the
+    number of integrations depending on them, so the setups on the
+    critical path of the startup go first.
+    """
+
+    __slots__ = (
+        "_dependents",
+        "_hass",
+        "_priorities",
+        "_queues",
+        "_resource_classes",
+        "_running",
+        "_sequence",
+        "active",
+        "queue_waits",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        priorities: Mapping[str, int],
+        dependents: Mapping[str, int],
+        resource_classes: Mapping[str, ResourceClass],
+    ) -> None:
+        """Initialize the governor."""
+        self._hass = hass
+        self._priorities = priorities
+        self._dependents = dependents
+        self._resource_classes = resource_classes
+        self._queues: dict[
+            ResourceClass, list[tuple[int, int, int, int, asyncio.Future[None]]]
+        ] = {resource_class: [] for resource_class in ResourceClass}
+        self._running = dict.fromkeys(ResourceClass, 0)
+        self._sequence = count()
+        self.active = True
+        self.queue_waits: dict[str, float] = {}
+
+    @callback
+    def async_sort_key(self, domain: str) -> tuple[int, int, int]:
+        """Return the key to sort domains in the order they should be set up."""
+        return (
+            -self._priorities.get(domain, 0),
+            _RESOURCE_CLASS_RANK[
+                self._resource_classes.get(domain, ResourceClass.LOCAL)
+            ],
+            -self._dependents.get(domain, 0),
+        )
+
+    @asynccontextmanager
+    async def async_slot(
+        self,
+        integration: Integration,
+        name: str,
+        pause: Callable[[], AbstractContextManager[None]] = nullcontext,
+    ) -> AsyncGenerator[None]:
+        """Hold a slot of the resource class of an integration.
+
+        The wait for a slot runs in the pause context, so it can be left out
+        of the setup time. The slot is released after MAX_SLOT_TIME.
+        """
+        resource_class = self._resource_classes.get(
+            integration.domain
+        ) or integration_resource_class(integration)
+        if (
+            not self.active
+            or (limit := MAX_CONCURRENT_SETUPS.get(resource_class)) is None
+            or _holding_slot.get()
+        ):
+            yield
+            return
+
+        if self._running[resource_class] < limit:
+            self._running[resource_class] += 1
+        else:
+            with pause():
+                await self._async_wait_for_slot(
+                    integration.domain, resource_class, name
+                )
+
+        released = False
+
+        @callback
+        def _async_release_slot() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                self._release(resource_class)
+
+        @callback
+        def _async_slot_expired() -> None:
+            _LOGGER.debug(
+                "Setup of %s is still running after %s seconds, releasing its slot",
+                name,
+                MAX_SLOT_TIME,
+            )
+            _async_release_slot()
+
+        timer = self._hass.loop.call_later(MAX_SLOT_TIME, _async_slot_expired)
+        token = _holding_slot.set(True)
+        try:
+            yield
+        finally:
+            _holding_slot.reset(token)
+            timer.cancel()
+            _async_release_slot()
+
+    async def _async_wait_for_slot(
+        self, domain: str, resource_class: ResourceClass, name: str
+    ) -> None:
+        """Wait until a setup of the same resource class hands over its slot."""
+        start = time.monotonic()
+        future: asyncio.Future[None] = self._hass.loop.create_future()
+        heapq.heappush(
+            self._queues[resource_class],
+            (*self.async_sort_key(domain), next(self._sequence), future),
+        )
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over before the setup was cancelled
+                self._release(resource_class)
+            raise
+        wait = time.monotonic() - start
+        self.queue_waits[name] = wait
+        async_add_startup_span(
+            self._hass,
+            "queue",
+            "wait for setup slot",
+            domain,
+            start,
+            wait,
+            {"resource_class": resource_class},
+        )
+
+    @callback
+    def _release(self, resource_class: ResourceClass) -> None:
+        """Hand over a slot to the next queued setup."""
+        queue = self._queues[resource_class]
+        while queue:
+            future = heapq.heappop(queue)[-1]
+            if not future.done():
+                future.set_result(None)
+                return
+        self._running[resource_class] -= 1
+
+    @callback
+    def async_stop(self, _event: Event | None = None) -> None:
+        """Stop limiting the setups and start the queued ones."""
+        self.active = False
+        for resource_class, queue in self._queues.items():
+            while queue:
+                future = heapq.heappop(queue)[-1]
+                if not future.done():
+                    self._running[resource_class] += 1
+                    future.set_result(None)
+        if _LOGGER.isEnabledFor(logging.DEBUG) and self.queue_waits:
+            _LOGGER.debug(
+                "Config entry setup queue waits: %s",
+                dict(
+                    sorted(
+                        self.queue_waits.items(), key=lambda item: item[1], reverse=True
+                    )
+                ),
+            )
+
+
+@callback
+def async_start_setup_governor(
+    hass: HomeAssistant, integrations: Mapping[str, Integration]
+) -> SetupGovernor:
+    """Limit the config entry setups until Home Assistant has started."""
+    dependents = dict.fromkeys(integrations, 0)
+    for integration in integrations.values():
+        try:
+            all_dependencies = integration.all_dependencies
+        except RuntimeError:
+            # Dependencies could not be resolved
+            continue
+        for dependency in all_dependencies:
+            if dependency in dependents:
+                dependents[dependency] += 1
+    governor = hass.data[DATA_SETUP_GOVERNOR] = SetupGovernor(
+        hass,
+        hass.config.setup_priority,
+        dependents,
+        {
+            domain: integration_resource_class(integration)
+            for domain, integration in integrations.items()
+        },
+    )
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, governor.async_stop)
+    return governor
+
+
+@callback
+def async_get_setup_governor(hass: HomeAssistant) -> SetupGovernor | None:
+    """Return the setup governor, None if the setups are not limited."""
+    return hass.data.get(DATA_SETUP_GOVERNOR)
+
+
+@asynccontextmanager
+async def async_setup_slot(
+    hass: HomeAssistant,
+    integration: Integration,
+    name: str,
+    pause: Callable[[], AbstractContextManager[None]] = nullcontext,
+) -> AsyncGenerator[None]:
+    """Wait for a slot to set up a config entry if the setups are limited."""
+    if (governor := hass.data.get(DATA_SETUP_GOVERNOR)) is None:
+        yield
+        return
+    async with governor.async_slot(integration, name, pause):
+        yield
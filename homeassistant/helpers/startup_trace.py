@@ -0,0 +1,136 @@
+"""Timeline of the startup in the Chrome trace event format."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from contextlib import contextmanager
+import time
+from typing import Any, Final
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+DATA_STARTUP_TRACE: HassKey[StartupTrace] = HassKey("startup_trace")
+
+# Lane of the spans not owned by an integration
+BOOTSTRAP_LANE: Final = "bootstrap"
+
+
+class StartupTrace:
+    """Spans recorded from the start of the bootstrap until Home Assistant started.
+
+    Each integration gets its own lane, shown as a thread by trace
+    viewers such as Perfetto or chrome://tracing, so the integrations
+    set up in parallel and the waits between them are visible.
+    """
+
+    __slots__ = ("_events", "_lanes", "_origin", "finished")
+
+    def __init__(self) -> None:
+        """Initialize the trace."""
+        self._origin = time.monotonic()
+        self._events: list[dict[str, Any]] = []
+        self._lanes: dict[str, int] = {BOOTSTRAP_LANE: 0}
+        self.finished = False
+
+    @callback
+    def async_add(
+        self,
+        category: str,
+        name: str,
+        lane: str,
+        start: float,
+        duration: float,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Add a span with a monotonic start time and duration in seconds."""
+        if (tid := self._lanes.get(lane)) is None:
+            tid = self._lanes[lane] = len(self._lanes)
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - self._origin) * 1_000_000),
+            "dur": round(duration * 1_000_000),
+            "pid": 1,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        self._events.append(event)
+
+    @callback
+    def async_finish(self, _event: Event | None = None) -> None:
+        """Stop recording spans."""
+        self.finished = True
+
+    def as_chrome_trace(self) -> dict[str, Any]:
+        """Return the trace in the Chrome trace event format."""
+        metadata: list[dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": 1,
+                "args": {"name": "Home Assistant startup"},
+            }
+        ]
+        metadata.extend(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": tid,
+                "args": {"name": lane},
+            }
+            for lane, tid in self._lanes.items()
+        )
+        return {
+            "traceEvents": metadata + self._events,
+            "displayTimeUnit": "ms",
+        }
+
+
+@callback
+def async_start_startup_trace(hass: HomeAssistant) -> StartupTrace:
+    """Start recording the startup, until Home Assistant has started."""
+    trace = hass.data[DATA_STARTUP_TRACE] = StartupTrace()
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, trace.async_finish)
+    return trace
+
+
+@callback
+def async_get_startup_trace(hass: HomeAssistant) -> StartupTrace | None:
+    """Return the startup trace, None if the startup was not traced."""
+    return hass.data.get(DATA_STARTUP_TRACE)
+
+
+@callback
+def async_add_startup_span(
+    hass: HomeAssistant,
+    category: str,
+    name: str,
+    lane: str,
+    start: float,
+    duration: float,
+    args: dict[str, Any] | None = None,
+) -> None:
+    """Add a span to the startup trace if the startup is being traced."""
+    if (trace := hass.data.get(DATA_STARTUP_TRACE)) is not None and not trace.finished:
+        trace.async_add(category, name, lane, start, duration, args)
+
+
+@contextmanager
+def async_trace_startup(
+    hass: HomeAssistant, category: str, name: str, lane: str = BOOTSTRAP_LANE
+) -> Generator[None]:
+    """Record the time spent in the block as a span of the startup trace."""
+    if (trace := hass.data.get(DATA_STARTUP_TRACE)) is None or trace.finished:
+        yield
+        return
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        if not trace.finished:
+            trace.async_add(category, name, lane, start, time.monotonic() - start)
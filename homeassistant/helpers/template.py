@@ -39,6 +39,7 @@ import weakref
 from awesomeversion import AwesomeVersion
 import jinja2
 from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2.filters import sync_do_selectattr
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -60,6 +61,7 @@ from homeassistant.const import (
     UnitOfLength,
 )
 from homeassistant.core import (
+    INDEXED_ATTRIBUTES,
     Context,
     HomeAssistant,
     ServiceResponse,
@@ -118,6 +120,9 @@ _HASS_LOADER = "template.hass_loader"
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
 
+# Tests of the selectattr filter answered from the state machine indexes
+_INDEXED_SELECTATTR_TESTS = frozenset({"eq", "==", "equalto"})
+
 _RESERVED_NAMES = {
     "contextfunction",
     "evalcontextfunction",
@@ -932,6 +937,13 @@ class AllStates:
         self._collect_all()
         return _state_generator(self._hass, None)
 
+    def _select_by_attribute(
+        self, attribute: str, value: Any
+    ) -> Generator[TemplateState]:
+        """Return the states with an attribute set to a value."""
+        self._collect_all()
+        return _attribute_state_generator(self._hass, None, attribute, value)
+
     def __len__(self) -> int:
         """Return number of states."""
         self._collect_all_lifecycle()
@@ -1022,6 +1034,13 @@ class DomainStates:
         self._collect_domain()
         return _state_generator(self._hass, self._domain)
 
+    def _select_by_attribute(
+        self, attribute: str, value: Any
+    ) -> Generator[TemplateState]:
+        """Return the states of the domain with an attribute set to a value."""
+        self._collect_domain()
+        return _attribute_state_generator(self._hass, self._domain, attribute, value)
+
     def __len__(self) -> int:
         """Return number of states."""
         self._collect_domain_lifecycle()
@@ -1230,6 +1249,14 @@ def _state_generator(
         yield _template_state_no_collect(hass, state)
 
 
+def _attribute_state_generator(
+    hass: HomeAssistant, domain: str | None, attribute: str, value: Any
+) -> Generator[TemplateState]:
+    """State generator for the states with an attribute set to a value."""
+    for state in hass.states.async_all_with_attribute(attribute, value, domain):
+        yield _template_state_no_collect(hass, state)
+
+
 def _get_state_if_valid(hass: HomeAssistant, entity_id: str) -> TemplateState | None:
     state = hass.states.get(entity_id)
     if state is None and not valid_entity_id(entity_id):
@@ -2588,6 +2615,28 @@ def to_json(
     ).decode("utf-8")
 
 
+@pass_context
+def selectattr(
+    context: jinja2.runtime.Context, value: Any, *args: Any, **kwargs: Any
+) -> Iterable[Any]:
+    """Select objects by testing an attribute.
+
+    Selecting states by equality of an attribute the state machine is
+    indexed by only visits the matching states.
+    """
+    if (
+        isinstance(value, (AllStates, DomainStates))
+        and len(args) == 3
+        and not kwargs
+        and isinstance(args[0], str)
+        and args[1] in _INDEXED_SELECTATTR_TESTS
+        and args[0].startswith("attributes.")
+        and (attribute := args[0][11:]) in INDEXED_ATTRIBUTES
+    ):
+        return value._select_by_attribute(attribute, args[2])  # noqa: SLF001
+    return sync_do_selectattr(context, value, *args, **kwargs)
+
+
 @pass_context
 def random_every_time(context, values):
     """Choose a random value.
@@ -2894,6 +2943,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.filters["median"] = median
         self.filters["statistical_mode"] = statistical_mode
         self.filters["random"] = random_every_time
+        self.filters["selectattr"] = selectattr
         self.filters["base64_encode"] = base64_encode
         self.filters["base64_decode"] = base64_decode
         self.filters["ordinal"] = ordinal
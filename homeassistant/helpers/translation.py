@@ -105,7 +105,7 @@ async def _async_get_component_strings(
             for domain in components
             if (
                 (integration := integrations.get(domain))
-                and integration.has_translations
+                and integration.has_translation_file(file_name)
             )
         }
         files_to_load_by_language[language] = files_to_load
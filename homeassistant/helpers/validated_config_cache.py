@@ -0,0 +1,139 @@
+"""Cache of validated configuration items, reused when the items are reloaded."""
+
+from __future__ import annotations
+
+from dataclasses import is_dataclass
+import hashlib
+from typing import Any
+
+import orjson
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from . import device_registry as dr, entity_registry as er
+
+DATA_VALIDATED_CONFIG_CACHE: HassKey[dict[str, ValidatedConfigCache[Any]]] = HassKey(
+    "validated_config_cache"
+)
+
+
+def _key_default(obj: Any) -> Any:
+    """Convert the objects created by the YAML loader, such as blueprint inputs."""
+    if isinstance(obj, (set, tuple)):
+        return list(obj)
+    if is_dataclass(obj):
+        return f"!{type(obj).__name__} {obj!r}"
+    raise TypeError
+
+
+def config_key(*parts: Any) -> bytes | None:
+    """Return a hash of raw configuration, None if it can't be hashed."""
+    try:
+        data = orjson.dumps(
+            parts,
+            option=orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SORT_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS,
+            default=_key_default,
+        )
+    except TypeError:
+        return None
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class ValidatedConfigCache[_ConfigT]:
+    """Validated configuration items of a domain, keyed by their raw config.
+
+    Validating the items again when they are reloaded is only needed
+    for the items that changed. The items not used since the previous
+    full validation are dropped, so the cache doesn't grow with each
+    edit of the configuration.
+    """
+
+    __slots__ = ("_entries", "_previous")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._entries: dict[bytes, _ConfigT] = {}
+        self._previous: dict[bytes, _ConfigT] = {}
+
+    @callback
+    def async_get(self, key: bytes) -> _ConfigT | None:
+        """Return the validated config of a raw config."""
+        if (config := self._entries.get(key)) is None and (
+            config := self._previous.pop(key, None)
+        ) is not None:
+            self._entries[key] = config
+        return config
+
+    @callback
+    def async_set(self, key: bytes, config: _ConfigT) -> None:
+        """Store the validated config of a raw config."""
+        self._entries[key] = config
+
+    @callback
+    def async_start_validation(self) -> None:
+        """Start validating all the items, dropping the ones not used since the last time."""
+        self._previous = self._entries
+        self._entries = {}
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop all validated configs."""
+        self._entries = {}
+        self._previous = {}
+
+
+@callback
+def _async_setup_invalidation(
+    hass: HomeAssistant, caches: dict[str, ValidatedConfigCache[Any]]
+) -> None:
+    """Drop the validated configs when the registries they were checked with change.
+
+    Validation checks that referenced devices exist and resolves
+    entity registry ids to entity ids.
+    """
+
+    @callback
+    def _async_clear(_event: Event[Any]) -> None:
+        for cache in caches.values():
+            cache.async_clear()
+
+    @callback
+    def _device_removed_filter(
+        event_data: dr.EventDeviceRegistryUpdatedData,
+    ) -> bool:
+        return event_data["action"] == "remove"
+
+    @callback
+    def _entity_id_changed_filter(
+        event_data: er.EventEntityRegistryUpdatedData,
+    ) -> bool:
+        return event_data["action"] == "remove" or (
+            event_data["action"] == "update" and "old_entity_id" in event_data
+        )
+
+    hass.bus.async_listen(
+        dr.EVENT_DEVICE_REGISTRY_UPDATED,
+        _async_clear,
+        event_filter=_device_removed_filter,
+    )
+    hass.bus.async_listen(
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        _async_clear,
+        event_filter=_entity_id_changed_filter,
+    )
+
+
+@callback
+def async_get_validated_config_cache(
+    hass: HomeAssistant, domain: str
+) -> ValidatedConfigCache[Any]:
+    """Return the cache of validated configs of a domain."""
+    if (caches := hass.data.get(DATA_VALIDATED_CONFIG_CACHE)) is None:
+        caches = hass.data[DATA_VALIDATED_CONFIG_CACHE] = {}
+        _async_setup_invalidation(hass, caches)
+    if (cache := caches.get(domain)) is None:
+        cache = caches[domain] = ValidatedConfigCache()
+    return cache
@@ -12,9 +12,11 @@ from contextlib import suppress
 from dataclasses import dataclass
 import functools as ft
 import importlib
+from itertools import chain
 import logging
 import os
 import pathlib
+import stat
 import sys
 import time
 from types import ModuleType
@@ -29,8 +31,8 @@ from propcache import cached_property
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
-from .core import HomeAssistant, callback
+from .const import EVENT_HOMEASSISTANT_STARTED, Platform, __version__
+from .core import Event, HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.config_flows import FLOWS
@@ -40,6 +42,7 @@ from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .helpers.json import json_bytes, json_fragment
+from .helpers.startup_trace import async_add_startup_span
 from .helpers.typing import UNDEFINED
 from .util.hass_dict import HassKey
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
@@ -49,6 +52,7 @@ if TYPE_CHECKING:
     # because they would cause a circular import otherwise.
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -132,6 +136,9 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_INTEGRATION_CACHE: HassKey[IntegrationCache] = HassKey("integration_cache")
+INTEGRATION_CACHE_STORAGE_KEY = "core.integration_cache"
+INTEGRATION_CACHE_STORAGE_VERSION = 1
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -293,18 +300,19 @@ def _get_custom_components(hass: HomeAssistant) -> dict[str, Integration]:
     except ImportError:
         return {}
 
-    dirs = [
-        entry
-        for path in custom_components.__path__
-        for entry in pathlib.Path(path).iterdir()
-        if entry.is_dir()
-    ]
+    cache = hass.data.get(DATA_INTEGRATION_CACHE)
+    domains: list[str] = []
+    for path in custom_components.__path__:
+        if cache is not None and (cached := cache.custom_dirs.get(path)) is not None:
+            domains.extend(cached[1])
+            continue
+        mtime = os.stat(path).st_mtime_ns
+        dirs = [entry.name for entry in pathlib.Path(path).iterdir() if entry.is_dir()]
+        if cache is not None:
+            cache.custom_dirs[path] = (mtime, dirs)
+        domains.extend(dirs)
 
-    integrations = _resolve_integrations_from_root(
-        hass,
-        custom_components,
-        [comp.name for comp in dirs],
-    )
+    integrations = _resolve_integrations_from_root(hass, custom_components, domains)
     return {
         integration.domain: integration
         for integration in integrations.values()
@@ -652,32 +660,18 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        pkg_path = f"{root_module.__name__}.{domain}"
+        cache = hass.data.get(DATA_INTEGRATION_CACHE)
         for base in root_module.__path__:
-            manifest_path = pathlib.Path(base) / domain / "manifest.json"
-
-            if not manifest_path.is_file():
+            file_path = pathlib.Path(base) / domain
+            integration = None
+            if cache is not None:
+                integration = cache.get_integration(hass, pkg_path, file_path)
+            if integration is None:
+                integration = cls._read_from_directory(hass, pkg_path, file_path)
+            if integration is None:
                 continue
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
-
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
-            integration = cls(
-                hass,
-                f"{root_module.__name__}.{domain}",
-                file_path,
-                manifest,
-                None if is_virtual else set(os.listdir(file_path)),
-            )
-
             if not integration.import_executor:
                 _LOGGER.warning(IMPORT_EVENT_LOOP_WARNING, integration.domain)
 
@@ -741,6 +735,40 @@ class Integration:
 
         return None
 
+    @classmethod
+    def _read_from_directory(
+        cls, hass: HomeAssistant, pkg_path: str, file_path: pathlib.Path
+    ) -> Integration | None:
+        """Read an integration from its directory."""
+        manifest_path = file_path / "manifest.json"
+
+        # Stat before reading, so an edit while reading invalidates the cache
+        if (manifest_stat := _stat(str(manifest_path))) is None:
+            return None
+
+        mtime = os.stat(file_path).st_mtime_ns
+        try:
+            manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+        except JSON_DECODE_EXCEPTIONS as err:
+            _LOGGER.error(
+                "Error parsing manifest.json file at %s: %s", manifest_path, err
+            )
+            return None
+
+        # Avoid the listdir for virtual integrations
+        # as they cannot have any platforms
+        is_virtual = manifest.get("integration_type") == "virtual"
+        integration = cls(
+            hass,
+            pkg_path,
+            file_path,
+            manifest,
+            None if is_virtual else set(os.listdir(file_path)),
+        )
+        integration.mtime = mtime
+        integration.manifest_stat = manifest_stat
+        return integration
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -748,6 +776,8 @@ class Integration:
         file_path: pathlib.Path,
         manifest: Manifest,
         top_level_files: set[str] | None = None,
+        translation_files: set[str] | None = None,
+        all_dependencies: set[str] | None = None,
     ) -> None:
         """Initialize an integration."""
         self.hass = hass
@@ -757,7 +787,10 @@ class Integration:
         manifest["is_built_in"] = self.is_built_in
         manifest["overwrites_built_in"] = self.overwrites_built_in
 
-        if self.dependencies:
+        if all_dependencies is not None:
+            self._all_dependencies_resolved = True
+            self._all_dependencies = all_dependencies
+        elif self.dependencies:
             self._all_dependencies_resolved: bool | None = None
             self._all_dependencies: set[str] | None = None
         else:
@@ -770,6 +803,13 @@ class Integration:
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
         self._top_level_files = top_level_files or set()
+        # Files in the translations directory, None if not listed yet
+        self.translation_files = translation_files
+        # Modification time of the integration directory and modification
+        # time and size of the manifest when the manifest was read, None if
+        # it is not backed by a directory
+        self.mtime: int | None = None
+        self.manifest_stat: list[int] | None = None
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
     @cached_property
@@ -861,6 +901,12 @@ class Integration:
         """Return if the integration has translations."""
         return "translations" in self._top_level_files
 
+    def has_translation_file(self, file_name: str) -> bool:
+        """Return if the integration may have a translation file."""
+        return self.has_translations and (
+            self.translation_files is None or file_name in self.translation_files
+        )
+
     @cached_property
     def has_services(self) -> bool:
         """Return if the integration has services."""
@@ -991,6 +1037,7 @@ class Integration:
 
         if debug := _LOGGER.isEnabledFor(logging.DEBUG):
             start = time.perf_counter()
+        trace_start = time.monotonic()
 
         # Some integrations fail on import because they call functions incorrectly.
         # So we do it before validating config to catch these errors.
@@ -1000,6 +1047,7 @@ class Integration:
         )
         if not load_executor:
             comp = self._get_component()
+            self._async_add_import_span("import", trace_start, load_executor)
             if debug:
                 _LOGGER.debug(
                     "Component %s import took %.3f seconds (loaded_executor=False)",
@@ -1035,6 +1083,7 @@ class Integration:
             raise
         finally:
             self._component_future = None
+            self._async_add_import_span("import", trace_start, load_executor)
 
         if debug:
             _LOGGER.debug(
@@ -1046,6 +1095,21 @@ class Integration:
 
         return comp
 
+    @callback
+    def _async_add_import_span(
+        self, name: str, start: float, load_executor: bool
+    ) -> None:
+        """Add an import to the startup trace."""
+        async_add_startup_span(
+            self.hass,
+            "import",
+            name,
+            self.domain,
+            start,
+            time.monotonic() - start,
+            {"executor": load_executor},
+        )
+
     def get_component(self) -> ComponentProtocol:
         """Return the component.
 
@@ -1146,6 +1210,7 @@ class Integration:
         if load_executor_platforms or load_event_loop_platforms:
             if debug := _LOGGER.isEnabledFor(logging.DEBUG):
                 start = time.perf_counter()
+            trace_start = time.monotonic()
 
             try:
                 if load_executor_platforms:
@@ -1187,6 +1252,11 @@ class Integration:
             finally:
                 for platform_name, _ in import_futures:
                     self._import_futures.pop(platform_name)
+                self._async_add_import_span(
+                    f"import {', '.join(name for name, _ in import_futures)}",
+                    trace_start,
+                    bool(load_executor_platforms),
+                )
 
                 if debug:
                     _LOGGER.debug(
@@ -1434,6 +1504,245 @@ async def async_get_integrations(
     return results
 
 
+class IntegrationCache:
+    """Integrations resolved by the previous run, stored on disk.
+
+    An integration is reused if the modification time of its directory,
+    which changes when files are added, removed or replaced, and the
+    modification time and size of its manifest.json, which change when it
+    is edited in place, are the same. The listing of its translations
+    directory is validated the same way when the integration is resolved.
+    The whole cache is discarded when Home Assistant is updated, and the
+    dependency closures when any integration or custom_components
+    directory changed.
+    """
+
+    __slots__ = (
+        "_data",
+        "_entries",
+        "_hass",
+        "_store",
+        "_translations",
+        "custom_dirs",
+        "dependencies",
+    )
+
+    def __init__(
+        self, hass: HomeAssistant, store: Store[dict[str, Any]], data: dict[str, Any]
+    ) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._store = store
+        # Stored data, to skip writing it again when nothing changed
+        self._data = data
+        self._entries: dict[str, dict[str, Any]] = {}
+        # Validated translations directories, pkg_path -> modification time
+        # and the modification time and size of their files
+        self._translations: dict[str, tuple[int, dict[str, list[int]]]] = {}
+        self.custom_dirs: dict[str, tuple[int, list[str]]] = {}
+        self.dependencies: dict[str, list[str]] = {}
+
+    def validate(self) -> None:
+        """Keep the entries that did not change since they were stored.
+
+        This method must be run in the executor.
+        """
+        data = self._data
+        fresh = True
+        for pkg_path, entry in data["integrations"].items():
+            path = entry["path"]
+            if (
+                _mtime(path) != entry["mtime"]
+                or _stat(os.path.join(path, "manifest.json")) != entry["manifest_stat"]
+            ):
+                fresh = False
+                continue
+            self._entries[pkg_path] = entry
+        for path, custom in data["custom_components"].items():
+            if _mtime(path) != custom["mtime"]:
+                fresh = False
+                continue
+            self.custom_dirs[path] = (custom["mtime"], custom["dirs"])
+        if fresh:
+            self.dependencies = dict(data["dependencies"])
+
+    def get_integration(
+        self, hass: HomeAssistant, pkg_path: str, file_path: pathlib.Path
+    ) -> Integration | None:
+        """Return a cached integration, None if it is not cached.
+
+        This method must be run in the executor.
+        """
+        if (entry := self._entries.get(pkg_path)) is None or entry["path"] != str(
+            file_path
+        ):
+            return None
+        translation_files: set[str] | None = None
+        if (translations := entry["translations"]) is not None:
+            translations_path = os.path.join(entry["path"], "translations")
+            files: dict[str, list[int]] = translations["files"]
+            if _mtime(translations_path) == translations["mtime"] and all(
+                _stat(os.path.join(translations_path, name)) == file_stat
+                for name, file_stat in files.items()
+            ):
+                self._translations[pkg_path] = (translations["mtime"], files)
+                translation_files = set(files)
+        manifest: Manifest = entry["manifest"]
+        all_dependencies: set[str] | None = None
+        if (dependencies := self.dependencies.get(manifest["domain"])) is not None:
+            all_dependencies = set(dependencies)
+        integration = Integration(
+            hass,
+            pkg_path,
+            file_path,
+            manifest,
+            set(entry["files"]),
+            translation_files,
+            all_dependencies,
+        )
+        integration.mtime = entry["mtime"]
+        integration.manifest_stat = entry["manifest_stat"]
+        return integration
+
+    async def async_save(self, _event: Event) -> None:
+        """Store the integrations resolved by this run."""
+        hass = self._hass
+        custom = hass.data.get(DATA_CUSTOM_COMPONENTS)
+        integrations = [
+            integration
+            for integration in chain(
+                hass.data[DATA_INTEGRATIONS].values(),
+                custom.values() if isinstance(custom, dict) else (),
+            )
+            if type(integration) is Integration and integration.mtime is not None
+        ]
+        if to_list := [
+            integration
+            for integration in integrations
+            if integration.has_translations and integration.translation_files is None
+        ]:
+            listed = await hass.async_add_executor_job(
+                _list_translations,
+                [integration.file_path for integration in to_list],
+            )
+            for integration, (mtime, files) in zip(to_list, listed, strict=True):
+                if mtime is not None:
+                    integration.translation_files = set(files)
+                    self._translations[integration.pkg_path] = (mtime, files)
+
+        entries = self._entries
+        dependencies = self.dependencies
+        for integration in integrations:
+            pkg_path = integration.pkg_path
+            translations: dict[str, Any] | None = None
+            if (
+                listing := self._translations.get(pkg_path)
+            ) is not None and integration.translation_files is not None:
+                translations = {"mtime": listing[0], "files": listing[1]}
+            entries[pkg_path] = {
+                "path": str(integration.file_path),
+                "mtime": integration.mtime,
+                "manifest_stat": integration.manifest_stat,
+                "manifest": integration.manifest,
+                "files": sorted(integration._top_level_files),  # noqa: SLF001
+                "translations": translations,
+            }
+            if integration.dependencies and integration.all_dependencies_resolved:
+                with suppress(RuntimeError):
+                    dependencies[integration.domain] = sorted(
+                        integration.all_dependencies
+                    )
+
+        data = {
+            "ha_version": __version__,
+            "integrations": entries,
+            "custom_components": {
+                path: {"mtime": mtime, "dirs": dirs}
+                for path, (mtime, dirs) in self.custom_dirs.items()
+            },
+            "dependencies": dependencies,
+        }
+        if data != self._data:
+            self._data = data
+            await self._store.async_save(data)
+
+
+def _mtime(path: str) -> int | None:
+    """Return the modification time of a path, None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _stat(path: str) -> list[int] | None:
+    """Return the modification time and size of a file, None if it is not a file."""
+    try:
+        result = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(result.st_mode):
+        return None
+    return [result.st_mtime_ns, result.st_size]
+
+
+def _list_translations(
+    paths: list[pathlib.Path],
+) -> list[tuple[int | None, dict[str, list[int]]]]:
+    """List the files of the translations directories of integrations.
+
+    The files are returned with their modification time and size.
+    """
+    listed: list[tuple[int | None, dict[str, list[int]]]] = []
+    for path in paths:
+        translations_path = str(path / "translations")
+        mtime = _mtime(translations_path)
+        files: dict[str, list[int]] = {}
+        try:
+            names = os.listdir(translations_path)
+        except OSError:
+            mtime = None
+        else:
+            for name in names:
+                if (
+                    file_stat := _stat(os.path.join(translations_path, name))
+                ) is not None:
+                    files[name] = file_stat
+        listed.append((mtime, files))
+    return listed
+
+
+async def async_load_integration_cache(hass: HomeAssistant) -> None:
+    """Load the integrations resolved by the previous run.
+
+    The cache is stored again once Home Assistant has started.
+    """
+    if hass.config.recovery_mode or hass.config.safe_mode:
+        return
+
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    store = Store[dict[str, Any]](
+        hass,
+        INTEGRATION_CACHE_STORAGE_VERSION,
+        INTEGRATION_CACHE_STORAGE_KEY,
+        atomic_writes=True,
+    )
+    data = await store.async_load()
+    cache = IntegrationCache(hass, store, {})
+    if data is not None and data.get("ha_version") == __version__:
+        validated = IntegrationCache(hass, store, data)
+        try:
+            await hass.async_add_executor_job(validated.validate)
+        except (KeyError, TypeError, AttributeError):
+            _LOGGER.warning("Ignoring invalid integration cache")
+        else:
+            cache = validated
+    hass.data[DATA_INTEGRATION_CACHE] = cache
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, cache.async_save)
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
@@ -14,10 +14,12 @@ from typing import Any
 import packaging.tags
 
 from . import bootstrap
-from .core import callback
+from .const import EVENT_HOMEASSISTANT_FINAL_WRITE, EVENT_HOMEASSISTANT_STARTED
+from .core import Event, HomeAssistant, callback
 from .helpers.frame import warn_use
 from .util.executor import InterruptibleThreadPoolExecutor
 from .util.thread import deadlock_safe_shutdown
+from .util.yaml.cache import enable_yaml_cache, save_yaml_cache
 
 #
 # Some Python versions may have different number of workers by default
@@ -119,17 +121,34 @@ def _async_loop_exception_handler(_: Any, context: dict[str, Any]) -> None:
 
 async def setup_and_run_hass(runtime_config: RuntimeConfig) -> int:
     """Set up Home Assistant and run."""
+    # Reuse the YAML files parsed by the previous run
+    await asyncio.get_running_loop().run_in_executor(
+        None, enable_yaml_cache, runtime_config.config_dir
+    )
     hass = await bootstrap.async_setup_hass(runtime_config)
 
     if hass is None:
         return 1
 
+    _async_save_yaml_cache_on(hass, EVENT_HOMEASSISTANT_STARTED)
+    _async_save_yaml_cache_on(hass, EVENT_HOMEASSISTANT_FINAL_WRITE)
+
     # threading._shutdown can deadlock forever
     threading._shutdown = deadlock_safe_shutdown  # type: ignore[attr-defined]  # noqa: SLF001
 
     return await hass.async_run()
 
 
+@callback
+def _async_save_yaml_cache_on(hass: HomeAssistant, event_type: str) -> None:
+    """Store the parsed YAML files when an event is fired."""
+
+    async def _async_save_yaml_cache(_event: Event) -> None:
+        await hass.async_add_executor_job(save_yaml_cache, hass.config.config_dir)
+
+    hass.bus.async_listen_once(event_type, _async_save_yaml_cache)
+
+
 def _enable_posix_spawn() -> None:
     """Enable posix_spawn on Alpine Linux."""
     if subprocess._USE_POSIX_SPAWN:  # noqa: SLF001
@@ -8,6 +8,7 @@ from collections.abc import Callable
 from contextlib import suppress
 import logging
 from timeit import default_timer as timer
+import tracemalloc
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -84,6 +85,67 @@ async def fire_events(hass):
     return timer() - start
 
 
+async def _fire_event_bursts(hass, event_name, events_to_fire):
+    """Fire events in bursts of a hundred per event loop iteration."""
+    for _ in range(events_to_fire // 100):
+        for _ in range(100):
+            hass.bus.async_fire(event_name)
+        await asyncio.sleep(0)
+    await hass.async_block_till_done()
+
+
+@benchmark
+async def fire_events_per_event(hass):
+    """Fire 100k events in bursts to a listener counting each event."""
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(event):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    hass.bus.async_listen(event_name, listener)
+
+    start = timer()
+
+    await _fire_event_bursts(hass, event_name, events_to_fire)
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def fire_events_batched(hass):
+    """Fire 100k events in bursts to a batched listener counting each batch.
+
+    The listener does the same work per call as the one of
+    fire_events_per_event, so the difference is the cost of the calls.
+    """
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(events):
+        """Handle events."""
+        nonlocal count
+        count += len(events)
+
+    hass.bus.async_listen_batched(event_name, listener)
+
+    start = timer()
+
+    await _fire_event_bursts(hass, event_name, events_to_fire)
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def fire_events_with_filter(hass):
     """Fire a million events with a filter that rejects them."""
@@ -308,3 +370,84 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def state_attributes_memory(hass):
+    """Set the states of 25k entities with the same static attributes twice."""
+    entity_count = 25000
+    attributes = {
+        "unit_of_measurement": "W",
+        "device_class": "power",
+        "state_class": "measurement",
+        "icon": "mdi:flash",
+    }
+
+    tracemalloc.start()
+    start = timer()
+    for value in range(2):
+        for idx in range(entity_count):
+            # Integrations build new dicts for every state write
+            hass.states.async_set(f"sensor.power_{idx}", str(value), dict(attributes))
+    runtime = timer() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    interner = hass.states.attributes_interner
+    print(
+        f"{current / 1024 / 1024:.1f} MiB allocated for {entity_count} states,"
+        f" {interner.hits} attribute mappings shared, {interner.misses} created"
+    )
+    return runtime
+
+
+@benchmark
+async def state_attributes_cpu(hass):
+    """Set the states of 5k entities with the same nested attributes 10 times."""
+    entity_count = 5000
+    attributes = {
+        "unit_of_measurement": "W",
+        "device_class": "power",
+        "state_class": "measurement",
+        "options": ["low", "medium", "high"],
+        "hs_color": (30.0, 100.0),
+        "effect_list": {"colorloop": [1, 2], "random": [3, 4]},
+    }
+
+    start = timer()
+    for value in range(10):
+        for idx in range(entity_count):
+            # Integrations build new dicts for every state write
+            hass.states.async_set(f"sensor.power_{idx}", str(value), dict(attributes))
+    runtime = timer() - start
+
+    interner = hass.states.attributes_interner
+    print(f"{interner.hits} attribute mappings shared, {interner.misses} created")
+    return runtime
+
+
+@benchmark
+async def state_attributes_unique(hass):
+    """Set the states of 5k entities with attributes that change every time."""
+    entity_count = 5000
+    attributes = {
+        "unit_of_measurement": "W",
+        "device_class": "power",
+        "state_class": "measurement",
+        "options": ["low", "medium", "high"],
+    }
+
+    start = timer()
+    for value in range(10):
+        for idx in range(entity_count):
+            # No two entities ever have the same attributes
+            hass.states.async_set(
+                f"sensor.power_{idx}",
+                str(value),
+                {**attributes, "voltage": value * entity_count + idx},
+            )
+    runtime = timer() - start
+
+    interner = hass.states.attributes_interner
+    print(f"{interner.hits} attribute mappings shared, {interner.misses} created")
+    return runtime
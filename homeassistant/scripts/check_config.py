@@ -24,6 +24,7 @@ from homeassistant.helpers import (
 )
 from homeassistant.helpers.check_config import async_check_ha_config_file
 from homeassistant.util.yaml import Secrets
+from homeassistant.util.yaml.cache import disable_yaml_cache, enable_yaml_cache
 import homeassistant.util.yaml.loader as yaml_loader
 
 # mypy: allow-untyped-calls, allow-untyped-defs
@@ -91,7 +92,8 @@ def run(script_args: list) -> int:
 
     print(color("bold", "Testing configuration at", config_dir))
 
-    res = check(config_dir, args.secrets)
+    # Files loaded from the cache are not listed, as their includes are not loaded
+    res = check(config_dir, args.secrets, yaml_cache=not args.files)
 
     domain_info: list[str] = []
     if args.info:
@@ -168,8 +170,13 @@ def run(script_args: list) -> int:
     return len(res["except"])
 
 
-def check(config_dir, secrets=False):
-    """Perform a check by mocking hass load functions."""
+def check(config_dir, secrets=False, yaml_cache=False):
+    """Perform a check by mocking hass load functions.
+
+    With yaml_cache, files parsed by Home Assistant are loaded from its
+    YAML cache, unless the used secrets are shown as they are only seen
+    by the parser. The cache is not stored.
+    """
     logging.getLogger("homeassistant.loader").setLevel(logging.CRITICAL)
     res: dict[str, Any] = {
         "yaml_files": OrderedDict(),  # yaml_files loaded
@@ -218,6 +225,9 @@ def check(config_dir, secrets=False):
         res["secret_cache"] = secrets._cache  # noqa: SLF001
         return secrets
 
+    if yaml_cache and not secrets:
+        enable_yaml_cache(config_dir)
+
     try:
         with patch.object(yaml_loader, "Secrets", secrets_proxy):
             res["components"] = asyncio.run(async_check_config(config_dir))
@@ -240,6 +250,7 @@ def check(config_dir, secrets=False):
         print(color("red", "Fatal error while loading config:"), str(err))
         res["except"].setdefault(ERROR_STR, []).append(str(err))
     finally:
+        disable_yaml_cache()
         # Stop all patches
         for pat in PATCHES.values():
             pat.stop()
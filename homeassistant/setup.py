@@ -12,7 +12,7 @@ from functools import partial
 import logging.handlers
 import time
 from types import ModuleType
-from typing import Any, Final, TypedDict
+from typing import TYPE_CHECKING, Any, Final, TypedDict
 
 from . import config as conf_util, core, loader, requirements
 from .const import (
@@ -31,10 +31,15 @@ from .core import (
 from .exceptions import DependencyError, HomeAssistantError
 from .helpers import issue_registry as ir, singleton, translation
 from .helpers.issue_registry import IssueSeverity, async_create_issue
+from .helpers.setup_governor import async_setup_slot
+from .helpers.startup_trace import async_add_startup_span, async_trace_startup
 from .helpers.typing import ConfigType
 from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
 
+if TYPE_CHECKING:
+    from .config_entries import ConfigEntry
+
 current_setup_group: contextvars.ContextVar[tuple[str, str | None] | None] = (
     contextvars.ContextVar("current_setup_group", default=None)
 )
@@ -336,9 +341,10 @@ async def _async_setup_component(
         log_error(f"Unable to import component: {err}", err)
         return False
 
-    integration_config_info = await conf_util.async_process_component_config(
-        hass, config, integration, component
-    )
+    with async_trace_startup(hass, "config", "validate config", domain):
+        integration_config_info = await conf_util.async_process_component_config(
+            hass, config, integration, component
+        )
     conf_util.async_handle_component_errors(hass, integration_config_info, integration)
     processed_config = conf_util.async_drop_config_annotations(
         integration_config_info, integration
@@ -461,7 +467,7 @@ async def _async_setup_component(
         await asyncio.gather(
             *(
                 create_eager_task(
-                    entry.async_setup_locked(hass, integration=integration),
+                    _async_setup_config_entry(hass, entry, integration),
                     name=(
                         f"config entry setup {entry.title} {entry.domain} "
                         f"{entry.entry_id}"
@@ -482,6 +488,21 @@ async def _async_setup_component(
     return True
 
 
+async def _async_setup_config_entry(
+    hass: core.HomeAssistant,
+    entry: ConfigEntry,
+    integration: loader.Integration,
+) -> None:
+    """Set up a config entry once the setups of its resource class allow it."""
+    async with async_setup_slot(
+        hass,
+        integration,
+        f"{entry.domain} {entry.title}",
+        partial(async_pause_setup, hass, SetupPhases.WAIT_SETUP_SLOT),
+    ):
+        await entry.async_setup_locked(hass, integration=integration)
+
+
 async def async_prepare_setup_platform(
     hass: core.HomeAssistant, hass_config: ConfigType, domain: str, platform_name: str
 ) -> ModuleType | None:
@@ -568,15 +589,17 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
-    if failed_deps := await _async_process_dependencies(hass, config, integration):
+    domain = integration.domain
+    with async_trace_startup(hass, "wait", "wait for dependencies", domain):
+        failed_deps = await _async_process_dependencies(hass, config, integration)
+    if failed_deps:
         raise DependencyError(failed_deps)
 
-    async with hass.timeout.async_freeze(integration.domain):
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+    async with hass.timeout.async_freeze(domain):
+        with async_trace_startup(hass, "requirements", "requirements", domain):
+            await requirements.async_get_integration_with_requirements(hass, domain)
 
-    processed.add(integration.domain)
+    processed.add(domain)
 
 
 @core.callback
@@ -677,6 +700,8 @@ class SetupPhases(StrEnum):
     """Wait time for the platforms to import."""
     WAIT_IMPORT_PACKAGES = "wait_import_packages"
     """Wait time for the packages to import."""
+    WAIT_SETUP_SLOT = "wait_setup_slot"
+    """Wait time for a slot to set up a config entry during startup."""
 
 
 @singleton.singleton(DATA_SETUP_STARTED)
@@ -711,6 +736,7 @@ def async_pause_setup(hass: core.HomeAssistant, phase: SetupPhases) -> Generator
     finally:
         time_taken = time.monotonic() - started
         integration, group = running
+        async_add_startup_span(hass, "wait", phase, integration, started, time_taken)
         # Add negative time for the time we waited
         _setup_times(hass)[integration][group][phase] = -time_taken
         _LOGGER.debug(
@@ -772,6 +798,15 @@ def async_start_setup(
     finally:
         time_taken = time.monotonic() - started
         del setup_started[current]
+        async_add_startup_span(
+            hass,
+            "setup",
+            str(phase) if group is None else f"{phase} ({group})",
+            integration,
+            started,
+            time_taken,
+            None if group is None else {"group": group},
+        )
         group_setup_times = _setup_times(hass)[integration][group]
         # We may see the phase multiple times if there are multiple
         # platforms, but we only care about the longest time.
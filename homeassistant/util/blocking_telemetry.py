@@ -0,0 +1,223 @@
+"""Telemetry of the blocking calls done in the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import sys
+import threading
+from time import monotonic
+from types import FrameType
+from typing import Any, Final
+
+from .loop_time import CORE_DOMAIN, module_domain
+
+# Maximum number of stack fingerprints kept, the least recently seen
+# fingerprint is dropped when a new one is recorded
+MAX_FINGERPRINTS: Final = 256
+# Number of frames of the stack the fingerprint is made of
+FINGERPRINT_DEPTH: Final = 8
+# Iterations of the event loop taking longer are sampled, in seconds
+SLOW_ITERATION_THRESHOLD: Final = 0.25
+# Interval of the heartbeat the loop runs to detect slow iterations
+HEARTBEAT_INTERVAL: Final = 0.05
+
+# Name of the blocking calls found by sampling slow loop iterations
+SLOW_ITERATION: Final = "slow event loop iteration"
+
+
+@dataclass(slots=True)
+class BlockingCallStats:
+    """Count and time of the blocking calls with the same stack fingerprint."""
+
+    function: str
+    integration: str
+    location: str
+    count: int = 0
+    time: float = 0
+    max_time: float = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats as a dict."""
+        return {
+            "function": self.function,
+            "integration": self.integration,
+            "location": self.location,
+            "count": self.count,
+            "time": self.time,
+            "max_time": self.max_time,
+        }
+
+
+def _fingerprint(function: str, frame: FrameType) -> tuple[str, str, str]:
+    """Return the fingerprint, owning integration and location of a stack."""
+    location = f"{frame.f_code.co_filename}, line {frame.f_lineno}"
+    hasher = hashlib.blake2b(function.encode(), digest_size=8)
+    integration: str | None = None
+    depth = 0
+    current: FrameType | None = frame
+    while current is not None and (integration is None or depth < FINGERPRINT_DEPTH):
+        if depth < FINGERPRINT_DEPTH:
+            hasher.update(f"{current.f_code.co_filename}:{current.f_lineno}".encode())
+            depth += 1
+        if (
+            integration is None
+            and (domain := module_domain(current.f_globals.get("__name__")))
+            != CORE_DOMAIN
+        ):
+            # The innermost integration owns the call
+            integration = domain
+        current = current.f_back
+    return hasher.hexdigest(), integration or CORE_DOMAIN, location
+
+
+class BlockingCallTelemetry:
+    """Bounded store of the blocking calls done in the event loop.
+
+    The calls patched by block_async_io are timed where they are done.
+    Blocking code that is not patched is found by a watchdog thread
+    checking the heartbeat of the loop: when an iteration overruns the
+    threshold, the stack of the loop thread is sampled and the time of
+    the whole iteration is recorded for the sampled stack.
+    """
+
+    __slots__ = (
+        "_beat_due",
+        "_beat_handle",
+        "_lock",
+        "_loop",
+        "_loop_thread_id",
+        "_sample",
+        "_stats",
+        "_stop",
+        "dropped",
+        "threshold",
+    )
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        threshold: float = SLOW_ITERATION_THRESHOLD,
+    ) -> None:
+        """Initialize the telemetry, must be called from the loop thread."""
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._lock = threading.Lock()
+        self._stats: OrderedDict[str, BlockingCallStats] = OrderedDict()
+        self._beat_due = monotonic()
+        self._beat_handle: asyncio.TimerHandle | None = None
+        self._sample: tuple[str, str, str] | None = None
+        self._stop = threading.Event()
+        self.dropped = 0
+        self.threshold = threshold
+
+    def record(self, function: str, frame: FrameType, duration: float) -> None:
+        """Record a blocking call done by a frame."""
+        self._record(function, _fingerprint(function, frame), duration)
+
+    def _record(
+        self, function: str, fingerprint: tuple[str, str, str], duration: float
+    ) -> None:
+        """Add a blocking call to the stats of its fingerprint."""
+        key, integration, location = fingerprint
+        with self._lock:
+            if (stats := self._stats.get(key)) is None:
+                if len(self._stats) >= MAX_FINGERPRINTS:
+                    self._stats.popitem(last=False)
+                    self.dropped += 1
+                stats = self._stats[key] = BlockingCallStats(
+                    function, integration, location
+                )
+            else:
+                self._stats.move_to_end(key)
+            stats.count += 1
+            stats.time += duration
+            stats.max_time = max(stats.max_time, duration)
+
+    def start(self) -> None:
+        """Start detecting slow iterations of the loop."""
+        self._beat_due = monotonic()
+        self._heartbeat()
+        threading.Thread(
+            target=self._watch, name="BlockingCallWatchdog", daemon=True
+        ).start()
+
+    def stop(self) -> None:
+        """Stop detecting slow iterations of the loop."""
+        self._stop.set()
+        if self._beat_handle is not None:
+            self._beat_handle.cancel()
+            self._beat_handle = None
+
+    def _heartbeat(self) -> None:
+        """Record the sampled stack if the iteration before the beat overran."""
+        now = monotonic()
+        late = now - self._beat_due
+        with self._lock:
+            sample, self._sample = self._sample, None
+        if sample is not None and late >= self.threshold:
+            self._record(SLOW_ITERATION, sample, late)
+        self._beat_due = now + HEARTBEAT_INTERVAL
+        self._beat_handle = self._loop.call_at(
+            self._loop.time() + HEARTBEAT_INTERVAL, self._heartbeat
+        )
+
+    def _watch(self) -> None:
+        """Sample the stack of the loop thread when the heartbeat is late."""
+        while not self._stop.wait(self.threshold / 2):
+            beat_due = self._beat_due
+            if monotonic() - beat_due < self.threshold or self._sample is not None:
+                continue
+            if (frame := sys._current_frames().get(self._loop_thread_id)) is None:  # noqa: SLF001
+                continue
+            fingerprint = _fingerprint(SLOW_ITERATION, frame)
+            with self._lock:
+                # Only keep the sample if the loop is still in the same iteration
+                if self._beat_due == beat_due:
+                    self._sample = fingerprint
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counts and time per integration and per stack fingerprint."""
+        with self._lock:
+            stats = sorted(self._stats.values(), key=lambda s: s.time, reverse=True)
+        integrations: dict[str, dict[str, Any]] = {}
+        for call in stats:
+            if (totals := integrations.get(call.integration)) is None:
+                totals = integrations[call.integration] = {"count": 0, "time": 0.0}
+            totals["count"] += call.count
+            totals["time"] += call.time
+        return {
+            "threshold": self.threshold,
+            "dropped": self.dropped,
+            "integrations": integrations,
+            "calls": [call.as_dict() for call in stats],
+        }
+
+
+_TELEMETRY: BlockingCallTelemetry | None = None
+
+
+def get_blocking_call_telemetry() -> BlockingCallTelemetry | None:
+    """Return the telemetry of the blocking calls, None if it is disabled."""
+    return _TELEMETRY
+
+
+def enable_blocking_call_telemetry(
+    loop: asyncio.AbstractEventLoop, threshold: float = SLOW_ITERATION_THRESHOLD
+) -> BlockingCallTelemetry:
+    """Start recording the blocking calls, must be called from the loop thread."""
+    global _TELEMETRY  # noqa: PLW0603
+    if _TELEMETRY is None:
+        _TELEMETRY = BlockingCallTelemetry(loop, threshold)
+        _TELEMETRY.start()
+    return _TELEMETRY
+
+
+def disable_blocking_call_telemetry() -> None:
+    """Stop recording the blocking calls and discard the recorded ones."""
+    global _TELEMETRY  # noqa: PLW0603
+    if _TELEMETRY is not None:
+        _TELEMETRY.stop()
+        _TELEMETRY = None
@@ -0,0 +1,44 @@
+"""Histogram with fixed buckets."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any
+
+
+class Histogram:
+    """A histogram with fixed buckets."""
+
+    __slots__ = ("bounds", "count", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """Initialize the histogram."""
+        self.bounds = bounds
+        # The last bucket holds the values above the largest bound
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum: float = 0
+
+    def observe(self, value: float) -> None:
+        """Add a value to the histogram."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_buckets(self) -> list[tuple[str, int]]:
+        """Return the number of values below or equal to each bound."""
+        buckets: list[tuple[str, int]] = []
+        total = 0
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            total += count
+            buckets.append((str(bound), total))
+        buckets.append(("+Inf", self.count))
+        return buckets
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dict."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": dict(self.cumulative_buckets()),
+        }
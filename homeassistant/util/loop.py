@@ -8,6 +8,7 @@ from functools import cache
 import linecache
 import logging
 import threading
+from time import perf_counter
 import traceback
 from typing import Any
 
@@ -19,6 +20,8 @@ from homeassistant.helpers.frame import (
 )
 from homeassistant.loader import async_suggest_report_issue
 
+from .blocking_telemetry import get_blocking_call_telemetry
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -38,10 +41,13 @@ def raise_for_blocking_call(
     strict: bool = True,
     strict_core: bool = True,
     **mapped_args: Any,
-) -> None:
-    """Warn if called inside the event loop. Raise if `strict` is True."""
+) -> bool:
+    """Warn if called inside the event loop. Raise if `strict` is True.
+
+    Return False if the call is allowed.
+    """
     if check_allowed is not None and check_allowed(mapped_args):
-        return
+        return False
 
     found_frame = None
     offender_frame = get_current_frame(2)
@@ -90,7 +96,7 @@ def raise_for_blocking_call(
                     _dev_help_message(func.__name__),
                     "".join(traceback.format_stack(f=offender_frame)),
                 )
-            return
+            return True
 
         if found_frame is None:
             raise RuntimeError(  # noqa: TRY200
@@ -166,6 +172,8 @@ def raise_for_blocking_call(
             f"{_dev_help_message(func.__name__)}"
         )
 
+    return True
+
 
 @cache
 def _dev_help_message(what: str) -> str:
@@ -188,8 +196,9 @@ def protect_loop[**_P, _R](
 
     @functools.wraps(func)
     def protected_loop_func(*args: _P.args, **kwargs: _P.kwargs) -> _R:
-        if threading.get_ident() == loop_thread_id:
-            raise_for_blocking_call(
+        if (
+            threading.get_ident() != loop_thread_id
+            or not raise_for_blocking_call(
                 func,
                 strict=strict,
                 strict_core=strict_core,
@@ -197,6 +206,15 @@ def protect_loop[**_P, _R](
                 args=args,
                 kwargs=kwargs,
             )
-        return func(*args, **kwargs)
+            or (telemetry := get_blocking_call_telemetry()) is None
+        ):
+            return func(*args, **kwargs)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            telemetry.record(
+                func.__qualname__, get_current_frame(1), perf_counter() - start
+            )
 
     return protected_loop_func
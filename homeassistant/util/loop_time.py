@@ -0,0 +1,159 @@
+"""Attribute the time spent in the event loop to integrations."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine, Generator
+import functools
+from time import perf_counter
+from typing import Any, Final
+
+from .histogram import Histogram
+
+# Domain of the callbacks and tasks not owned by an integration
+CORE_DOMAIN: Final = "homeassistant"
+
+# Upper bounds of the histogram buckets, in seconds
+LOOP_TIME_BUCKETS: Final = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+
+def module_domain(module: str | None) -> str:
+    """Return the integration domain owning a module."""
+    if module is None:
+        return CORE_DOMAIN
+    parts = module.split(".", 3)
+    if len(parts) > 2 and parts[0] == "homeassistant" and parts[1] == "components":
+        return parts[2]
+    if len(parts) > 1 and parts[0] == "custom_components":
+        return parts[1]
+    return CORE_DOMAIN
+
+
+class LoopTimeTracker:
+    """Cumulative histograms of the event loop time per integration.
+
+    Callbacks and the steps of tasks are timed where they are run, and
+    attributed to the integration whose module defines the callable or
+    the coroutine. Time spent in nested callbacks and tasks started
+    eagerly is only attributed to the innermost one, so the sum of the
+    histograms is the time spent running them.
+    """
+
+    __slots__ = ("_domains", "_histograms", "_nested")
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._histograms: dict[str, Histogram] = {}
+        # Domain of each module seen so far
+        self._domains: dict[str | None, str] = {}
+        # Time spent in nested runs of the run in progress
+        self._nested: float = 0
+
+    def domain(self, target: Callable[..., Any]) -> str:
+        """Return the integration domain owning a callable."""
+        while isinstance(target, functools.partial):
+            target = target.func
+        module = getattr(target, "__module__", None)
+        if (domain := self._domains.get(module)) is None:
+            domain = self._domains[module] = module_domain(module)
+        return domain
+
+    def coroutine_domain(self, coro: Coroutine[Any, Any, Any]) -> str:
+        """Return the integration domain owning a coroutine."""
+        if (frame := getattr(coro, "cr_frame", None)) is not None:
+            module = frame.f_globals.get("__name__")
+        else:
+            module = type(coro).__module__
+        if (domain := self._domains.get(module)) is None:
+            domain = self._domains[module] = module_domain(module)
+        return domain
+
+    def async_run[*_Ts, _R](self, target: Callable[[*_Ts], _R], *args: *_Ts) -> _R:
+        """Run a callable, attributing its time to its integration."""
+        return self.async_run_for(self.domain(target), target, *args)
+
+    def async_run_for[*_Ts, _R](
+        self, domain: str, target: Callable[[*_Ts], _R], *args: *_Ts
+    ) -> _R:
+        """Run a callable, attributing its time to an integration."""
+        outer_nested = self._nested
+        self._nested = 0
+        start = perf_counter()
+        try:
+            return target(*args)
+        finally:
+            elapsed = perf_counter() - start
+            self._observe(domain, elapsed - self._nested)
+            self._nested = outer_nested + elapsed
+
+    def wrap_coroutine[_R](
+        self, coro: Coroutine[Any, Any, _R]
+    ) -> Coroutine[Any, Any, _R]:
+        """Return a coroutine that times each of its steps."""
+        return _TimedCoroutine(self, self.coroutine_domain(coro), coro)
+
+    def _observe(self, domain: str, elapsed: float) -> None:
+        """Add the time of a run to the histogram of an integration."""
+        if (histogram := self._histograms.get(domain)) is None:
+            histogram = self._histograms[domain] = Histogram(LOOP_TIME_BUCKETS)
+        histogram.observe(elapsed)
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the histograms by integration, the busiest first."""
+        return {
+            domain: histogram.as_dict()
+            for domain, histogram in sorted(
+                self._histograms.items(), key=lambda item: item[1].sum, reverse=True
+            )
+        }
+
+
+class _TimedCoroutine[_R](Coroutine[Any, Any, _R]):
+    """Coroutine timing the steps of the coroutine it wraps."""
+
+    __slots__ = ("_coro", "_domain", "_tracker")
+
+    def __init__(
+        self, tracker: LoopTimeTracker, domain: str, coro: Coroutine[Any, Any, _R]
+    ) -> None:
+        """Initialize the coroutine."""
+        self._tracker = tracker
+        self._domain = domain
+        self._coro = coro
+
+    def __repr__(self) -> str:
+        """Return the wrapped coroutine."""
+        return repr(self._coro)
+
+    def send(self, value: Any) -> Any:
+        """Run the next step of the coroutine."""
+        return self._tracker.async_run_for(self._domain, self._coro.send, value)
+
+    def throw(self, *args: Any) -> Any:
+        """Raise an exception in the coroutine."""
+        return self._tracker.async_run_for(self._domain, self._coro.throw, *args)
+
+    def close(self) -> None:
+        """Close the coroutine."""
+        self._coro.close()
+
+    def __next__(self) -> Any:
+        """Run the next step of the coroutine."""
+        return self.send(None)
+
+    def __await__(self) -> Generator[Any, None, _R]:
+        """Return the iterator of the coroutine."""
+        return self  # type: ignore[return-value]
@@ -131,6 +131,24 @@ class BaseUnitConverter:
         from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
         return lambda val: None if val is None else (val / from_ratio) * to_ratio
 
+    @classmethod
+    @lru_cache
+    def converter_factory_list_allow_none(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[list[float | None]], list[float | None]]:
+        """Return a function to convert a list of values which allows None.
+
+        The returned function converts a whole column of values in one
+        call, which is much cheaper than calling a converter per value.
+        The list is returned as is when no conversion is needed.
+        """
+        if from_unit == to_unit:
+            return lambda values: values
+        from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
+        return lambda values: [
+            None if val is None else (val / from_ratio) * to_ratio for val in values
+        ]
+
     @classmethod
     @lru_cache
     def get_unit_ratio(cls, from_unit: str | None, to_unit: str | None) -> float:
@@ -447,6 +465,17 @@ class SpeedConverter(BaseUnitConverter):
         convert = cls._converter_factory(from_unit, to_unit)
         return lambda value: None if value is None else convert(value)
 
+    @classmethod
+    @lru_cache
+    def converter_factory_list_allow_none(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[list[float | None]], list[float | None]]:
+        """Return a function to convert a list of speed values which allows None."""
+        if from_unit == to_unit:
+            return lambda values: values
+        convert = cls._converter_factory(from_unit, to_unit)
+        return lambda values: [None if val is None else convert(val) for val in values]
+
     @classmethod
     def _converter_factory(
         cls, from_unit: str | None, to_unit: str | None
@@ -526,6 +555,17 @@ class TemperatureConverter(BaseUnitConverter):
         convert = cls._converter_factory(from_unit, to_unit)
         return lambda value: None if value is None else convert(value)
 
+    @classmethod
+    @lru_cache
+    def converter_factory_list_allow_none(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[list[float | None]], list[float | None]]:
+        """Return a function to convert a list of temperature values which allows None."""
+        if from_unit == to_unit:
+            return lambda values: values
+        convert = cls._converter_factory(from_unit, to_unit)
+        return lambda values: [None if val is None else convert(val) for val in values]
+
     @classmethod
     def _converter_factory(
         cls, from_unit: str | None, to_unit: str | None
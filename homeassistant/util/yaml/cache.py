@@ -0,0 +1,482 @@
+"""Cache of parsed YAML files."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+import hashlib
+from io import StringIO
+import logging
+import math
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Final
+
+import orjson
+
+from homeassistant.const import __version__
+from homeassistant.util.file import WriteError, write_utf8_file
+from homeassistant.util.json import json_loads
+
+from .objects import Input, NodeDictClass, NodeListClass, NodeStrClass
+
+if TYPE_CHECKING:
+    from .loader import Secrets
+
+_LOGGER = logging.getLogger(__name__)
+
+# Name of the file the cache is stored in, in the config directory
+YAML_CACHE_FILE: Final = ".yaml_cache"
+
+type FileSignature = tuple[int, int]
+type CacheKey = tuple[str, str | None]
+
+
+@dataclass(slots=True)
+class Dependencies:
+    """Files, directories and environment variables a parsed file depends on."""
+
+    files: dict[str, FileSignature | None] = field(default_factory=dict)
+    dirs: dict[str, int | None] = field(default_factory=dict)
+    env: dict[str, str | None] = field(default_factory=dict)
+
+    def update(self, other: Dependencies) -> None:
+        """Add the dependencies of another file."""
+        self.files.update(other.files)
+        self.dirs.update(other.dirs)
+        self.env.update(other.env)
+
+    def is_valid(self) -> bool:
+        """Return if no dependency changed since it was recorded."""
+        return (
+            all(
+                _file_signature(path) == signature
+                for path, signature in self.files.items()
+            )
+            and all(_dir_mtime(path) == mtime for path, mtime in self.dirs.items())
+            and all(os.environ.get(name) == value for name, value in self.env.items())
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class SecretReference:
+    """A !secret tag of a file parsed for the cache, resolved on each load."""
+
+    requester: str
+    name: str
+
+
+@dataclass(slots=True, frozen=True)
+class CachedYaml:
+    """A parsed YAML file stored as a JSON safe node tree."""
+
+    signature: FileSignature
+    digest: str
+    files: list[str]
+    tree: Any
+    dependencies: Dependencies
+
+
+def _file_signature(path: str) -> FileSignature | None:
+    """Return the modification time and size of a file, None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _stored_signature(signature: list[int]) -> FileSignature:
+    """Return a file signature stored as a JSON list."""
+    return (signature[0], signature[1])
+
+
+def _dir_mtime(path: str) -> int | None:
+    """Return the modification time of a directory, None if it is missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+_recording = threading.local()
+
+
+def _recorder() -> Dependencies | None:
+    """Return the dependencies of the file being parsed by this thread."""
+    if stack := getattr(_recording, "stack", None):
+        return stack[-1]
+    return None
+
+
+@contextmanager
+def _record_dependencies() -> Generator[Dependencies]:
+    """Record the dependencies of a file while it is parsed."""
+    if (stack := getattr(_recording, "stack", None)) is None:
+        stack = _recording.stack = []
+    dependencies = Dependencies()
+    stack.append(dependencies)
+    try:
+        yield dependencies
+    finally:
+        stack.pop()
+
+
+def is_parsing_for_cache() -> bool:
+    """Return if the file being parsed by this thread will be cached."""
+    return _recorder() is not None
+
+
+def record_dir(path: str) -> None:
+    """Record that the file being parsed depends on the files in a directory."""
+    if (dependencies := _recorder()) is not None:
+        dependencies.dirs[path] = _dir_mtime(path)
+
+
+def record_env(name: str) -> None:
+    """Record that the file being parsed depends on an environment variable."""
+    if (dependencies := _recorder()) is not None:
+        dependencies.env[name] = os.environ.get(name)
+
+
+def _annotate(node: dict[str, Any], value: Any, files: dict[str, int]) -> Any:
+    """Add the file and line annotations of a value to its node."""
+    if (config_file := getattr(value, "__config_file__", None)) is not None:
+        node["file"] = files.setdefault(config_file, len(files))
+    if (line := getattr(value, "__line__", None)) is not None:
+        node["line"] = line
+    return node
+
+
+def _encode(value: Any, files: dict[str, int]) -> Any:
+    """Return parsed YAML data as a JSON safe node tree.
+
+    Plain lists, strings and scalars are stored as they are. Annotated
+    nodes, dicts and the other supported types are stored as an object
+    with a key naming the type.
+
+    Raises TypeError for data that cannot be stored.
+    """
+    value_type = type(value)
+    if value is None or value_type is bool or value_type is str:
+        return value
+    if value_type is int:
+        if -(2**63) <= value < 2**64:
+            return value
+    elif value_type is float:
+        return value if math.isfinite(value) else {"float": repr(value)}
+    elif value_type is NodeStrClass:
+        return _annotate({"str": str(value)}, value, files)
+    elif value_type is NodeDictClass or value_type is dict:
+        items = [
+            [_encode(key, files), _encode(item, files)] for key, item in value.items()
+        ]
+        if value_type is dict:
+            return {"items": items}
+        return _annotate({"dict": items}, value, files)
+    elif value_type is list:
+        return [_encode(item, files) for item in value]
+    elif value_type is NodeListClass:
+        return _annotate(
+            {"list": [_encode(item, files) for item in value]}, value, files
+        )
+    elif value_type is SecretReference:
+        return {
+            "secret": value.name,
+            "requester": files.setdefault(value.requester, len(files)),
+        }
+    elif value_type is Input:
+        return {"input": value.name}
+    elif value_type is datetime:
+        return {"datetime": value.isoformat()}
+    elif value_type is date:
+        return {"date": value.isoformat()}
+    raise TypeError(f"Unable to cache a {value_type.__name__}")
+
+
+def _decode(
+    node: Any, files: list[str], resolve: Callable[[str, str], Any] | None
+) -> Any:
+    """Return new parsed YAML data from a node tree.
+
+    Secrets are resolved with resolve, or left as references if it is None.
+    """
+    node_type = type(node)
+    if node_type is list:
+        return [_decode(item, files, resolve) for item in node]
+    if node_type is not dict:
+        return node
+    obj: NodeStrClass | NodeDictClass | NodeListClass
+    if "str" in node:
+        obj = NodeStrClass(node["str"])
+    elif "dict" in node:
+        obj = NodeDictClass(
+            (_decode(key, files, resolve), _decode(item, files, resolve))
+            for key, item in node["dict"]
+        )
+    elif "list" in node:
+        obj = NodeListClass(_decode(item, files, resolve) for item in node["list"])
+    elif "items" in node:
+        return {
+            _decode(key, files, resolve): _decode(item, files, resolve)
+            for key, item in node["items"]
+        }
+    elif "secret" in node:
+        requester = files[node["requester"]]
+        if resolve is None:
+            return SecretReference(requester, node["secret"])
+        return resolve(requester, node["secret"])
+    elif "input" in node:
+        return Input(node["input"])
+    elif "datetime" in node:
+        return datetime.fromisoformat(node["datetime"])
+    elif "date" in node:
+        return date.fromisoformat(node["date"])
+    else:
+        return float(node["float"])
+    if "file" in node:
+        obj.__config_file__ = files[node["file"]]
+    if "line" in node:
+        obj.__line__ = node["line"]
+    return obj
+
+
+def _resolve_secrets(value: Any, resolve: Callable[[str, str], Any]) -> Any:
+    """Resolve the secret references in parsed YAML data in place."""
+    if type(value) is SecretReference:
+        return resolve(value.requester, value.name)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            value[key] = _resolve_secrets(item, resolve)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            value[index] = _resolve_secrets(item, resolve)
+    return value
+
+
+class YamlCache:
+    """Parsed YAML files, reused until a file they depend on changes.
+
+    A file is parsed again if its modification time or size changed
+    and its content did not stay the same. Besides the file itself, an
+    entry depends on the included files and directories and the
+    environment variables it read, so a change to any of them parses
+    the file again.
+
+    The parsed data is kept as a JSON safe node tree with the file and
+    line annotations used for error reporting, so each load returns new
+    objects that can be modified by the caller. A !secret tag is kept
+    as a reference and looked up on each load, so the values of secrets
+    are never stored and an edited secrets file does not parse the files
+    using it again. Secrets files themselves are not cached.
+
+    Entries that were not loaded since the cache was created are dropped
+    when it is stored.
+    """
+
+    __slots__ = ("_entries", "_lock", "_used", "dirty", "hits", "misses")
+
+    def __init__(self, entries: dict[CacheKey, CachedYaml] | None = None) -> None:
+        """Initialize the cache."""
+        self._entries = entries or {}
+        self._used: set[CacheKey] = set()
+        self._lock = threading.Lock()
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def load(
+        self,
+        fname: str | os.PathLike[str],
+        secrets: Secrets | None,
+        parse: Callable[[StringIO], Any],
+    ) -> Any:
+        """Load a YAML file, parsing it only if it changed.
+
+        This method must be run in the executor.
+        """
+        path = os.path.abspath(fname)
+        secrets_dir = None if secrets is None else str(secrets.config_dir)
+        key = (path, secrets_dir)
+        # Files loaded while parsing another file keep their secret
+        # references, they are resolved once for the whole tree
+        nested = is_parsing_for_cache()
+        resolve = None if nested or secrets is None else secrets.get
+        entry = self._entries.get(key)
+        with open(fname, "rb") as conf_file:
+            stat = os.fstat(conf_file.fileno())
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if (
+                entry is not None
+                and entry.signature == signature
+                and entry.dependencies.is_valid()
+            ):
+                return self._hit(key, entry, resolve)
+            content = conf_file.read()
+
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        if (
+            entry is not None
+            and entry.digest == digest
+            and entry.dependencies.is_valid()
+        ):
+            # Only the modification time changed
+            entry = replace(entry, signature=signature)
+            with self._lock:
+                self._entries[key] = entry
+                self.dirty = True
+            return self._hit(key, entry, resolve)
+
+        stream = StringIO(content.decode("utf-8"))
+        # Annotate the parsed nodes with the name of the file
+        stream.name = str(fname)  # type: ignore[misc]
+        with _record_dependencies() as dependencies:
+            data = parse(stream)
+        self._add_to_parent(path, signature, dependencies)
+        self.misses += 1
+        files: dict[str, int] = {}
+        try:
+            tree = _encode(data, files)
+        except TypeError:
+            _LOGGER.debug("Unable to cache %s", fname, exc_info=True)
+            return data if resolve is None else _resolve_secrets(data, resolve)
+        entry = CachedYaml(signature, digest, list(files), tree, dependencies)
+        with self._lock:
+            self._entries[key] = entry
+            self.dirty = True
+        self._used.add(key)
+        return data if resolve is None else _resolve_secrets(data, resolve)
+
+    def _hit(
+        self,
+        key: CacheKey,
+        entry: CachedYaml,
+        resolve: Callable[[str, str], Any] | None,
+    ) -> Any:
+        """Return the data of a cached file."""
+        self._add_to_parent(key[0], entry.signature, entry.dependencies)
+        self.hits += 1
+        used = self._used
+        used.add(key)
+        # Keep the entries of the included files for when this file changes
+        secrets_dir = key[1]
+        used.update((path, secrets_dir) for path in entry.dependencies.files)
+        return _decode(entry.tree, entry.files, resolve)
+
+    @staticmethod
+    def _add_to_parent(
+        path: str, signature: FileSignature, dependencies: Dependencies
+    ) -> None:
+        """Add a file and its dependencies to the file including it."""
+        if (parent := _recorder()) is not None:
+            parent.update(dependencies)
+            parent.files[path] = signature
+
+    @classmethod
+    def from_file(cls, path: str) -> YamlCache:
+        """Load a cache stored by this version of Home Assistant."""
+        try:
+            with open(path, "rb") as cache_file:
+                stored = json_loads(cache_file.read())
+        except FileNotFoundError:
+            return cls()
+        except Exception:  # noqa: BLE001
+            _LOGGER.warning("Ignoring invalid YAML cache %s", path)
+            return cls()
+        if not isinstance(stored, dict) or stored.get("version") != __version__:
+            return cls()
+        try:
+            entries = {
+                (entry["path"], entry["secrets_dir"]): CachedYaml(
+                    _stored_signature(entry["signature"]),
+                    entry["digest"],
+                    entry["files"],
+                    entry["tree"],
+                    Dependencies(
+                        {
+                            file: signature and _stored_signature(signature)
+                            for file, signature in entry["files_read"].items()
+                        },
+                        entry["dirs_read"],
+                        entry["env_read"],
+                    ),
+                )
+                for entry in stored["entries"]
+            }
+        except (KeyError, TypeError, AttributeError, IndexError):
+            _LOGGER.warning("Ignoring invalid YAML cache %s", path)
+            return cls()
+        return cls(entries)
+
+    def save(self, path: str) -> None:
+        """Store the cache if it changed, without the entries not used.
+
+        Environment variables read by the parsed files are stored with
+        them, so the file is only readable by its owner.
+        """
+        with self._lock:
+            entries = {
+                key: entry for key, entry in self._entries.items() if key in self._used
+            }
+            if not self.dirty and len(entries) == len(self._entries):
+                return
+            self._entries = entries
+            self.dirty = False
+            data = orjson.dumps(
+                {
+                    "version": __version__,
+                    "entries": [
+                        {
+                            "path": file_path,
+                            "secrets_dir": secrets_dir,
+                            "signature": entry.signature,
+                            "digest": entry.digest,
+                            "files": entry.files,
+                            "tree": entry.tree,
+                            "files_read": entry.dependencies.files,
+                            "dirs_read": entry.dependencies.dirs,
+                            "env_read": entry.dependencies.env,
+                        }
+                        for (file_path, secrets_dir), entry in entries.items()
+                    ],
+                }
+            )
+        try:
+            write_utf8_file(path, data, private=True, mode="wb")
+        except WriteError:
+            self.dirty = True
+
+
+_active_cache: YamlCache | None = None
+
+
+def get_yaml_cache() -> YamlCache | None:
+    """Return the cache used by load_yaml, None if YAML files are not cached."""
+    return _active_cache
+
+
+def enable_yaml_cache(config_dir: str) -> YamlCache:
+    """Cache the YAML files loaded by load_yaml, starting from the stored cache.
+
+    This function does blocking I/O.
+    """
+    global _active_cache  # noqa: PLW0603
+    _active_cache = YamlCache.from_file(os.path.join(config_dir, YAML_CACHE_FILE))
+    return _active_cache
+
+
+def disable_yaml_cache() -> None:
+    """Parse the YAML files each time they are loaded."""
+    global _active_cache  # noqa: PLW0603
+    _active_cache = None
+
+
+def save_yaml_cache(config_dir: str) -> None:
+    """Store the cache used by load_yaml.
+
+    This function does blocking I/O.
+    """
+    if _active_cache is not None:
+        _active_cache.save(os.path.join(config_dir, YAML_CACHE_FILE))
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterator
 import fnmatch
+from functools import partial
 from io import StringIO, TextIOWrapper
 import logging
 import os
@@ -26,6 +27,13 @@ from propcache import cached_property
 
 from homeassistant.exceptions import HomeAssistantError
 
+from .cache import (
+    SecretReference,
+    get_yaml_cache,
+    is_parsing_for_cache,
+    record_dir,
+    record_env,
+)
 from .const import SECRET_YAML
 from .objects import Input, NodeDictClass, NodeListClass, NodeStrClass
 
@@ -62,7 +70,8 @@ class Secrets:
                 # We went above the config dir
                 break
 
-            secrets = self._load_secret_yaml(secret_dir)
+            secret_path = secret_dir / SECRET_YAML
+            secrets = self._load_secret_yaml(secret_path)
 
             if secret in secrets:
                 _LOGGER.debug(
@@ -74,9 +83,9 @@ class Secrets:
 
         raise HomeAssistantError(f"Secret {secret} not defined")
 
-    def _load_secret_yaml(self, secret_dir: Path) -> dict[str, str]:
+    def _load_secret_yaml(self, secret_path: Path) -> dict[str, str]:
         """Load the secrets yaml from path."""
-        if (secret_path := secret_dir / SECRET_YAML) in self._cache:
+        if secret_path in self._cache:
             return self._cache[secret_path]
 
         _LOGGER.debug("Loading %s", secret_path)
@@ -164,6 +173,10 @@ def load_yaml(
     except for FileNotFoundError which will be re-raised.
     """
     try:
+        if (cache := get_yaml_cache()) is not None and (
+            os.path.basename(fname) != SECRET_YAML
+        ):
+            return cache.load(fname, secrets, partial(parse_yaml, secrets=secrets))
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
     except UnicodeDecodeError as exc:
@@ -333,8 +346,11 @@ def _is_file_valid(name: str) -> bool:
 
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
+    record_dir(directory)
     for root, dirs, files in os.walk(directory, topdown=True):
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
+        for valid_dir in dirs:
+            record_dir(os.path.join(root, valid_dir))
         for basename in sorted(files):
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
                 filename = os.path.join(root, basename)
@@ -465,6 +481,7 @@ def _handle_scalar_tag(
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    record_env(args[0])
 
     # Check for a default value
     if len(args) > 1:
@@ -480,6 +497,9 @@ def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
+    if is_parsing_for_cache():
+        # The cache stores the name of the secret, not its value
+        return SecretReference(loader.get_name, node.value)
     return loader.secrets.get(loader.get_name, node.value)
 
 
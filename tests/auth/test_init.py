@@ -3,7 +3,7 @@
 from datetime import timedelta
 import time
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
 import jwt
@@ -18,7 +18,11 @@ from homeassistant.auth import (
     const as auth_const,
     models as auth_models,
 )
-from homeassistant.auth.const import GROUP_ID_ADMIN, MFA_SESSION_EXPIRATION
+from homeassistant.auth.const import (
+    ACCESS_TOKEN_EXPIRATION,
+    GROUP_ID_ADMIN,
+    MFA_SESSION_EXPIRATION,
+)
 from homeassistant.auth.models import Credentials
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util import dt as dt_util
@@ -590,6 +594,44 @@ async def test_remove_refresh_token(hass: HomeAssistant) -> None:
     assert manager.async_validate_access_token(access_token) is None
 
 
+async def test_access_token_cache(hass: HomeAssistant) -> None:
+    """Test verified access tokens are cached until invalidated."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+    stats = manager.access_token_cache_stats
+
+    with patch(
+        "homeassistant.auth.jwt_wrapper.verify_and_decode",
+        wraps=auth.jwt_wrapper.verify_and_decode,
+    ) as mock_verify:
+        assert manager.async_validate_access_token(access_token) is refresh_token
+        assert manager.async_validate_access_token(access_token) is refresh_token
+    assert len(mock_verify.mock_calls) == 1
+    assert stats.as_dict() == {
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+        "verify_time": ANY,
+    }
+
+    # Deactivated users are rejected even with a cached token
+    user.is_active = False
+    assert manager.async_validate_access_token(access_token) is None
+    user.is_active = True
+    assert manager.async_validate_access_token(access_token) is refresh_token
+
+    # Expired tokens are verified again
+    with freeze_time(dt_util.utcnow() + ACCESS_TOKEN_EXPIRATION + timedelta(minutes=1)):
+        assert manager.async_validate_access_token(access_token) is None
+
+    assert manager.async_validate_access_token(access_token) is refresh_token
+    manager.async_remove_refresh_token(refresh_token)
+    assert manager._access_token_cache == {}
+    assert manager.async_validate_access_token(access_token) is None
+
+
 async def test_remove_expired_refresh_token(hass: HomeAssistant) -> None:
     """Test that expired refresh tokens are deleted."""
     manager = await auth.auth_manager_from_config(hass, [], [])
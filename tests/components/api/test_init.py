@@ -8,6 +8,7 @@ from unittest.mock import patch
 
 from aiohttp import ServerDisconnectedError, web
 from aiohttp.test_utils import TestClient
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 import voluptuous as vol
 
@@ -45,6 +46,76 @@ async def test_api_list_state_entities(
     assert remote_data == local_data
 
 
+async def test_api_list_states_conditional(
+    hass: HomeAssistant,
+    mock_api_client: TestClient,
+    hass_admin_user: MockUser,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test conditional requests and deltas of the states."""
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.hall", "off")
+    freezer.tick(2)
+    resp = await mock_api_client.get(const.URL_API_STATES)
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers["ETag"]
+    last_modified = resp.headers["Last-Modified"]
+    version = etag.strip('"')
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-Modified-Since": last_modified}
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.porch", "on")
+    hass.states.async_remove("light.hall")
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert len(await resp.json()) == 2
+
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": version})
+    assert resp.status == HTTPStatus.OK
+    data = await resp.json()
+    assert data["version"] == resp.headers["ETag"].strip('"')
+    assert data["full"] is False
+    assert [state["entity_id"] for state in data["states"]] == [
+        "light.kitchen",
+        "light.porch",
+    ]
+    assert data["states"][0]["state"] == "off"
+    assert data["removed"] == ["light.hall"]
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, params={"since": data["version"]}
+    )
+    data = await resp.json()
+    assert data["states"] == []
+    assert data["removed"] == []
+
+    # Unknown versions return all states
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, params={"since": "unknown:0"}
+    )
+    data = await resp.json()
+    assert data["full"] is True
+    assert len(data["states"]) == 2
+
+    # Deltas only include the entities the user can read
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.porch": True}}})
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": version})
+    data = await resp.json()
+    assert [state["entity_id"] for state in data["states"]] == ["light.porch"]
+    assert data["removed"] == []
+
+
 async def test_api_get_state(hass: HomeAssistant, mock_api_client: TestClient) -> None:
     """Test if the debug interface allows us to get a state."""
     hass.states.async_set("hello.world", "nice", {"attr": 1})
@@ -587,6 +658,98 @@ async def _stream_next_event(stream):
     return json.loads(conv)
 
 
+async def _state_stream_next_event(stream) -> tuple[str, str, Any]:
+    """Read the next server-sent event of the state stream."""
+    fields: dict[str, str] = {}
+    while not fields:
+        for line in (await stream.readuntil(b"\n\n")).decode().splitlines():
+            if line and not line.startswith(":"):
+                name, _, value = line.partition(": ")
+                fields[name] = value
+    return fields["id"], fields["event"], json.loads(fields["data"])
+
+
+async def test_state_stream(
+    hass: HomeAssistant, mock_api_client: TestClient, hass_admin_user: MockUser
+) -> None:
+    """Test streaming state changes with filters."""
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("switch.fan", "off")
+    hass.states.async_set("sensor.temperature", "20")
+
+    async with mock_api_client.get("/api/stream/states?domain=light,sensor") as resp:
+        assert resp.status == HTTPStatus.OK
+        assert resp.content_type == "text/event-stream"
+        _, event, data = await _state_stream_next_event(resp.content)
+        assert event == "states"
+        assert [state["entity_id"] for state in data] == [
+            "light.kitchen",
+            "sensor.temperature",
+        ]
+
+        hass.states.async_set("switch.fan", "on")
+        hass.states.async_set("sensor.temperature", "21")
+        _, event, data = await _state_stream_next_event(resp.content)
+        assert event == "state_changed"
+        assert data["entity_id"] == "sensor.temperature"
+        assert data["new_state"]["state"] == "21"
+
+        hass.states.async_remove("light.kitchen")
+        _, event, data = await _state_stream_next_event(resp.content)
+        assert data == {"entity_id": "light.kitchen", "new_state": None}
+
+    # Entities the user cannot read are not streamed
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"switch.fan": True}}})
+    async with mock_api_client.get("/api/stream/states") as resp:
+        _, event, data = await _state_stream_next_event(resp.content)
+        assert [state["entity_id"] for state in data] == ["switch.fan"]
+
+    resp = await mock_api_client.get("/api/stream/states?interval=nope")
+    assert resp.status == HTTPStatus.BAD_REQUEST
+
+
+async def test_state_stream_resume_and_coalesce(
+    hass: HomeAssistant, mock_api_client: TestClient
+) -> None:
+    """Test resuming a state stream and coalescing its changes."""
+    hass.states.async_set("light.kitchen", "on")
+
+    async with mock_api_client.get(
+        "/api/stream/states?entity_id=light.kitchen,light.hall"
+    ) as resp:
+        event_id, event, _ = await _state_stream_next_event(resp.content)
+        assert event == "states"
+
+    # Changes missed while disconnected are replayed
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.hall", "on")
+    hass.states.async_set("light.kitchen", "on")
+    async with mock_api_client.get(
+        "/api/stream/states?entity_id=light.kitchen,light.hall&interval=0.01",
+        headers={"Last-Event-ID": event_id},
+    ) as resp:
+        _, event, data = await _state_stream_next_event(resp.content)
+        assert event == "state_changed"
+        assert data["entity_id"] == "light.hall"
+        event_id, event, data = await _state_stream_next_event(resp.content)
+        assert data["entity_id"] == "light.kitchen"
+        assert data["new_state"]["state"] == "on"
+
+        # Changes within the interval only send the newest state
+        for state in ("1", "2", "3"):
+            hass.states.async_set("light.hall", state)
+        _, event, data = await _state_stream_next_event(resp.content)
+        assert data["new_state"]["state"] == "3"
+
+    # Unknown event ids start again from the current states
+    async with mock_api_client.get(
+        "/api/stream/states", headers={"Last-Event-ID": "unknown:1"}
+    ) as resp:
+        _, event, _ = await _state_stream_next_event(resp.content)
+        assert event == "states"
+
+
 def _listen_count(hass: HomeAssistant) -> int:
     """Return number of event listeners."""
     return sum(hass.bus.async_listeners().values())
@@ -838,6 +1001,27 @@ async def test_api_core_state(hass: HomeAssistant, mock_api_client: TestClient)
     }
 
 
+async def test_api_request_metrics(
+    hass: HomeAssistant, mock_api_client: TestClient, hass_admin_user: MockUser
+) -> None:
+    """Test getting the request metrics in the Prometheus text format."""
+    resp = await mock_api_client.get("/api/")
+    assert resp.status == HTTPStatus.OK
+
+    resp = await mock_api_client.get("/api/request_metrics")
+    assert resp.status == HTTPStatus.OK
+    assert resp.content_type == "text/plain"
+    text = await resp.text()
+    assert (
+        'homeassistant_http_request_duration_seconds_count{view="api:status"} 1' in text
+    )
+    assert 'homeassistant_http_requests_in_flight{view="api:request_metrics"} 1' in text
+
+    hass_admin_user.groups = []
+    resp = await mock_api_client.get("/api/request_metrics")
+    assert resp.status == HTTPStatus.UNAUTHORIZED
+
+
 @pytest.mark.parametrize(
     ("migration_in_progress", "migration_is_live"),
     [
@@ -892,6 +892,44 @@ async def test_reload_single_unchanged_does_not_stop(
     assert len(calls) == 1
 
 
+async def test_reload_validates_changed_automations(hass: HomeAssistant) -> None:
+    """Test that reloading only validates the automations which changed."""
+    config = {
+        automation.DOMAIN: [
+            {
+                "id": str(idx),
+                "alias": f"hello {idx}",
+                "triggers": {"platform": "event", "event_type": "test_event"},
+                "actions": {"event": "running"},
+            }
+            for idx in range(2)
+        ]
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+    first_entity = hass.data[automation.DATA_COMPONENT].get_entity("automation.hello_0")
+
+    config[automation.DOMAIN][1] = {**config[automation.DOMAIN][1], "alias": "bye"}
+    with (
+        patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value=config,
+        ),
+        patch(
+            "homeassistant.components.automation.config.PLATFORM_SCHEMA",
+            wraps=automation.config.PLATFORM_SCHEMA,
+        ) as mock_schema,
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert mock_schema.call_count == 1
+    assert hass.states.get("automation.hello_1").name == "bye"
+    assert (
+        hass.data[automation.DATA_COMPONENT].get_entity("automation.hello_0")
+        is first_entity
+    )
+
+
 async def test_reload_single_add_automation(
     hass: HomeAssistant, calls: list[ServiceCall]
 ) -> None:
@@ -0,0 +1,21 @@
+"""Test Home Assistant system health."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_access_token_cache_stats(
+    hass: HomeAssistant, hass_access_token: str
+) -> None:
+    """Test the stats of the access token cache are reported."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    assert await async_setup_component(hass, "system_health", {})
+    await hass.async_block_till_done()
+
+    for _ in range(2):
+        assert hass.auth.async_validate_access_token(hass_access_token) is not None
+
+    info = await get_system_health_info(hass, "homeassistant")
+    assert info["access_token_cache"].startswith("1 hits, 1 misses, ")
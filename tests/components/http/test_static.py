@@ -1,13 +1,29 @@
 """The tests for http static files."""
 
+import asyncio
 from http import HTTPStatus
 from pathlib import Path
+from unittest.mock import patch
 
+from aiohttp.hdrs import (
+    ACCEPT_ENCODING,
+    CACHE_CONTROL,
+    CONTENT_ENCODING,
+    ETAG,
+    IF_NONE_MATCH,
+    VARY,
+)
 from aiohttp.test_utils import TestClient
 import pytest
 
 from homeassistant.components.http import StaticPathConfig
-from homeassistant.components.http.static import CachingStaticResource
+from homeassistant.components.http.static import (
+    CACHE_HEADER,
+    CACHE_HEADER_IMMUTABLE,
+    INDEX_REVALIDATE_TIME,
+    STATIC_INDEX,
+    CachingStaticResource,
+)
 from homeassistant.const import EVENT_HOMEASSISTANT_START
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.http import KEY_ALLOW_CONFIGURED_CORS
@@ -63,3 +79,116 @@ async def test_async_register_static_paths(
     assert resp.status == HTTPStatus.OK
     resp = await client.get("/something_else/__init__.py")
     assert resp.status == HTTPStatus.OK
+
+
+async def test_static_resource_index(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test indexed files are served compressed and answer conditional requests."""
+    app = hass.http.app
+    resource = CachingStaticResource("/static", tmp_path)
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+    content = "console.log('hello');\n" * 100
+    await hass.async_add_executor_job((tmp_path / "card.js").write_text, content)
+
+    resp = await mock_http_client.get("/static/card.js")
+    assert resp.status == HTTPStatus.OK
+    assert await resp.text() == content
+    assert resp.headers[CACHE_CONTROL] == CACHE_HEADER
+
+    resp = await mock_http_client.get("/static/card.js")
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers[CONTENT_ENCODING] == "gzip"
+    assert resp.headers[VARY] == ACCEPT_ENCODING
+    assert resp.headers[CACHE_CONTROL] == CACHE_HEADER
+    assert await resp.text() == content
+    etag = resp.headers[ETAG]
+
+    with patch("homeassistant.components.http.static._index_file") as mock_index:
+        resp = await mock_http_client.get(
+            "/static/card.js", headers={IF_NONE_MATCH: etag}
+        )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+    assert resp.headers[ETAG] == etag
+    assert not mock_index.called
+
+    # Clients that do not accept gzip get the file itself
+    resp = await mock_http_client.get(
+        "/static/card.js", headers={ACCEPT_ENCODING: "identity"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert CONTENT_ENCODING not in resp.headers
+    assert resp.headers[ETAG] != etag
+
+    # Changed files are indexed again once the metadata is revalidated
+    new_content = "console.log('bye');\n" * 100
+    await hass.async_add_executor_job((tmp_path / "card.js").write_text, new_content)
+    with patch("homeassistant.components.http.static.INDEX_REVALIDATE_TIME", -1):
+        resp = await mock_http_client.get(
+            "/static/card.js", headers={IF_NONE_MATCH: etag}
+        )
+    assert resp.status == HTTPStatus.OK
+    assert await resp.text() == new_content
+    assert resp.headers[ETAG] != etag
+
+
+async def test_static_resource_fingerprinted_immutable(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test files with a content hash in their name are marked immutable."""
+    app = hass.http.app
+    resource = CachingStaticResource("/static", tmp_path)
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+    for name in ("app.5bd4b1d4d6a2f1c2.js", "card.js"):
+        await hass.async_add_executor_job((tmp_path / name).write_text, "a = 1;\n")
+
+    for _ in range(2):
+        resp = await mock_http_client.get("/static/app.5bd4b1d4d6a2f1c2.js")
+        assert resp.status == HTTPStatus.OK
+        assert resp.headers[CACHE_CONTROL] == CACHE_HEADER_IMMUTABLE
+
+        resp = await mock_http_client.get("/static/card.js")
+        assert resp.status == HTTPStatus.OK
+        assert resp.headers[CACHE_CONTROL] == CACHE_HEADER
+
+
+async def test_static_resource_index_revalidated(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test a file indexed again after revalidation is served from the index."""
+    app = hass.http.app
+    resource = CachingStaticResource("/static", tmp_path)
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+    await hass.async_add_executor_job(
+        (tmp_path / "card.js").write_text, "console.log('hello');\n" * 100
+    )
+    resp = await mock_http_client.get("/static/card.js")
+    assert resp.status == HTTPStatus.OK
+
+    new_content = "console.log('bye');\n" * 100
+    await hass.async_add_executor_job((tmp_path / "card.js").write_text, new_content)
+    for entry in STATIC_INDEX.values():
+        entry.checked -= INDEX_REVALIDATE_TIME + 1
+    resp = await mock_http_client.get("/static/card.js")
+    assert resp.status == HTTPStatus.OK
+    assert await resp.text() == new_content
+
+    with patch("homeassistant.components.http.static._index_file") as mock_index:
+        resp = await mock_http_client.get("/static/card.js")
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers[CONTENT_ENCODING] == "gzip"
+    assert await resp.text() == new_content
+    assert not mock_index.called
+
+    # Concurrent requests for a file that was removed all get a 404
+    await hass.async_add_executor_job((tmp_path / "card.js").unlink)
+    for entry in STATIC_INDEX.values():
+        entry.checked -= INDEX_REVALIDATE_TIME + 1
+    responses = await asyncio.gather(
+        mock_http_client.get("/static/card.js"),
+        mock_http_client.get("/static/card.js"),
+    )
+    assert [resp.status for resp in responses] == [HTTPStatus.NOT_FOUND] * 2
@@ -356,6 +356,65 @@ async def test_get_events_entities_filtered_away(
     assert len(results) == 0
 
 
+async def test_get_events_context_started_before_start_time(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events for entities resolves contexts that started earlier."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    context = core.Context(
+        id="01GTDGKBCH00GW0X476W5TVAAA",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.bus.async_fire(
+        EVENT_AUTOMATION_TRIGGERED,
+        {
+            ATTR_NAME: "Mock automation",
+            ATTR_ENTITY_ID: "automation.mock_automation",
+            ATTR_SOURCE: "source of trigger",
+        },
+        context=context,
+    )
+    await async_wait_recording_done(hass)
+
+    start_time = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", STATE_ON, context=context)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": start_time.isoformat(),
+            "entity_ids": ["light.kitchen"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == [
+        {
+            "context_domain": "automation",
+            "context_entity_id": "automation.mock_automation",
+            "context_event_type": "automation_triggered",
+            "context_message": "triggered by source of trigger",
+            "context_name": "Mock automation",
+            "context_source": "source of trigger",
+            "context_user_id": "b400facee45711eaa9308bfd3d19e474",
+            "entity_id": "light.kitchen",
+            "state": "on",
+            "when": ANY,
+        }
+    ]
+
+
 async def test_get_events_future_start_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -19,12 +19,15 @@ from homeassistant.components.profiler import (
     CONF_ENABLED,
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
+    SERVICE_DUMP_STARTUP_TRACE,
     SERVICE_LOG_CURRENT_TASKS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_LOOP_TIME,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
     SERVICE_SET_ASYNCIO_DEBUG,
+    SERVICE_SET_LOOP_TIME_TRACKING,
     SERVICE_START,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
@@ -35,7 +38,9 @@ from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.startup_trace import async_start_startup_trace
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import load_json
 
 from tests.common import MockConfigEntry, async_fire_time_changed
 
@@ -469,3 +474,67 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_loop_time(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
+    """Test tracking and logging the event loop time per integration."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    with pytest.raises(HomeAssistantError, match="not enabled"):
+        await hass.services.async_call(DOMAIN, SERVICE_LOG_LOOP_TIME, {}, blocking=True)
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SET_LOOP_TIME_TRACKING, {}, blocking=True
+    )
+    assert hass.loop_time is not None
+
+    await hass.services.async_call(DOMAIN, SERVICE_LOG_LOOP_TIME, {}, blocking=True)
+    assert "Event loop time of profiler" in caplog.text
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SET_LOOP_TIME_TRACKING, {CONF_ENABLED: False}, blocking=True
+    )
+    assert hass.loop_time is None
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_dump_startup_trace(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test writing the startup trace to a file."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    with pytest.raises(HomeAssistantError, match="No startup trace"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_DUMP_STARTUP_TRACE, {}, blocking=True
+        )
+
+    trace = async_start_startup_trace(hass)
+    trace.async_add("setup", "setup", "light", 0, 1)
+
+    last_filename = None
+
+    def _mock_path(filename: str) -> str:
+        nonlocal last_filename
+        last_filename = str(tmp_path / filename)
+        return last_filename
+
+    with patch.object(hass.config, "path", _mock_path):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_DUMP_STARTUP_TRACE, {}, blocking=True
+        )
+
+    assert load_json(last_filename) == trace.as_chrome_trace()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,48 @@
+"""Test the table manager helpers."""
+
+from unittest.mock import patch
+
+from lru import LRU
+
+from homeassistant.components.recorder import table_managers
+from homeassistant.components.recorder.table_managers import (
+    LRU_SIZE_SAMPLE,
+    MIN_LRU_SIZE,
+    adjust_lru_size_to_budget,
+    estimate_entry_bytes,
+    estimate_lru_bytes,
+)
+
+
+def test_estimate_lru_bytes_samples_entries() -> None:
+    """Test only a bounded number of entries are measured."""
+    lru = LRU(10000)
+    for idx in range(10000):
+        lru[f"sensor.entity_{idx:05}"] = idx
+    entry_bytes = estimate_entry_bytes("sensor.entity_00000", 10000)
+
+    with patch.object(
+        table_managers, "estimate_entry_bytes", wraps=estimate_entry_bytes
+    ) as mock_estimate:
+        estimated = estimate_lru_bytes(lru)
+    assert mock_estimate.call_count == LRU_SIZE_SAMPLE
+    assert estimated == entry_bytes * 10000
+    assert estimate_lru_bytes(LRU(10)) == 0
+
+
+def test_adjust_lru_size_to_budget() -> None:
+    """Test the LRU grows within its budget and shrinks down to the floor."""
+    lru = LRU(1000)
+    for idx in range(1000):
+        lru[f"sensor.entity_{idx:05}"] = idx
+    entry_bytes = estimate_entry_bytes("sensor.entity_00000", 10000)
+
+    adjust_lru_size_to_budget(lru, 4000, entry_bytes * 2000)
+    assert lru.get_size() == 2000
+
+    adjust_lru_size_to_budget(lru, 4000, entry_bytes * 500)
+    assert lru.get_size() == 500
+
+    # The LRU is not shrunk below the floor even when over budget
+    adjust_lru_size_to_budget(lru, 4000, entry_bytes)
+    assert lru.get_size() == MIN_LRU_SIZE
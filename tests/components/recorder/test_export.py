@@ -0,0 +1,298 @@
+"""Test exporting and importing recorder data."""
+
+from datetime import timedelta
+from pathlib import Path
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import Recorder, export
+from homeassistant.components.recorder.const import DOMAIN
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    async_import_statistics,
+    statistics_during_period,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import json_dumps
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
+
+from .common import async_wait_recording_done
+
+from tests.typing import WebSocketGenerator
+
+
+@pytest.fixture
+def export_path(hass: HomeAssistant, tmp_path: Path) -> Path:
+    """Return an allowed path for the export file."""
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+    return tmp_path / "export.jsonl"
+
+
+async def test_export_and_import(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    export_path: Path,
+) -> None:
+    """Test exporting states and statistics and importing the statistics."""
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=3
+    )
+    hass.states.async_set("sensor.test", "10", {"unit_of_measurement": "kWh"})
+    hass.states.async_set("sensor.other", "1")
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "External",
+        "source": "test",
+        "statistic_id": "test:total",
+        "unit_of_measurement": "kWh",
+    }
+    sensor_metadata = {
+        **external_metadata,
+        "name": "Sensor",
+        "source": DOMAIN,
+        "statistic_id": "sensor.test",
+    }
+    stats = [
+        {"start": start + timedelta(hours=hour), "state": hour, "sum": hour * 2}
+        for hour in range(3)
+    ]
+    async_add_external_statistics(hass, external_metadata, stats)
+    async_import_statistics(hass, sensor_metadata, stats)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "recorder/export",
+            "filename": str(export_path),
+            "entity_ids": ["sensor.test", "test:total"],
+            "start_time": start.isoformat(),
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "rows": {"states": 1, "statistics": 6, "statistics_short_term": 0}
+    }
+
+    lines = [json_loads(line) for line in export_path.read_bytes().splitlines()]
+    assert lines[0] == {"format": "recorder_export", "version": 1}
+    assert lines[1]["table"] == "states"
+    assert lines[1]["entity_id"] == "sensor.test"
+    assert lines[1]["state"] == "10"
+    assert lines[1]["attributes"] == {"unit_of_measurement": "kWh"}
+    assert {line["statistic_id"] for line in lines[2:4]} == {
+        "sensor.test",
+        "test:total",
+    }
+    assert all(line["table"] == "statistics" for line in lines[4:])
+
+    recorder_mock.async_clear_statistics(["sensor.test", "test:total"])
+    await async_wait_recording_done(hass)
+
+    await client.send_json_auto_id(
+        {"type": "recorder/import", "filename": str(export_path)}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"imported": 6}
+    await async_wait_recording_done(hass)
+
+    imported = await hass.async_add_executor_job(
+        statistics_during_period,
+        hass,
+        start,
+        None,
+        {"sensor.test", "test:total"},
+        "hour",
+        None,
+        {"state", "sum"},
+    )
+    for statistic_id in ("sensor.test", "test:total"):
+        assert [(row["state"], row["sum"]) for row in imported[statistic_id]] == [
+            (0.0, 0.0),
+            (1.0, 2.0),
+            (2.0, 4.0),
+        ]
+
+
+async def test_export_and_import_services(
+    recorder_mock: Recorder, hass: HomeAssistant, export_path: Path
+) -> None:
+    """Test the export and import services."""
+    start = dt_util.utcnow() - timedelta(hours=1)
+    hass.states.async_set("sensor.test", "10")
+    await async_wait_recording_done(hass)
+
+    await hass.services.async_call(
+        DOMAIN,
+        "export",
+        {
+            "filename": str(export_path),
+            "entity_id": "sensor.test",
+            "start_time": start,
+            "tables": ["states"],
+        },
+        blocking=True,
+    )
+    lines = export_path.read_bytes().splitlines()
+    assert len(lines) == 2
+    assert json_loads(lines[1])["state"] == "10"
+
+    await hass.services.async_call(
+        DOMAIN, "import", {"filename": str(export_path)}, blocking=True
+    )
+
+
+async def test_export_and_import_not_allowed_path(
+    recorder_mock: Recorder, hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test files outside the allowed directories are rejected."""
+    path = str(tmp_path / "export.jsonl")
+    with pytest.raises(HomeAssistantError, match="no access to path"):
+        await hass.services.async_call(
+            DOMAIN,
+            "export",
+            {
+                "filename": path,
+                "entity_id": "sensor.test",
+                "start_time": dt_util.utcnow(),
+            },
+            blocking=True,
+        )
+    with pytest.raises(HomeAssistantError, match="no access to path"):
+        await hass.services.async_call(
+            DOMAIN, "import", {"filename": path}, blocking=True
+        )
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        {"table": "statistics_meta", "statistic_id": "sensor.test"},
+        {"table": "statistics", "start_ts": 0},
+        {"table": "statistics", "statistic_id": "sensor.test"},
+        {"table": "statistics", "statistic_id": "sensor.test", "start_ts": "0"},
+    ],
+)
+async def test_import_invalid_record(
+    recorder_mock: Recorder, hass: HomeAssistant, export_path: Path, record: dict
+) -> None:
+    """Test malformed records are rejected with a clear error."""
+    metadata = {
+        "table": "statistics_meta",
+        "statistic_id": "sensor.test",
+        "has_mean": False,
+        "has_sum": True,
+        "name": None,
+        "source": "recorder",
+        "unit_of_measurement": None,
+    }
+    export_path.write_bytes(
+        b"\n".join(
+            [
+                json_dumps({"format": "recorder_export", "version": 1}).encode(),
+                json_dumps(metadata).encode(),
+                json_dumps(record).encode(),
+            ]
+        )
+    )
+    with pytest.raises(HomeAssistantError, match="Invalid export record"):
+        await hass.services.async_call(
+            DOMAIN, "import", {"filename": str(export_path)}, blocking=True
+        )
+
+
+async def test_import_waits_for_recorder_between_chunks(
+    recorder_mock: Recorder, hass: HomeAssistant, export_path: Path
+) -> None:
+    """Test the import waits for the recorder queue after each chunk it reads."""
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=3
+    )
+    lines = [
+        {"format": "recorder_export", "version": 1},
+        {
+            "table": "statistics_meta",
+            "statistic_id": "sensor.test",
+            "has_mean": False,
+            "has_sum": True,
+            "name": None,
+            "source": "recorder",
+            "unit_of_measurement": None,
+        },
+    ]
+    lines.extend(
+        {
+            "table": "statistics",
+            "statistic_id": "sensor.test",
+            "start_ts": (start + timedelta(hours=hour)).timestamp(),
+            "state": hour,
+            "sum": hour,
+        }
+        for hour in range(3)
+    )
+    export_path.write_bytes(b"\n".join(json_dumps(line).encode() for line in lines))
+
+    with (
+        patch.object(export, "IMPORT_BATCH_SIZE", 1),
+        patch.object(export, "IMPORT_READ_SIZE", 1),
+        patch.object(
+            recorder_mock,
+            "async_block_till_done",
+            wraps=recorder_mock.async_block_till_done,
+        ) as mock_block_till_done,
+    ):
+        await hass.services.async_call(
+            DOMAIN, "import", {"filename": str(export_path)}, blocking=True
+        )
+    assert mock_block_till_done.call_count == 3
+
+
+async def test_import_parses_records_in_executor(
+    recorder_mock: Recorder, hass: HomeAssistant, export_path: Path
+) -> None:
+    """Test the records are parsed and converted outside the event loop."""
+    lines = [
+        {"format": "recorder_export", "version": 1},
+        {
+            "table": "statistics_meta",
+            "statistic_id": "sensor.test",
+            "has_mean": False,
+            "has_sum": True,
+            "name": None,
+            "source": "recorder",
+            "unit_of_measurement": None,
+        },
+        {
+            "table": "statistics",
+            "statistic_id": "sensor.test",
+            "start_ts": dt_util.utcnow()
+            .replace(minute=0, second=0, microsecond=0)
+            .timestamp(),
+            "sum": 1,
+        },
+    ]
+    export_path.write_bytes(b"\n".join(json_dumps(line).encode() for line in lines))
+    threads: set[int] = set()
+
+    def _parse_line(line: bytes) -> dict:
+        threads.add(threading.get_ident())
+        return parse_line(line)
+
+    parse_line = export._parse_line
+    with patch.object(export, "_parse_line", _parse_line):
+        await hass.services.async_call(
+            DOMAIN,
+            "import",
+            {"filename": str(export_path), "format": "jsonl"},
+            blocking=True,
+        )
+    assert threads
+    assert threading.get_ident() not in threads
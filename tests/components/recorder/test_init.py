@@ -58,6 +58,7 @@ from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
     SERVICE_PURGE_ENTITIES,
 )
+from homeassistant.components.recorder.statistics import async_import_statistics
 from homeassistant.components.recorder.table_managers import (
     state_attributes as state_attributes_table_manager,
     states_meta as states_meta_table_manager,
@@ -2512,6 +2513,78 @@ async def test_lru_increases_with_many_entities(
     assert instance.states_meta_manager._id_map.get_size() == mock_entity_count * 2
 
 
+async def test_lru_stays_within_memory_budget(
+    small_cache_size: None, hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test that the recorder's internal LRU cache does not outgrow its memory budget."""
+    instance = get_instance(hass)
+    instance.state_attributes_manager.max_bytes = 1024
+    mock_entity_count = 16
+    for idx in range(mock_entity_count):
+        hass.states.async_set(f"test.entity{idx}", "on", {"large": f"{idx}{"x" * 512}"})
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=10))
+    await async_wait_recording_done(hass)
+
+    assert instance.state_attributes_manager._id_map.get_size() == 8
+    assert instance.states_meta_manager._id_map.get_size() == mock_entity_count * 2
+    stats = instance.state_attributes_manager.cache_stats()
+    assert stats.max_bytes == 1024
+    assert stats.evictions > 0
+
+
+async def test_prime_caches_from_database(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test that the recorder's internal LRU caches can be primed in bulk."""
+    hass.states.async_set("test.entity1", "on", {"attr": 1})
+    hass.states.async_set("test.entity2", "on", {"attr": 2})
+    hass.bus.async_fire("custom_event", {"data": 1})
+    await async_wait_recording_done(hass)
+
+    instance = get_instance(hass)
+    async_import_statistics(
+        hass,
+        {
+            "has_mean": True,
+            "has_sum": False,
+            "name": None,
+            "source": "recorder",
+            "statistic_id": "test.entity1",
+            "unit_of_measurement": None,
+        },
+        [{"start": dt_util.utcnow().replace(minute=0, second=0, microsecond=0)}],
+    )
+    await async_wait_recording_done(hass)
+    managers = (
+        instance.statistics_meta_manager,
+        instance.states_meta_manager,
+        instance.state_attributes_manager,
+        instance.event_type_manager,
+        instance.event_data_manager,
+    )
+
+    def _reset_and_prime() -> None:
+        with (
+            patch.object(instance, "thread_id", threading.get_ident()),
+            session_scope(session=instance.get_session()) as session,
+        ):
+            for manager in managers:
+                manager.reset()
+                manager.prime_cache(session)
+
+    await instance.async_add_executor_job(_reset_and_prime)
+
+    assert instance.states_meta_manager.get_from_cache("test.entity1") is not None
+    assert instance.states_meta_manager.get_from_cache("test.entity2") is not None
+    assert instance.state_attributes_manager.get_from_cache('{"attr":1}') is not None
+    assert instance.event_type_manager.get_from_cache("custom_event") is not None
+    assert instance.event_data_manager.get_from_cache('{"data":1}') is not None
+    assert instance.statistics_meta_manager.get_from_cache_threadsafe(
+        {"test.entity1"}
+    ).keys() == {"test.entity1"}
+
+
 async def test_clean_shutdown_when_recorder_thread_raises_during_initialize_database(
     hass: HomeAssistant,
 ) -> None:
@@ -0,0 +1,162 @@
+"""Test the recorder read queue."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import gc
+import threading
+
+import pytest
+
+from homeassistant.components.recorder import Recorder, get_instance
+from homeassistant.components.recorder.read_queue import (
+    READ_PRIORITY_BULK,
+    READ_PRIORITY_INTERACTIVE,
+    READ_PRIORITY_STREAM,
+    ReadQueue,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+
+@pytest.fixture
+def executor() -> ThreadPoolExecutor:
+    """Return an executor with a single worker."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+async def test_read_queue_priority_and_fairness(
+    hass: HomeAssistant, executor: ThreadPoolExecutor
+) -> None:
+    """Test jobs are ordered by priority and interleaved between owners."""
+    read_queue = ReadQueue(hass, 1)
+    read_queue.async_set_executor(executor)
+    release = threading.Event()
+    order: list[str] = []
+
+    def _job(name: str) -> str:
+        order.append(name)
+        return name
+
+    blocker = read_queue.async_add_job(
+        release.wait, (), READ_PRIORITY_INTERACTIVE, None
+    )
+    futures = [
+        read_queue.async_add_job(_job, ("bulk",), READ_PRIORITY_BULK, "a"),
+        read_queue.async_add_job(_job, ("a1",), READ_PRIORITY_STREAM, "a"),
+        read_queue.async_add_job(_job, ("a2",), READ_PRIORITY_STREAM, "a"),
+        read_queue.async_add_job(_job, ("a3",), READ_PRIORITY_STREAM, "a"),
+        read_queue.async_add_job(_job, ("b1",), READ_PRIORITY_STREAM, "b"),
+        read_queue.async_add_job(_job, ("b2",), READ_PRIORITY_STREAM, "b"),
+        read_queue.async_add_job(
+            _job, ("interactive",), READ_PRIORITY_INTERACTIVE, "c"
+        ),
+    ]
+    stats = read_queue.async_stats()
+    assert stats.queued == 7
+    assert stats.running == 1
+
+    release.set()
+    assert await blocker is True
+    assert await asyncio.gather(*futures) == [
+        "bulk",
+        "a1",
+        "a2",
+        "a3",
+        "b1",
+        "b2",
+        "interactive",
+    ]
+    assert order == ["interactive", "a1", "b1", "a2", "b2", "a3", "bulk"]
+
+    stats = read_queue.async_stats()
+    assert stats.queued == 0
+    assert stats.running == 0
+    assert stats.completed == 8
+    assert stats.cancelled == 0
+    assert stats.max_wait > 0
+
+
+async def test_read_queue_cancelled_jobs_never_run(
+    hass: HomeAssistant, executor: ThreadPoolExecutor
+) -> None:
+    """Test jobs cancelled while queued are not run."""
+    read_queue = ReadQueue(hass, 1)
+    read_queue.async_set_executor(executor)
+    release = threading.Event()
+    ran: list[str] = []
+
+    blocker = read_queue.async_add_job(
+        release.wait, (), READ_PRIORITY_INTERACTIVE, None
+    )
+    cancelled = read_queue.async_add_job(
+        ran.append, ("cancelled",), READ_PRIORITY_STREAM, "a"
+    )
+    kept = read_queue.async_add_job(ran.append, ("kept",), READ_PRIORITY_STREAM, "b")
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    stats = read_queue.async_stats()
+
+    release.set()
+    await blocker
+    await kept
+    assert stats.queued == 1
+    assert stats.cancelled == 1
+    assert ran == ["kept"]
+    assert read_queue.async_stats().cancelled == 1
+
+
+async def test_read_queue_propagates_exceptions(
+    hass: HomeAssistant, executor: ThreadPoolExecutor
+) -> None:
+    """Test exceptions raised by a job are raised to the caller."""
+    read_queue = ReadQueue(hass, 1)
+    read_queue.async_set_executor(executor)
+
+    def _raise() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await read_queue.async_add_job(_raise, (), READ_PRIORITY_INTERACTIVE, None)
+    assert read_queue.async_stats().completed == 1
+
+
+async def test_read_queue_retrieves_exceptions_of_abandoned_jobs(
+    hass: HomeAssistant,
+    executor: ThreadPoolExecutor,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test exceptions of jobs whose caller went away are not logged as unretrieved."""
+    read_queue = ReadQueue(hass, 1)
+    read_queue.async_set_executor(executor)
+    release = threading.Event()
+
+    def _raise() -> None:
+        release.wait()
+        raise ValueError("boom")
+
+    future = read_queue.async_add_job(_raise, (), READ_PRIORITY_INTERACTIVE, None)
+    future.cancel()
+    release.set()
+    await hass.async_add_executor_job(executor.submit(lambda: None).result)
+    await asyncio.sleep(0)
+    del future
+    gc.collect()
+
+    assert read_queue.async_stats().completed == 1
+    assert "never retrieved" not in caplog.text
+
+
+async def test_recorder_read_job_runs_on_read_executor(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test read jobs run on the read executor with a database session."""
+    instance = get_instance(hass)
+
+    def _read() -> str:
+        with session_scope(session=instance.get_session(), read_only=True):
+            return threading.current_thread().name
+
+    thread_name = await instance.async_add_read_job(_read)
+    assert thread_name.startswith("DbReader")
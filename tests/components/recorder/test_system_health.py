@@ -35,6 +35,12 @@ async def test_recorder_system_health(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "states_meta_cache": ANY,
+        "state_attributes_cache": ANY,
+        "event_types_cache": ANY,
+        "event_data_cache": ANY,
+        "statistics_meta_cache": ANY,
+        "read_queue": ANY,
     }
 
 
@@ -64,6 +70,12 @@ async def test_recorder_system_health_alternate_dbms(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "states_meta_cache": ANY,
+        "state_attributes_cache": ANY,
+        "event_types_cache": ANY,
+        "event_data_cache": ANY,
+        "statistics_meta_cache": ANY,
+        "read_queue": ANY,
     }
 
 
@@ -99,6 +111,12 @@ async def test_recorder_system_health_db_url_missing_host(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "states_meta_cache": ANY,
+        "state_attributes_cache": ANY,
+        "event_types_cache": ANY,
+        "event_data_cache": ANY,
+        "statistics_meta_cache": ANY,
+        "read_queue": ANY,
     }
 
 
@@ -127,4 +145,29 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "states_meta_cache": ANY,
+        "state_attributes_cache": ANY,
+        "event_types_cache": ANY,
+        "event_data_cache": ANY,
+        "statistics_meta_cache": ANY,
+        "read_queue": ANY,
     }
+
+
+async def test_recorder_system_health_cache_stats(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health reports the table manager cache stats."""
+    assert await async_setup_component(hass, "system_health", {})
+    hass.states.async_set("sensor.test", "on", {"unit_of_measurement": "W"})
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "recorder")
+    instance = get_instance(hass)
+    stats = instance.states_meta_manager.cache_stats()
+    assert stats.entries >= 1
+    assert stats.estimated_bytes > 0
+    assert info["states_meta_cache"] == (
+        f"{stats.entries}/{stats.max_entries} entries, "
+        f"{stats.estimated_bytes/1024/1024:.2f}/{stats.max_bytes/1024/1024:.2f} MiB, "
+        f"{stats.hits} hits, {stats.misses} misses, {stats.evictions} evictions"
+    )
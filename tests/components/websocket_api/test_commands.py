@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
@@ -18,15 +19,21 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
+from homeassistant.components.websocket_api.snapshot import async_get_states_snapshot
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -34,6 +41,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -843,6 +851,162 @@ async def test_get_states_not_allows_nan(
     ]
 
 
+async def test_get_states_shares_snapshot(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test get_states and subscribe_entities share the serialized states."""
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.hall", "off")
+    snapshot = async_get_states_snapshot(hass)
+
+    async def _get_states(msg_id: int) -> list[dict[str, Any]]:
+        await websocket_client.send_json({"id": msg_id, "type": "get_states"})
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        return msg["result"]
+
+    assert await _get_states(1) == [
+        state.as_dict() for state in hass.states.async_all()
+    ]
+    assert await _get_states(2) == [
+        state.as_dict() for state in hass.states.async_all()
+    ]
+    assert snapshot.states.builds == 1
+    assert snapshot.states.hits == 1
+
+    # Changed and new entities are patched in the order of the state machine
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_remove("light.hall")
+    hass.states.async_set("light.hall", "on")
+    hass.states.async_set("light.porch", "on")
+    assert await _get_states(3) == [
+        state.as_dict() for state in hass.states.async_all()
+    ]
+    assert snapshot.states.builds == 2
+
+    await websocket_client.send_json({"id": 4, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"].keys() == {"light.kitchen", "light.hall", "light.porch"}
+    assert snapshot.compressed_states.builds == 1
+
+    # Payloads filtered by permissions are cached per user
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.hall": True}}})
+    assert [state["entity_id"] for state in await _get_states(5)] == ["light.hall"]
+    assert [state["entity_id"] for state in await _get_states(6)] == ["light.hall"]
+    assert snapshot.states.builds == 3
+    assert snapshot.states.hits == 2
+
+
+async def test_request_metrics(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test the latency and size of websocket commands are recorded."""
+    await websocket_client.send_json({"id": 1, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "pong"
+    await websocket_client.send_json({"id": 2, "type": "get_services"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    await websocket_client.send_json({"id": 3, "type": "request_metrics"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    metrics = msg["result"]["websocket"]
+    assert metrics["ping"]["latency"]["count"] == 1
+    assert metrics["ping"]["size"]["count"] == 1
+    assert metrics["ping"]["size"]["buckets"]["256"] == 1
+    assert metrics["get_services"]["latency"]["count"] == 1
+    assert metrics["get_services"]["in_flight"] == 0
+    assert metrics["request_metrics"]["latency"]["count"] == 0
+    assert "http" in msg["result"]
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 4, "type": "request_metrics"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_loop_time(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test enabling and reading the event loop time per integration."""
+    await websocket_client.send_json({"id": 1, "type": "loop_time"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"enabled": False, "domains": {}}
+
+    await websocket_client.send_json({"id": 2, "type": "loop_time", "enabled": True})
+    msg = await websocket_client.receive_json()
+    assert msg["result"]["enabled"] is True
+
+    await websocket_client.send_json({"id": 3, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "pong"
+
+    await websocket_client.send_json({"id": 4, "type": "loop_time"})
+    msg = await websocket_client.receive_json()
+    # The websocket reader task was created before tracking was enabled
+    assert msg["result"]["enabled"] is True
+    assert isinstance(msg["result"]["domains"], dict)
+
+    await websocket_client.send_json({"id": 5, "type": "loop_time", "enabled": False})
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == {"enabled": False, "domains": {}}
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 6, "type": "loop_time"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_blocking_calls(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test enabling and reading the blocking calls telemetry."""
+    await websocket_client.send_json({"id": 1, "type": "blocking_calls"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"enabled": False}
+
+    await websocket_client.send_json(
+        {"id": 2, "type": "blocking_calls", "enabled": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == {
+        "enabled": True,
+        "threshold": 0.25,
+        "dropped": 0,
+        "integrations": {},
+        "calls": [],
+    }
+
+    await websocket_client.send_json(
+        {"id": 3, "type": "blocking_calls", "enabled": False}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == {"enabled": False}
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 4, "type": "blocking_calls"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 async def test_subscribe_unsubscribe_events_whitelist(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -1310,6 +1474,175 @@ async def test_subscribe_unsubscribe_entities_with_filter(
     }
 
 
+async def test_subscribe_entities_with_area_and_domain(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test subscribing to the entities of an area restricted to a domain."""
+    kitchen = area_registry.async_create("Kitchen")
+    kitchen_light = entity_registry.async_get_or_create(
+        "light", "test", "kitchen", suggested_object_id="kitchen"
+    )
+    entity_registry.async_update_entity(kitchen_light.entity_id, area_id=kitchen.id)
+    kitchen_sensor = entity_registry.async_get_or_create(
+        "sensor", "test", "kitchen", suggested_object_id="kitchen"
+    )
+    entity_registry.async_update_entity(kitchen_sensor.entity_id, area_id=kitchen.id)
+    other_light = entity_registry.async_get_or_create(
+        "light", "test", "other", suggested_object_id="other"
+    )
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("sensor.kitchen", "20")
+    hass.states.async_set("light.other", "off")
+
+    await websocket_client.send_json_auto_id(
+        {"type": "subscribe_entities", "area_id": kitchen.id, "domain": "light"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg_id = msg["id"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == msg_id
+    assert list(msg["event"]["a"]) == ["light.kitchen"]
+
+    hass.states.async_set("sensor.kitchen", "21")
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.kitchen", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.kitchen": {"+": {"s": "on", "lc": ANY, "c": ANY}}}
+    }
+
+    # Entities moved into or out of the area are added or removed
+    entity_registry.async_update_entity(other_light.entity_id, area_id=kitchen.id)
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {"light.other": {"s": "on", "a": {}, "c": ANY, "lc": ANY}}
+    }
+    entity_registry.async_update_entity(kitchen_light.entity_id, area_id=None)
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.kitchen"]}
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.other", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.other": {"+": {"s": "off", "lc": ANY, "c": ANY}}}
+    }
+
+
+async def test_subscribe_entities_with_glob_and_device_class(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test restrictions without a target include entities added later."""
+    hass.states.async_set(
+        "sensor.outdoor_temperature", "10", {"device_class": "temperature"}
+    )
+    hass.states.async_set("sensor.outdoor_humidity", "50", {"device_class": "humidity"})
+    hass.states.async_set(
+        "sensor.indoor_temperature", "20", {"device_class": "temperature"}
+    )
+
+    await websocket_client.send_json_auto_id(
+        {
+            "type": "subscribe_entities",
+            "entity_glob": "sensor.outdoor_*",
+            "device_class": "temperature",
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["sensor.outdoor_temperature"]
+
+    hass.states.async_set(
+        "sensor.indoor_temperature", "21", {"device_class": "temperature"}
+    )
+    hass.states.async_set("sensor.outdoor_pool", "25", {"device_class": "temperature"})
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]) == ["a"]
+    assert list(msg["event"]["a"]) == ["sensor.outdoor_pool"]
+
+    hass.states.async_set("sensor.outdoor_pool", "26", {"device_class": "temperature"})
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"sensor.outdoor_pool": {"+": {"s": "26", "lc": ANY, "c": ANY}}}
+    }
+
+
+async def test_subscribe_entities_with_batch_window(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test changes are coalesced into one message per batch window."""
+    hass.states.async_set("light.changed", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "off")
+    await websocket_client.send_json_auto_id(
+        {"type": "subscribe_entities", "batch_window_ms": 200}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    msg_id = msg["id"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == msg_id
+    assert set(msg["event"]["a"]) == {"light.changed", "light.removed"}
+
+    hass.states.async_set("light.changed", "on", {"color": "blue"})
+    hass.states.async_set("light.changed", "on", {"color": "green"})
+    hass.states.async_set("light.added", "on")
+    hass.states.async_set("light.added_and_removed", "on")
+    hass.states.async_remove("light.added_and_removed")
+    hass.states.async_remove("light.removed")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == msg_id
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.added": {
+                "a": {},
+                "c": ANY,
+                "lc": ANY,
+                "s": "on",
+            }
+        },
+        "c": {
+            "light.changed": {
+                "+": {
+                    "a": {"color": "green"},
+                    "c": ANY,
+                    "lc": ANY,
+                    "s": "on",
+                }
+            }
+        },
+        "r": ["light.removed"],
+    }
+
+    # Pending changes are dropped when unsubscribing
+    hass.states.async_set("light.changed", "off")
+    await hass.async_block_till_done()
+    await websocket_client.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": msg_id}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    await websocket_client.send_json_auto_id({"type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "pong"
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -324,13 +324,13 @@ async def test_pending_msg_peak_but_does_not_overflow(
 
     # Kill writer task and fill queue past peak
     for _ in range(5):
-        instance._message_queue.append(None)
+        instance._lanes[const.LANE_RESULT].queue.append(b"{}")
 
     # Trigger the peak check
     instance._send_message({})
 
     # Clear the queue
-    instance._message_queue.clear()
+    instance._lanes[const.LANE_RESULT].queue.clear()
 
     # Trigger the peak clear
     instance._send_message({})
@@ -523,3 +523,147 @@ async def test_binary_message(
     assert "Received binary message for non-existing handler 0" in caplog.text
     assert "Received binary message for non-existing handler 3" in caplog.text
     assert "Received binary message for non-existing handler 10" in caplog.text
+
+
+async def test_compression_stats(
+    hass: HomeAssistant, no_auth_websocket_client, hass_access_token: str
+) -> None:
+    """Test frames sent over a compressed connection are counted."""
+    hass.states.async_set("sensor.large", "on", {"data": "x" * 4096})
+    ws = await no_auth_websocket_client.client.ws_connect(const.URL, compress=15)
+    msg = await ws.receive_json()
+    assert msg["type"] == "auth_required"
+    await ws.send_json({"type": "auth", "access_token": hass_access_token})
+    msg = await ws.receive_json()
+    assert msg["type"] == "auth_ok"
+
+    await ws.send_json({"id": 1, "type": "get_states"})
+    msg = await ws.receive_json()
+    assert msg["result"][0]["attributes"]["data"] == "x" * 4096
+
+    await ws.send_json({"id": 2, "type": "compression_stats"})
+    msg = await ws.receive_json()
+    stats = msg["result"]
+    assert stats["enabled"] is True
+    # auth_required, auth_ok and get_states
+    assert stats["frames"] == 3
+    assert stats["bytes_in"] > 4096
+    assert stats["compression_time"] > 0
+
+    await ws.send_json({"id": 3, "type": "get_states"})
+    msg = await ws.receive_json()
+    assert msg["result"][0]["attributes"]["data"] == "x" * 4096
+    await ws.send_json({"id": 4, "type": "compression_stats"})
+    msg = await ws.receive_json()
+    assert msg["result"]["frames"] == 5
+    await ws.close()
+
+
+async def test_compression_not_negotiated(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test compression stats when the client did not negotiate compression."""
+    await websocket_client.send_json_auto_id({"type": "compression_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == {"enabled": False}
+
+
+async def test_results_and_events_sent_in_order(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test results and events keep their order and come before bulk messages."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+
+    instance._send_message({"id": 1, "type": "bulk"}, const.LANE_BULK)
+    instance._send_message({"id": 2, "type": "event"}, const.LANE_EVENT)
+    instance._send_message({"id": 3, "type": "result"})
+    instance._send_message({"id": 4, "type": "event"}, const.LANE_EVENT)
+    instance._send_message({"id": 5, "type": "result"})
+
+    received = [(await websocket_client.receive_json())["id"] for _ in range(5)]
+    assert received == [2, 3, 4, 5, 1]
+
+
+async def test_subscribe_events_not_dropped_when_lagging(
+    hass: HomeAssistant, mock_low_peak, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test state_changed events of subscribe_events are never dropped."""
+    await websocket_client.send_json_auto_id(
+        {"type": "subscribe_events", "event_type": "state_changed"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    for value in range(10):
+        hass.states.async_set("light.kitchen", str(value))
+
+    received = [
+        (await websocket_client.receive_json())["event"]["data"]["new_state"]["state"]
+        for _ in range(10)
+    ]
+    assert received == [str(value) for value in range(10)]
+
+
+async def test_pending_events_drop_superseded_messages(
+    hass: HomeAssistant,
+    mock_low_peak,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a lagging client gets only the newest event per coalesce key."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    connection = cast(ActiveConnection, instance._connection)
+
+    for value in range(5):
+        instance._send_message({"id": 1, "event": value}, const.LANE_EVENT, "other")
+    assert connection.events_lagging is True
+    for value in range(5, 10):
+        instance._send_message({"id": 1, "event": value}, const.LANE_EVENT, "key")
+
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=const.PENDING_MSG_PEAK_TIME + 1)
+    )
+
+    received = [(await websocket_client.receive_json())["event"] for _ in range(6)]
+    # The first messages of "other" were queued before the client was lagging
+    assert received == [0, 1, 2, 3, 4, 9]
+    assert connection.events_lagging is False
+
+    await websocket_client.send_json_auto_id({"type": "queue_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"]["event"] == {
+        "pending": 0,
+        "sent": 6,
+        "dropped": 4,
+        "max_pending": 6,
+    }
+    assert msg["result"]["result"]["pending"] == 0
+    assert "Client unable to keep up with pending messages" not in caplog.text
@@ -6,10 +6,12 @@ from homeassistant.components.websocket_api.messages import (
     _partial_cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
+    cached_state_full_message,
     message_to_json_bytes,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.util.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -281,6 +283,33 @@ async def test_state_diff_event(hass: HomeAssistant) -> None:
     }
 
 
+async def test_cached_state_full_message(hass: HomeAssistant) -> None:
+    """Test the full state message does not depend on the previous state."""
+    state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "on", {"brightness": 10})
+    hass.states.async_set("light.window", "off")
+    hass.states.async_remove("light.window")
+    await hass.async_block_till_done()
+
+    messages = [
+        json_loads(cached_state_full_message(b"5", event))
+        for event in state_change_events
+    ]
+    assert messages[1]["id"] == 5
+    assert messages[1]["type"] == "event"
+    assert messages[1]["event"] == {
+        "a": {
+            "light.window": {
+                "s": "off",
+                "a": {},
+                "c": state_change_events[1].data["new_state"].context.id,
+                "lc": state_change_events[1].data["new_state"].last_changed_timestamp,
+            }
+        }
+    }
+    assert messages[2]["event"] == {"r": ["light.window"]}
+
+
 async def test_message_to_json_bytes(caplog: pytest.LogCaptureFixture) -> None:
     """Test we can serialize websocket messages."""
 
@@ -2617,6 +2617,20 @@ async def test_async_write_ha_state_thread_safety(hass: HomeAssistant) -> None:
     assert not hass.states.get(ent2.entity_id)
 
 
+async def test_async_write_ha_state_loop_time(hass: HomeAssistant) -> None:
+    """Test state writes are attributed to the platform when tracking."""
+    hass.async_set_loop_time_tracking(True)
+
+    ent = entity.Entity()
+    ent.entity_id = "test.any"
+    ent.hass = hass
+    ent.platform = MockEntityPlatform(hass, domain="test", platform_name="hue")
+    ent.async_write_ha_state()
+    assert hass.states.get(ent.entity_id)
+
+    assert hass.loop_time.as_dict()["hue"]["count"] == 1
+
+
 async def test_async_write_ha_state_thread_safety_always(
     hass: HomeAssistant,
 ) -> None:
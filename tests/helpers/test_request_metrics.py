@@ -0,0 +1,43 @@
+"""Test the request metrics helper."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.request_metrics import (
+    KIND_HTTP,
+    KIND_WEBSOCKET,
+    async_get_request_metrics,
+)
+
+
+async def test_prometheus_exposition(hass: HomeAssistant) -> None:
+    """Test the metrics in the Prometheus text format."""
+    registry = async_get_request_metrics(hass)
+    assert registry is async_get_request_metrics(hass)
+    metrics = registry.async_get(KIND_HTTP, 'api:"quoted"')
+    assert registry.async_get(KIND_HTTP, 'api:"quoted"') is metrics
+    metrics.latency.observe(0.002)
+    metrics.sizes.observe(2000)
+    registry.async_get(KIND_WEBSOCKET, "ping").in_flight = 1
+
+    text = registry.as_prometheus()
+    assert 'homeassistant_http_requests_in_flight{view="api:\\"quoted\\""} 0\n' in text
+    assert (
+        'homeassistant_http_request_duration_seconds_bucket{view="api:\\"quoted\\"",le="0.001"} 0\n'
+        in text
+    )
+    assert (
+        'homeassistant_http_request_duration_seconds_bucket{view="api:\\"quoted\\"",le="0.0025"} 1\n'
+        in text
+    )
+    assert (
+        'homeassistant_http_request_response_size_bytes_bucket{view="api:\\"quoted\\"",le="+Inf"} 1\n'
+        in text
+    )
+    assert (
+        'homeassistant_http_request_response_size_bytes_sum{view="api:\\"quoted\\""} 2000\n'
+        in text
+    )
+    assert 'homeassistant_websocket_commands_in_flight{command="ping"} 1\n' in text
+    assert (
+        'homeassistant_websocket_command_message_size_bytes_count{command="ping"} 0\n'
+        in text
+    )
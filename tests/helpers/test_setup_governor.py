@@ -0,0 +1,214 @@
+"""Test the governor of the config entry setups during startup."""
+
+import asyncio
+from collections.abc import Generator
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from homeassistant import setup
+from homeassistant.config_entries import ConfigEntry, ConfigFlow
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.helpers.setup_governor import (
+    MAX_CONCURRENT_SETUPS,
+    ResourceClass,
+    SetupGovernor,
+    async_get_setup_governor,
+    async_start_setup_governor,
+    integration_resource_class,
+)
+from homeassistant.loader import Integration
+from homeassistant.setup import SetupPhases, async_setup_component
+
+from tests.common import (
+    MockConfigEntry,
+    MockModule,
+    mock_config_flow,
+    mock_integration,
+    mock_platform,
+)
+
+
+def _mock_cloud_integration(hass: HomeAssistant, domain: str, **kwargs) -> Integration:
+    """Mock an integration polling a cloud service."""
+    return mock_integration(
+        hass,
+        MockModule(domain, partial_manifest={"iot_class": "cloud_polling"}, **kwargs),
+    )
+
+
+def test_resource_class(hass: HomeAssistant) -> None:
+    """Test the resource class is derived from the manifest."""
+    assert integration_resource_class(_mock_cloud_integration(hass, "cloud")) is (
+        ResourceClass.CLOUD
+    )
+    serial = mock_integration(
+        hass,
+        MockModule(
+            "serial",
+            partial_manifest={"iot_class": "local_push", "usb": [{"vid": "10C4"}]},
+        ),
+    )
+    assert integration_resource_class(serial) is ResourceClass.SERIAL
+    assert integration_resource_class(mock_integration(hass, MockModule("local"))) is (
+        ResourceClass.LOCAL
+    )
+
+
+async def test_queue_order(hass: HomeAssistant) -> None:
+    """Test queued setups start by priority, then by number of dependents."""
+    governor = SetupGovernor(
+        hass,
+        {"prio": 5},
+        {"dep": 2},
+        dict.fromkeys(("first", "plain", "dep", "prio"), ResourceClass.CLOUD),
+    )
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def _setup(domain: str) -> None:
+        async with governor.async_slot(
+            _mock_cloud_integration(hass, domain), f"{domain} entry"
+        ):
+            started.append(domain)
+            await release.wait()
+
+    with patch.dict(MAX_CONCURRENT_SETUPS, {ResourceClass.CLOUD: 1}):
+        tasks = [
+            hass.async_create_task(_setup(domain))
+            for domain in ("first", "plain", "dep", "prio")
+        ]
+        await asyncio.sleep(0)
+        assert started == ["first"]
+        release.set()
+        await asyncio.gather(*tasks)
+
+    assert started == ["first", "prio", "dep", "plain"]
+    assert governor.queue_waits.keys() == {"plain entry", "dep entry", "prio entry"}
+    assert governor.async_sort_key("prio") < governor.async_sort_key("dep")
+
+
+async def test_nested_setups_and_stop(hass: HomeAssistant) -> None:
+    """Test setups started by a slot holder don't wait and stopping starts all."""
+    integration = _mock_cloud_integration(hass, "cloud")
+    governor = SetupGovernor(hass, {}, {}, {"cloud": ResourceClass.CLOUD})
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def _setup(name: str) -> None:
+        async with governor.async_slot(integration, name):
+            started.append(name)
+
+    async def _hold() -> None:
+        async with governor.async_slot(integration, "holder"):
+            await hass.async_create_task(_setup("nested"))
+            await release.wait()
+
+    with patch.dict(MAX_CONCURRENT_SETUPS, {ResourceClass.CLOUD: 1}):
+        holder = hass.async_create_task(_hold())
+        await asyncio.sleep(0)
+        assert started == ["nested"]
+
+        queued = hass.async_create_task(_setup("queued"))
+        await asyncio.sleep(0)
+        assert started == ["nested"]
+        governor.async_stop()
+        await queued
+        assert started == ["nested", "queued"]
+
+        await _setup("after stop")
+        assert started == ["nested", "queued", "after stop"]
+        release.set()
+        await holder
+
+
+async def test_slot_is_released_after_max_slot_time(hass: HomeAssistant) -> None:
+    """Test a setup that hangs releases its slot to the queued setups."""
+    integration = _mock_cloud_integration(hass, "cloud")
+    governor = SetupGovernor(hass, {}, {}, {"cloud": ResourceClass.CLOUD})
+    started: list[str] = []
+    release = asyncio.Event()
+    paused: list[str] = []
+
+    @contextmanager
+    def _pause() -> Generator[None]:
+        paused.append("wait")
+        yield
+
+    async def _setup(name: str) -> None:
+        async with governor.async_slot(integration, name, _pause):
+            started.append(name)
+            await release.wait()
+
+    with (
+        patch.dict(MAX_CONCURRENT_SETUPS, {ResourceClass.CLOUD: 1}),
+        patch("homeassistant.helpers.setup_governor.MAX_SLOT_TIME", 0.01),
+    ):
+        tasks = [hass.async_create_task(_setup(name)) for name in ("hung", "queued")]
+        await asyncio.sleep(0)
+        assert started == ["hung"]
+        assert paused == ["wait"]
+        await asyncio.sleep(0.05)
+        assert started == ["hung", "queued"]
+        release.set()
+        await asyncio.gather(*tasks)
+
+    # The expired slots are not released twice
+    assert governor._running[ResourceClass.CLOUD] == 0
+
+
+async def test_config_entry_setups_are_limited(hass: HomeAssistant) -> None:
+    """Test the config entries of a limited resource class are set up one by one."""
+    running = 0
+    max_running = 0
+
+    async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return True
+
+    integration = _mock_cloud_integration(
+        hass, "comp", async_setup_entry=async_setup_entry
+    )
+    mock_platform(hass, "comp.config_flow", None)
+    for _ in range(3):
+        MockConfigEntry(domain="comp").add_to_hass(hass)
+    governor = async_start_setup_governor(hass, {"comp": integration})
+    assert async_get_setup_governor(hass) is governor
+
+    with (
+        patch.dict(MAX_CONCURRENT_SETUPS, {ResourceClass.CLOUD: 1}),
+        mock_config_flow("comp", ConfigFlow),
+    ):
+        assert await async_setup_component(hass, "comp", {})
+    assert max_running == 1
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    assert not governor.active
+
+
+async def test_slot_wait_is_not_setup_time(hass: HomeAssistant) -> None:
+    """Test the wait for a slot is left out of the setup time."""
+    integration = _mock_cloud_integration(hass, "comp")
+    entries = [MockConfigEntry(domain="comp") for _ in range(2)]
+    for entry in entries:
+        entry.add_to_hass(hass)
+    async_start_setup_governor(hass, {"comp": integration})
+    hass.set_state(CoreState.not_running)
+
+    with (
+        patch.dict(MAX_CONCURRENT_SETUPS, {ResourceClass.CLOUD: 1}),
+        setup.async_start_setup(hass, integration="parent", phase=SetupPhases.SETUP),
+    ):
+        await asyncio.gather(
+            *(
+                setup._async_setup_config_entry(hass, entry, integration)
+                for entry in entries
+            )
+        )
+
+    assert SetupPhases.WAIT_SETUP_SLOT in setup._setup_times(hass)["parent"][None]
@@ -0,0 +1,118 @@
+"""Test the startup trace helper."""
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.helpers.startup_trace import (
+    StartupTrace,
+    async_get_startup_trace,
+    async_start_startup_trace,
+    async_trace_startup,
+)
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockModule, mock_integration
+
+
+def test_chrome_trace() -> None:
+    """Test spans are exported as complete events with a thread per lane."""
+    trace = StartupTrace()
+    origin = trace._origin
+    trace.async_add("setup", "setup", "light", origin + 0.5, 0.25)
+    trace.async_add("import", "import", "light", origin, 0.5, {"executor": True})
+    trace.async_add("stage", "stage 1", "bootstrap", origin, 1)
+
+    assert trace.as_chrome_trace() == {
+        "traceEvents": [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": 1,
+                "args": {"name": "Home Assistant startup"},
+            },
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 0,
+                "args": {"name": "bootstrap"},
+            },
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": 1,
+                "args": {"name": "light"},
+            },
+            {
+                "name": "setup",
+                "cat": "setup",
+                "ph": "X",
+                "ts": 500000,
+                "dur": 250000,
+                "pid": 1,
+                "tid": 1,
+            },
+            {
+                "name": "import",
+                "cat": "import",
+                "ph": "X",
+                "ts": 0,
+                "dur": 500000,
+                "pid": 1,
+                "tid": 1,
+                "args": {"executor": True},
+            },
+            {
+                "name": "stage 1",
+                "cat": "stage",
+                "ph": "X",
+                "ts": 0,
+                "dur": 1000000,
+                "pid": 1,
+                "tid": 0,
+            },
+        ],
+        "displayTimeUnit": "ms",
+    }
+
+
+async def test_trace_setup(hass: HomeAssistant) -> None:
+    """Test the setup of an integration is traced until Home Assistant started."""
+    with async_trace_startup(hass, "stage", "untraced"):
+        pass
+    assert async_get_startup_trace(hass) is None
+
+    hass.set_state(CoreState.not_running)
+    trace = async_start_startup_trace(hass)
+    assert async_get_startup_trace(hass) is trace
+    mock_integration(hass, MockModule("comp"))
+
+    with async_trace_startup(hass, "stage", "stage 1"):
+        assert await async_setup_component(hass, "comp", {})
+
+    events = trace.as_chrome_trace()["traceEvents"]
+    lanes = {
+        event["args"]["name"]: event["tid"]
+        for event in events
+        if event["name"] == "thread_name"
+    }
+    spans = {
+        (event["tid"], event["cat"], event["name"])
+        for event in events
+        if event["ph"] == "X"
+    }
+    assert {
+        (lanes["bootstrap"], "stage", "stage 1"),
+        (lanes["comp"], "wait", "wait for dependencies"),
+        (lanes["comp"], "requirements", "requirements"),
+        (lanes["comp"], "config", "validate config"),
+        (lanes["comp"], "setup", "setup"),
+    } <= spans
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    assert trace.finished
+    count = len(trace.as_chrome_trace()["traceEvents"])
+    with async_trace_startup(hass, "stage", "late"):
+        pass
+    assert len(trace.as_chrome_trace()["traceEvents"]) == count
@@ -4876,6 +4876,64 @@ def test_generate_select(hass: HomeAssistant) -> None:
     assert info.domains_lifecycle == {"sensor"}
 
 
+def test_select_indexed_attribute(hass: HomeAssistant) -> None:
+    """Test selecting states by an indexed attribute."""
+    hass.states.async_set("sensor.power", "1", {"device_class": "power"})
+    hass.states.async_set("sensor.energy", "2", {"device_class": "energy"})
+    hass.states.async_set("switch.plug", "on", {"device_class": "power"})
+
+    tmp = template.Template(
+        "{{ states.sensor | selectattr('attributes.device_class', 'eq', 'power')"
+        " | join(',', attribute='entity_id') }}",
+        hass,
+    )
+    with patch.object(
+        template, "sync_do_selectattr", side_effect=AssertionError
+    ) as selectattr:
+        info = tmp.async_render_to_info()
+    assert not selectattr.called
+    assert_result_info(info, "sensor.power", [], ["sensor"])
+
+    tmp = template.Template(
+        "{{ states | selectattr('attributes.device_class', '==', 'power')"
+        " | map(attribute='entity_id') | list }}",
+        hass,
+    )
+    info = tmp.async_render_to_info()
+    assert_result_info(info, ["sensor.power", "switch.plug"], [], [], True)
+
+    # Other tests and attributes use the Jinja filter
+    tmp = template.Template(
+        "{{ states.sensor | selectattr('attributes.device_class', 'ne', 'power')"
+        " | map(attribute='entity_id') | list }}",
+        hass,
+    )
+    assert tmp.async_render() == ["sensor.energy"]
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states.sensor | selectattr('attributes.device_class', 'eq', 'power')"
+        " | map(attribute='entity_id') | list }}",
+        "{{ states | selectattr('attributes.device_class', 'eq', 'power')"
+        " | map(attribute='entity_id') | list }}",
+        "{{ (states.sensor | selectattr('attributes.device_class', 'eq', 'power')"
+        " | first).entity_id }}",
+    ],
+)
+def test_select_indexed_attribute_order(hass: HomeAssistant, template_str: str) -> None:
+    """Test the indexed selection keeps the order of the Jinja filter."""
+    hass.states.async_set("sensor.first", "1", {"device_class": "energy"})
+    hass.states.async_set("sensor.second", "2", {"device_class": "power"})
+    hass.states.async_set("sensor.first", "1", {"device_class": "power"})
+
+    tmp = template.Template(template_str, hass)
+    indexed = tmp.async_render()
+    with patch.object(template, "INDEXED_ATTRIBUTES", ()):
+        assert tmp.async_render() == indexed
+
+
 async def test_async_render_to_info_in_conditional(hass: HomeAssistant) -> None:
     """Test extract entities function with none entities stuff."""
     template_str = """
@@ -0,0 +1,76 @@
+"""Test the cache of validated configuration items."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.validated_config_cache import (
+    ValidatedConfigCache,
+    async_get_validated_config_cache,
+    config_key,
+)
+from homeassistant.util.yaml.objects import Input, NodeDictClass, NodeStrClass
+
+from tests.common import MockConfigEntry
+
+
+def test_config_key() -> None:
+    """Test the key only depends on the content of the config."""
+    key = config_key({"alias": "hello", "actions": [{"delay": 1}]})
+    assert key is not None
+    assert (
+        config_key(
+            NodeDictClass(
+                {
+                    "actions": [{"delay": 1}],
+                    NodeStrClass("alias"): NodeStrClass("hello"),
+                }
+            )
+        )
+        == key
+    )
+    assert config_key({"alias": "hello", "actions": [{"delay": "1"}]}) != key
+    assert config_key({"name": "hello"}) != config_key(Input("hello"))
+    assert config_key({"alias": object()}) is None
+
+
+def test_drop_unused() -> None:
+    """Test the configs not used by the previous validation are dropped."""
+    cache: ValidatedConfigCache[str] = ValidatedConfigCache()
+    cache.async_set(b"used", "used config")
+    cache.async_set(b"unused", "unused config")
+
+    cache.async_start_validation()
+    assert cache.async_get(b"used") == "used config"
+    cache.async_start_validation()
+    assert cache.async_get(b"used") == "used config"
+    assert cache.async_get(b"unused") is None
+
+
+async def test_registry_changes(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the configs are dropped when referenced devices or entities change."""
+    cache = async_get_validated_config_cache(hass, "automation")
+    assert async_get_validated_config_cache(hass, "automation") is cache
+    config_entry = MockConfigEntry()
+    config_entry.add_to_hass(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id, identifiers={("test", "device")}
+    )
+    entry = entity_registry.async_get_or_create("light", "test", "unique")
+
+    cache.async_set(b"key", "config")
+    device_registry.async_update_device(device.id, name="Device")
+    entity_registry.async_update_entity(entry.entity_id, name="Light")
+    await hass.async_block_till_done()
+    assert cache.async_get(b"key") == "config"
+
+    entity_registry.async_update_entity(entry.entity_id, new_entity_id="light.new")
+    await hass.async_block_till_done()
+    assert cache.async_get(b"key") is None
+
+    cache.async_set(b"key", "config")
+    device_registry.async_remove_device(device.id)
+    await hass.async_block_till_done()
+    assert cache.async_get(b"key") is None
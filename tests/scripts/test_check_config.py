@@ -1,12 +1,20 @@
 """Test check_config script."""
 
 import logging
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from homeassistant.config import YAML_CONFIG_FILE
 from homeassistant.scripts import check_config
+from homeassistant.util.yaml import Secrets, load_yaml
+from homeassistant.util.yaml.cache import (
+    disable_yaml_cache,
+    enable_yaml_cache,
+    get_yaml_cache,
+    save_yaml_cache,
+)
 
 from tests.common import get_test_config_dir
 
@@ -180,3 +188,22 @@ def test_bootstrap_error() -> None:
     assert res["secrets"] == {}
     assert res["warn"] == {}
     assert res["yaml_files"] == {}
+
+
+@pytest.mark.usefixtures("event_loop")
+def test_yaml_cache(tmp_path: Path) -> None:
+    """Test files cached by Home Assistant are not parsed again."""
+    (tmp_path / YAML_CONFIG_FILE).write_text(BASE_CONFIG + "light:\n  platform: demo")
+    enable_yaml_cache(str(tmp_path))
+    try:
+        load_yaml(tmp_path / YAML_CONFIG_FILE, Secrets(tmp_path))
+        save_yaml_cache(str(tmp_path))
+    finally:
+        disable_yaml_cache()
+
+    with patch("homeassistant.util.yaml.loader.parse_yaml") as mock_parse:
+        res = check_config.check(str(tmp_path), yaml_cache=True)
+    assert not mock_parse.called
+    assert res["components"]["light"] == [{"platform": "demo"}]
+    assert res["except"] == {}
+    assert get_yaml_cache() is None
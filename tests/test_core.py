@@ -61,10 +61,12 @@ from homeassistant.helpers.json import json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from .common import (
     async_capture_events,
+    async_fire_time_changed,
     async_mock_service,
     help_test_all,
     import_and_test_deprecated_alias,
@@ -261,7 +263,7 @@ async def test_async_add_hass_job_schedule_partial_callback() -> None:
 
 async def test_async_add_hass_job_schedule_corofunction_eager_start() -> None:
     """Test that we schedule coroutines and add jobs to the job pool."""
-    hass = MagicMock(loop=MagicMock(wraps=asyncio.get_running_loop()))
+    hass = MagicMock(loop=MagicMock(wraps=asyncio.get_running_loop()), loop_time=None)
 
     async def job():
         pass
@@ -279,7 +281,7 @@ async def test_async_add_hass_job_schedule_corofunction_eager_start() -> None:
 
 async def test_async_add_hass_job_schedule_partial_corofunction_eager_start() -> None:
     """Test that we schedule coroutines and add jobs to the job pool."""
-    hass = MagicMock(loop=MagicMock(wraps=asyncio.get_running_loop()))
+    hass = MagicMock(loop=MagicMock(wraps=asyncio.get_running_loop()), loop_time=None)
 
     async def job():
         pass
@@ -312,7 +314,7 @@ async def test_async_add_job_add_hass_threaded_job_to_pool() -> None:
 
 async def test_async_create_task_schedule_coroutine() -> None:
     """Test that we schedule coroutines and add jobs to the job pool."""
-    hass = MagicMock(loop=MagicMock(wraps=asyncio.get_running_loop()))
+    hass = MagicMock(loop=MagicMock(wraps=asyncio.get_running_loop()), loop_time=None)
 
     async def job():
         pass
@@ -325,7 +327,7 @@ async def test_async_create_task_schedule_coroutine() -> None:
 
 async def test_async_create_task_eager_start_schedule_coroutine() -> None:
     """Test that we schedule coroutines and add jobs to the job pool."""
-    hass = MagicMock(loop=MagicMock(wraps=asyncio.get_running_loop()))
+    hass = MagicMock(loop=MagicMock(wraps=asyncio.get_running_loop()), loop_time=None)
 
     async def job():
         pass
@@ -338,7 +340,7 @@ async def test_async_create_task_eager_start_schedule_coroutine() -> None:
 
 async def test_async_create_task_schedule_coroutine_with_name() -> None:
     """Test that we schedule coroutines and add jobs to the job pool with a name."""
-    hass = MagicMock(loop=MagicMock(wraps=asyncio.get_running_loop()))
+    hass = MagicMock(loop=MagicMock(wraps=asyncio.get_running_loop()), loop_time=None)
 
     async def job():
         pass
@@ -354,7 +356,7 @@ async def test_async_create_task_schedule_coroutine_with_name() -> None:
 
 async def test_async_run_eager_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(loop_time=None)
     calls = []
 
     def job():
@@ -378,7 +380,7 @@ async def test_async_run_eager_hass_job_calls_coro_function() -> None:
 
 async def test_async_run_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(loop_time=None)
     calls = []
 
     def job():
@@ -1165,6 +1167,67 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_batched_listener(hass: HomeAssistant) -> None:
+    """Test listeners receive the events of a loop iteration in a batch."""
+    batches: list[list[ha.Event]] = []
+
+    @ha.callback
+    def listener(events: list[ha.Event]) -> None:
+        """Mock listener."""
+        batches.append(events)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return not event_data["filtered"]
+
+    unsub = hass.bus.async_listen_batched("test", listener, event_filter=mock_filter)
+
+    for idx in range(3):
+        hass.bus.async_fire("test", {"filtered": False, "idx": idx})
+    hass.bus.async_fire("test", {"filtered": True, "idx": 3})
+    assert batches == []
+    await hass.async_block_till_done()
+
+    assert [[event.data["idx"] for event in batch] for batch in batches] == [[0, 1, 2]]
+
+    hass.bus.async_fire("test", {"filtered": False, "idx": 4})
+    await hass.async_block_till_done()
+    assert [event.data["idx"] for event in batches[-1]] == [4]
+
+    # Events not delivered when the listener is removed are dropped
+    hass.bus.async_fire("test", {"filtered": False, "idx": 5})
+    unsub()
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+
+
+async def test_eventbus_batched_listener_window(hass: HomeAssistant) -> None:
+    """Test batched listeners collect the events fired in a window."""
+    batches: list[list[ha.Event]] = []
+
+    async def listener(events: list[ha.Event]) -> None:
+        """Mock listener."""
+        batches.append(events)
+
+    unsub = hass.bus.async_listen_batched("test", listener, window=5)
+
+    hass.bus.async_fire("test", {"idx": 0})
+    await hass.async_block_till_done()
+    hass.bus.async_fire("test", {"idx": 1})
+    await hass.async_block_till_done()
+    assert batches == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert [[event.data["idx"] for event in batch] for batch in batches] == [[0, 1]]
+
+    unsub()
+
+    with pytest.raises(HomeAssistantError, match="Event filter is required"):
+        hass.bus.async_listen_batched(EVENT_STATE_REPORTED, listener)
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1466,6 +1529,135 @@ async def test_statemachine_entity_ids(hass: HomeAssistant) -> None:
     assert states == ["light.bowl", "switch.ac"]
 
 
+async def test_statemachine_all_with_attribute(hass: HomeAssistant) -> None:
+    """Test looking up states by attribute value."""
+    hass.states.async_set("sensor.power", "1", {"device_class": "power"})
+    hass.states.async_set("sensor.energy", "2", {"device_class": "energy"})
+    hass.states.async_set("binary_sensor.power", "on", {"device_class": "power"})
+    hass.states.async_set("sensor.tags", "3", {"device_class": ["unhashable"]})
+
+    def entity_ids(*args: Any) -> list[str]:
+        return [
+            state.entity_id for state in hass.states.async_all_with_attribute(*args)
+        ]
+
+    assert entity_ids("device_class", "power") == [
+        "sensor.power",
+        "binary_sensor.power",
+    ]
+    assert entity_ids("device_class", "power", "sensor") == ["sensor.power"]
+    assert entity_ids("device_class", "power", ["binary_sensor"]) == [
+        "binary_sensor.power"
+    ]
+    assert entity_ids("device_class", "other") == []
+    assert entity_ids("device_class", ["unhashable"]) == ["sensor.tags"]
+
+    # Changing the state without changing the attributes keeps the index
+    hass.states.async_set("sensor.power", "5", {"device_class": "power"})
+    assert hass.states.async_all_with_attribute("device_class", "power")[0].state == (
+        "5"
+    )
+
+    hass.states.async_set("sensor.power", "5", {"device_class": "energy"})
+    assert entity_ids("device_class", "power") == ["binary_sensor.power"]
+    # The states are returned in the order of the state machine
+    assert entity_ids("device_class", "energy") == ["sensor.power", "sensor.energy"]
+
+    hass.states.async_remove("sensor.energy")
+    assert entity_ids("device_class", "energy") == ["sensor.power"]
+    hass.states.async_set("sensor.power", "5")
+    assert entity_ids("device_class", "energy") == []
+    assert not hass.states._states._attribute_index["device_class"].get("energy")
+
+    # Attributes that are not indexed are compared for every state
+    hass.states.async_set("light.bowl", "on", {"color_mode": "hs"})
+    assert entity_ids("color_mode", "hs") == ["light.bowl"]
+
+
+async def test_statemachine_shares_attributes(hass: HomeAssistant) -> None:
+    """Test equal attribute mappings are shared between states."""
+    attributes = {"unit_of_measurement": "W", "options": ["a", "b"]}
+    hass.states.async_set("sensor.one", "1", attributes)
+    hass.states.async_set("sensor.two", "2", dict(attributes))
+    one = hass.states.get("sensor.one")
+    two = hass.states.get("sensor.two")
+    assert one.attributes is two.attributes
+    assert one.attributes == attributes
+
+    # Equal values of another type are not shared
+    hass.states.async_set("sensor.three", "3", {"value": 1})
+    hass.states.async_set("sensor.four", "4", {"value": True})
+    assert hass.states.get("sensor.four").attributes["value"] is True
+
+    hass.states.async_set("sensor.five", "5", {})
+    hass.states.async_set("sensor.six", "6")
+    assert (
+        hass.states.get("sensor.five").attributes
+        is hass.states.get("sensor.six").attributes
+    )
+
+    # Nested values, other objects and the order of the items must match too
+    now = dt_util.utcnow()
+    for index, (value, other) in enumerate(
+        (
+            ((30, 100), (30.0, 100.0)),
+            ([1], [True]),
+            ({"nested": [1]}, {"nested": [1.0]}),
+            ({1: "a"}, {True: "a"}),
+            ({1, 2}, {1.0, 2}),
+            ({"a": 1, "b": 2}, {"b": 2, "a": 1}),
+            (now, now.astimezone(dt_util.get_time_zone("Europe/Amsterdam"))),
+        )
+    ):
+        hass.states.async_set(f"sensor.value_{index}", "1", {"value": value})
+        hass.states.async_set(f"sensor.other_{index}", "1", {"value": other})
+        assert value == other
+        assert repr(hass.states.get(f"sensor.other_{index}").attributes["value"]) == (
+            repr(other)
+        )
+    hass.states.async_set("sensor.value", "1", {"a": 1, "b": 2})
+    hass.states.async_set("sensor.other", "1", {"b": 2, "a": 1})
+    assert list(hass.states.get("sensor.other").attributes) == ["b", "a"]
+
+    # The serialized states are still cached per state
+    assert json_loads(one.as_dict_json)["attributes"] == attributes
+    assert two.as_compressed_state["a"] == attributes
+    assert two.as_compressed_state_json.startswith(b'"sensor.two"')
+    assert json_loads(one.as_dict_json)["entity_id"] == "sensor.one"
+    assert hass.states.attributes_interner.hits == 1
+
+
+async def test_statemachine_shares_only_changed_attribute_names(
+    hass: HomeAssistant,
+) -> None:
+    """Test attributes that only change their values are not looked up."""
+    interner = hass.states.attributes_interner
+    hass.states.async_set("sensor.one", "1", {"voltage": 230})
+    hass.states.async_set("sensor.two", "1", {"voltage": 230})
+    assert interner.hits == 1
+    assert interner.misses == 1
+
+    hass.states.async_set("sensor.one", "2", {"voltage": 231})
+    hass.states.async_set("sensor.two", "2", {"voltage": 231})
+    assert interner.hits == 1
+    assert interner.misses == 1
+    assert hass.states.get("sensor.two").attributes == {"voltage": 231}
+
+    # Attributes with other names are shared again
+    hass.states.async_set("sensor.one", "unavailable", {})
+    hass.states.async_set("sensor.one", "3", {"voltage": 230})
+    assert (
+        hass.states.get("sensor.one").attributes
+        is hass.states.get("sensor.two").attributes
+    ) is False
+    hass.states.async_set("sensor.two", "3", {"unit_of_measurement": "V"})
+    hass.states.async_set("sensor.one", "3", {"unit_of_measurement": "V"})
+    assert (
+        hass.states.get("sensor.one").attributes
+        is hass.states.get("sensor.two").attributes
+    )
+
+
 async def test_statemachine_remove(hass: HomeAssistant) -> None:
     """Test remove method."""
     hass.states.async_set("light.bowl", "on", {})
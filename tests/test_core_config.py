@@ -412,6 +412,7 @@ async def test_loading_configuration(hass: HomeAssistant) -> None:
             "country": "SE",
             "language": "sv",
             "radius": 150,
+            "setup_priority": {"zha": "10"},
             "webrtc": {"ice_servers": [{"url": "stun:custom_stun_server:3478"}]},
         },
     )
@@ -434,6 +435,7 @@ async def test_loading_configuration(hass: HomeAssistant) -> None:
     assert hass.config.country == "SE"
     assert hass.config.language == "sv"
     assert hass.config.radius == 150
+    assert hass.config.setup_priority == {"zha": 10}
     assert hass.config.webrtc == RTCConfiguration(
         [RTCIceServer(urls=["stun:custom_stun_server:3478"])]
     )
@@ -14,6 +14,7 @@ import pytest
 from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
@@ -2039,3 +2040,114 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+async def _async_restart_loader(hass: HomeAssistant) -> None:
+    """Reset the loader as if Home Assistant was restarted."""
+    loader.async_setup(hass)
+    hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+    await loader.async_load_integration_cache(hass)
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_integration_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test integrations are resolved from the cache of the previous run."""
+    await loader.async_load_integration_cache(hass)
+    integration = await loader.async_get_integration(hass, "logbook")
+    assert await integration.resolve_dependencies()
+    test = await loader.async_get_integration(hass, "test")
+    assert test.translation_files is None
+    assert test.has_translation_file("nl.json")
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    data = hass_storage[loader.INTEGRATION_CACHE_STORAGE_KEY]["data"]
+    assert data["dependencies"]["logbook"] == sorted(integration.all_dependencies)
+    assert "custom_components.test" in data["integrations"]
+
+    await _async_restart_loader(hass)
+    with patch.object(
+        loader.Integration,
+        "_read_from_directory",
+        wraps=loader.Integration._read_from_directory,
+    ) as mock_read:
+        cached = await loader.async_get_integration(hass, "logbook")
+        cached_test = await loader.async_get_integration(hass, "test")
+    read = {call.args[1] for call in mock_read.mock_calls}
+    assert "homeassistant.components.logbook" not in read
+    assert "custom_components.test" not in read
+    assert cached is not integration
+    assert cached.manifest == integration.manifest
+    assert cached.all_dependencies_resolved
+    assert cached.all_dependencies == integration.all_dependencies
+    assert cached.platforms_exists(["websocket_api", "light"]) == ["websocket_api"]
+    assert cached.has_services
+    assert cached_test.translation_files == {
+        "_broken.json",
+        "de.json",
+        "en.json",
+        "es.json",
+    }
+    assert cached_test.has_translation_file("en.json")
+    assert not cached_test.has_translation_file("nl.json")
+
+    # A changed integration directory is read again and the dependency
+    # closures are resolved again
+    data["integrations"]["homeassistant.components.logbook"]["mtime"] -= 1
+    await _async_restart_loader(hass)
+    with patch.object(
+        loader.Integration,
+        "_read_from_directory",
+        wraps=loader.Integration._read_from_directory,
+    ) as mock_read:
+        changed = await loader.async_get_integration(hass, "logbook")
+    read = {call.args[1] for call in mock_read.mock_calls}
+    assert "homeassistant.components.logbook" in read
+    assert not changed.all_dependencies_resolved
+
+    # A manifest.json edited in place does not change the directory, the
+    # integration is read again because its size or modification time changed
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    data = hass_storage[loader.INTEGRATION_CACHE_STORAGE_KEY]["data"]
+    test_entry = data["integrations"]["custom_components.test"]
+    assert test_entry["translations"]["files"]["en.json"] == [
+        os.stat(test.file_path / "translations" / "en.json").st_mtime_ns,
+        os.stat(test.file_path / "translations" / "en.json").st_size,
+    ]
+    data["integrations"]["homeassistant.components.logbook"]["manifest_stat"][1] += 1
+    test_entry["translations"]["files"]["en.json"][0] -= 1
+    await _async_restart_loader(hass)
+    with patch.object(
+        loader.Integration,
+        "_read_from_directory",
+        wraps=loader.Integration._read_from_directory,
+    ) as mock_read:
+        await loader.async_get_integration(hass, "logbook")
+        edited_test = await loader.async_get_integration(hass, "test")
+    read = {call.args[1] for call in mock_read.mock_calls}
+    assert "homeassistant.components.logbook" in read
+    # Only the listing of the translations is read again
+    assert "custom_components.test" not in read
+    assert edited_test.translation_files is None
+
+
+async def test_integration_cache_other_version(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the cache of another version of Home Assistant is discarded."""
+    hass_storage[loader.INTEGRATION_CACHE_STORAGE_KEY] = {
+        "version": loader.INTEGRATION_CACHE_STORAGE_VERSION,
+        "key": loader.INTEGRATION_CACHE_STORAGE_KEY,
+        "data": {
+            "ha_version": "0.1.0",
+            "integrations": {},
+            "custom_components": {},
+            "dependencies": {"logbook": []},
+        },
+    }
+    await loader.async_load_integration_cache(hass)
+    integration = await loader.async_get_integration(hass, "logbook")
+    assert not integration.all_dependencies_resolved
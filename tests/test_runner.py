@@ -13,6 +13,7 @@ import pytest
 from homeassistant import core, runner
 from homeassistant.core import HomeAssistant
 from homeassistant.util import executor, thread
+from homeassistant.util.yaml.cache import disable_yaml_cache
 
 # https://github.com/home-assistant/supervisor/blob/main/supervisor/docker/homeassistant.py
 SUPERVISOR_HARD_TIMEOUT = 240
@@ -20,6 +21,13 @@ SUPERVISOR_HARD_TIMEOUT = 240
 TIMEOUT_SAFETY_MARGIN = 10
 
 
+@pytest.fixture(autouse=True)
+def disable_yaml_cache_after_run() -> Iterator[None]:
+    """Stop caching the YAML files after the runner enabled it."""
+    yield
+    disable_yaml_cache()
+
+
 async def test_cumulative_shutdown_timeout_less_than_supervisor() -> None:
     """Verify the cumulative shutdown timeout is at least 10s less than the supervisor."""
     assert (
@@ -0,0 +1,102 @@
+"""Test the telemetry of the blocking calls done in the event loop."""
+
+import asyncio
+from collections.abc import Generator
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import blocking_telemetry
+from homeassistant.util.blocking_telemetry import (
+    SLOW_ITERATION,
+    BlockingCallTelemetry,
+    disable_blocking_call_telemetry,
+    enable_blocking_call_telemetry,
+    get_blocking_call_telemetry,
+)
+from homeassistant.util.loop import protect_loop
+
+
+@pytest.fixture
+def telemetry(hass: HomeAssistant) -> Generator[BlockingCallTelemetry]:
+    """Record the blocking calls done by the test."""
+    yield enable_blocking_call_telemetry(hass.loop, threshold=0.1)
+    disable_blocking_call_telemetry()
+
+
+def _blocking_function() -> str:
+    """Mock a blocking function."""
+    return "done"
+
+
+async def test_record_patched_calls(
+    hass: HomeAssistant,
+    telemetry: BlockingCallTelemetry,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the blocking calls of patched functions are timed and aggregated."""
+    assert get_blocking_call_telemetry() is telemetry
+    protected = protect_loop(
+        _blocking_function, threading.get_ident(), strict=False, strict_core=False
+    )
+    allowed = protect_loop(
+        _blocking_function,
+        threading.get_ident(),
+        check_allowed=lambda mapped_args: True,
+    )
+
+    assert allowed() == "done"
+    for _ in range(2):
+        assert protected() == "done"
+    assert "Detected blocking call to _blocking_function" in caplog.text
+
+    result = telemetry.as_dict()
+    assert result["integrations"].keys() == {"homeassistant"}
+    assert result["integrations"]["homeassistant"]["count"] == 2
+    assert len(result["calls"]) == 1
+    call = result["calls"][0]
+    assert call["function"] == "_blocking_function"
+    assert call["integration"] == "homeassistant"
+    assert call["location"].startswith(__file__)
+    assert call["count"] == 2
+    assert call["time"] >= call["max_time"] > 0
+
+
+def test_store_is_bounded() -> None:
+    """Test the least recently seen fingerprints are dropped."""
+    telemetry = BlockingCallTelemetry(asyncio.new_event_loop())
+    frame = sys._getframe()
+    with patch.object(blocking_telemetry, "MAX_FINGERPRINTS", 2):
+        for function in ("first", "second", "first", "third"):
+            telemetry.record(function, frame, 0.1)
+
+    result = telemetry.as_dict()
+    assert result["dropped"] == 1
+    assert [(call["function"], call["count"]) for call in result["calls"]] == [
+        ("first", 2),
+        ("third", 1),
+    ]
+    telemetry._loop.close()
+
+
+async def test_sample_slow_iterations(
+    hass: HomeAssistant, telemetry: BlockingCallTelemetry
+) -> None:
+    """Test blocking code that is not patched is found by sampling the stack."""
+
+    def _block() -> None:
+        time.sleep(0.3)
+
+    await asyncio.sleep(0.06)
+    hass.loop.call_soon(_block)
+    await asyncio.sleep(0.1)
+
+    calls = telemetry.as_dict()["calls"]
+    assert len(calls) == 1
+    assert calls[0]["function"] == SLOW_ITERATION
+    assert calls[0]["location"].startswith(__file__)
+    assert calls[0]["max_time"] >= 0.2
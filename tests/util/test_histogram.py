@@ -0,0 +1,17 @@
+"""Test the histogram util."""
+
+from homeassistant.util.histogram import Histogram
+
+
+def test_histogram() -> None:
+    """Test values are counted in the bucket of their upper bound."""
+    histogram = Histogram((1, 10))
+    for value in (0.5, 1, 5, 20):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.as_dict() == {
+        "count": 4,
+        "sum": 26.5,
+        "buckets": {"1": 2, "10": 3, "+Inf": 4},
+    }
@@ -0,0 +1,70 @@
+"""Test the event loop time tracking."""
+
+import asyncio
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.loop_time import LoopTimeTracker, module_domain
+
+
+def test_module_domain() -> None:
+    """Test the integration owning a module is found."""
+    assert module_domain("homeassistant.components.hue.light") == "hue"
+    assert module_domain("homeassistant.components.hue") == "hue"
+    assert module_domain("custom_components.my_integration.sensor") == (
+        "my_integration"
+    )
+    assert module_domain("homeassistant.core") == "homeassistant"
+    assert module_domain("homeassistant.components") == "homeassistant"
+    assert module_domain(None) == "homeassistant"
+
+
+def test_nested_runs() -> None:
+    """Test time of nested runs is only attributed to the innermost run."""
+    tracker = LoopTimeTracker()
+    clock = iter((0.0, 1.0, 3.0, 10.0))
+
+    def inner() -> None:
+        pass
+
+    def outer() -> str:
+        tracker.async_run_for("inner", inner)
+        return "done"
+
+    with patch("homeassistant.util.loop_time.perf_counter", lambda: next(clock)):
+        assert tracker.async_run_for("outer", outer) == "done"
+
+    result = tracker.as_dict()
+    assert list(result) == ["outer", "inner"]
+    assert result["outer"]["sum"] == 8.0
+    assert result["outer"]["count"] == 1
+    assert result["inner"]["sum"] == 2.0
+
+
+async def test_hass_jobs_and_tasks(hass: HomeAssistant) -> None:
+    """Test callbacks and tasks run by hass are attributed when enabled."""
+    assert hass.loop_time is None
+    hass.async_set_loop_time_tracking(True)
+    tracker = hass.loop_time
+    assert tracker is not None
+
+    @callback
+    def listener(event) -> None:
+        pass
+
+    async def work() -> str:
+        await asyncio.sleep(0)
+        return "done"
+
+    hass.bus.async_listen("test_event", listener)
+    hass.bus.async_fire("test_event")
+    assert await hass.async_create_task(work()) == "done"
+    await hass.async_block_till_done()
+
+    # Both are defined in this test module
+    assert tracker.as_dict()["homeassistant"]["count"] >= 3
+
+    hass.async_set_loop_time_tracking(True)
+    assert hass.loop_time is tracker
+    hass.async_set_loop_time_tracking(False)
+    assert hass.loop_time is None
@@ -960,6 +960,28 @@ def test_unit_conversion_factory_allow_none(
     ) == pytest.approx(expected)
 
 
+@pytest.mark.parametrize(
+    ("converter", "value", "from_unit", "to_unit"),
+    [
+        (converter, value, from_unit, to_unit)
+        for converter, item in _CONVERTED_VALUE.items()
+        for value, from_unit, _, to_unit in item
+    ],
+)
+def test_unit_conversion_factory_list_allow_none(
+    converter: type[BaseUnitConverter],
+    value: float,
+    from_unit: str,
+    to_unit: str,
+) -> None:
+    """Test converting lists gives the same results as converting each value."""
+    convert = converter.converter_factory_allow_none(from_unit, to_unit)
+    values = [value, None, value * 2]
+    assert converter.converter_factory_list_allow_none(from_unit, to_unit)(values) == [
+        convert(value) for value in values
+    ]
+
+
 @pytest.mark.parametrize(
     ("value", "from_unit", "expected", "to_unit"),
     [
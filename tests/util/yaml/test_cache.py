@@ -0,0 +1,233 @@
+"""Test the cache of parsed YAML files."""
+
+from collections.abc import Generator
+from datetime import date
+import json
+import math
+import os
+from pathlib import Path
+
+import pytest
+
+from homeassistant.util import yaml
+from homeassistant.util.yaml.cache import (
+    YAML_CACHE_FILE,
+    YamlCache,
+    disable_yaml_cache,
+    enable_yaml_cache,
+    save_yaml_cache,
+)
+
+
+@pytest.fixture
+def yaml_cache(tmp_path: Path) -> Generator[YamlCache]:
+    """Cache the YAML files loaded by the test."""
+    yield enable_yaml_cache(str(tmp_path))
+    disable_yaml_cache()
+
+
+def _write(path: Path, content: str) -> None:
+    """Write a file with a modification time that differs from the last one."""
+    mtime = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(mtime + 1_000_000_000, mtime + 1_000_000_000))
+
+
+def test_cached_load(tmp_path: Path, yaml_cache: YamlCache) -> None:
+    """Test a file is parsed once and loaded as new annotated objects."""
+    path = tmp_path / "configuration.yaml"
+    _write(path, "light:\n  - platform: demo\n    name: Kitchen\n")
+
+    first = yaml.load_yaml(path)
+    second = yaml.load_yaml(path)
+    assert (yaml_cache.misses, yaml_cache.hits) == (1, 1)
+    assert second == first
+    assert second is not first
+    assert second["light"][0].__config_file__ == str(path)
+    assert second["light"][0].__line__ == 2
+    assert second["light"][0]["name"].__line__ == 3
+
+    second["light"].clear()
+    assert yaml.load_yaml(path) == first
+
+    # Only the modification time changed
+    os.utime(path, ns=(1, 1))
+    assert yaml.load_yaml(path) == first
+    assert (yaml_cache.misses, yaml_cache.hits) == (1, 3)
+
+    _write(path, "light: []\n")
+    assert yaml.load_yaml(path) == {"light": []}
+    assert yaml_cache.misses == 2
+
+
+def test_dependencies(
+    tmp_path: Path, yaml_cache: YamlCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a file is parsed again when a file it depends on changes."""
+    config_path = tmp_path / "configuration.yaml"
+    _write(
+        config_path,
+        "included: !include included.yaml\n"
+        "listed: !include_dir_list listed\n"
+        "password: !secret password\n"
+        "env: !env_var CACHE_TEST_VAR default\n",
+    )
+    _write(tmp_path / "included.yaml", "1")
+    (tmp_path / "listed").mkdir()
+    _write(tmp_path / "listed" / "a.yaml", "a")
+    _write(tmp_path / "secrets.yaml", "password: old\n")
+    monkeypatch.delenv("CACHE_TEST_VAR", raising=False)
+    secrets = yaml.Secrets(tmp_path)
+
+    def load() -> dict:
+        return yaml.load_yaml_dict(config_path, yaml.Secrets(tmp_path))
+
+    assert yaml.load_yaml_dict(config_path, secrets) == {
+        "included": 1,
+        "listed": ["a"],
+        "password": "old",
+        "env": "default",
+    }
+    misses = yaml_cache.misses
+    assert load()["included"] == 1
+    assert yaml_cache.misses == misses
+
+    _write(tmp_path / "included.yaml", "2")
+    assert load()["included"] == 2
+
+    _write(tmp_path / "listed" / "b.yaml", "b")
+    assert load()["listed"] == ["a", "b"]
+
+    # Secrets are looked up on each load without parsing the file again
+    misses = yaml_cache.misses
+    _write(tmp_path / "secrets.yaml", "password: new\n")
+    assert load()["password"] == "new"
+    assert yaml_cache.misses == misses
+
+    monkeypatch.setenv("CACHE_TEST_VAR", "set")
+    assert load()["env"] == "set"
+
+    misses = yaml_cache.misses
+    assert load()["env"] == "set"
+    assert yaml_cache.misses == misses
+
+
+def test_secrets_are_not_shared(tmp_path: Path, yaml_cache: YamlCache) -> None:
+    """Test files loaded with and without secrets are cached separately."""
+    path = tmp_path / "configuration.yaml"
+    _write(path, "password: !secret password\n")
+    _write(tmp_path / "secrets.yaml", "password: secret\n")
+
+    assert yaml.load_yaml(path, yaml.Secrets(tmp_path)) == {"password": "secret"}
+    with pytest.raises(yaml.loader.HomeAssistantError, match="not supported"):
+        yaml.load_yaml(path)
+
+
+def test_save_and_load(tmp_path: Path, yaml_cache: YamlCache) -> None:
+    """Test the cache is stored privately and loaded by the next run."""
+    path = tmp_path / "configuration.yaml"
+    _write(path, "name: Home\n")
+    yaml.load_yaml(path)
+
+    save_yaml_cache(str(tmp_path))
+    cache_path = tmp_path / YAML_CACHE_FILE
+    assert cache_path.stat().st_mode & 0o777 == 0o600
+
+    cache = enable_yaml_cache(str(tmp_path))
+    assert yaml.load_yaml(path) == {"name": "Home"}
+    assert (cache.misses, cache.hits) == (0, 1)
+
+    cache_path.write_text(json.dumps({"version": "0.1.0", "entries": []}))
+    cache = enable_yaml_cache(str(tmp_path))
+    yaml.load_yaml(path)
+    assert cache.misses == 1
+
+    cache_path.write_bytes(b"invalid")
+    cache = enable_yaml_cache(str(tmp_path))
+    yaml.load_yaml(path)
+    assert cache.misses == 1
+
+
+def test_secret_values_not_stored(tmp_path: Path, yaml_cache: YamlCache) -> None:
+    """Test the cache keeps the names of secrets instead of their values."""
+    path = tmp_path / "configuration.yaml"
+    _write(path, "included: !include included.yaml\n")
+    _write(tmp_path / "included.yaml", "password: !secret password\n")
+    _write(tmp_path / "secrets.yaml", "password: hunter2\n")
+
+    assert yaml.load_yaml(path, yaml.Secrets(tmp_path)) == {
+        "included": {"password": "hunter2"}
+    }
+    save_yaml_cache(str(tmp_path))
+    stored = (tmp_path / YAML_CACHE_FILE).read_text()
+    assert "hunter2" not in stored
+    assert '"secret":"password"' in stored
+
+    cache = enable_yaml_cache(str(tmp_path))
+    _write(tmp_path / "secrets.yaml", "password: correct horse\n")
+    assert yaml.load_yaml(path, yaml.Secrets(tmp_path)) == {
+        "included": {"password": "correct horse"}
+    }
+    assert (cache.misses, cache.hits) == (0, 1)
+
+    _write(tmp_path / "secrets.yaml", "other: value\n")
+    with pytest.raises(yaml.loader.HomeAssistantError, match="not defined"):
+        yaml.load_yaml(path, yaml.Secrets(tmp_path))
+
+
+def test_stored_types(tmp_path: Path, yaml_cache: YamlCache) -> None:
+    """Test the parsed types and annotations survive the stored cache."""
+    path = tmp_path / "blueprint.yaml"
+    _write(
+        path,
+        "input: !input name\n"
+        "day: 2024-01-02\n"
+        "nan: .nan\n"
+        "numbers: [1, 1.5, true, null]\n"
+        "1: one\n",
+    )
+    first = yaml.load_yaml(path)
+    save_yaml_cache(str(tmp_path))
+
+    cache = enable_yaml_cache(str(tmp_path))
+    loaded = yaml.load_yaml(path)
+    assert cache.hits == 1
+    assert loaded["input"] == yaml.Input("name")
+    assert loaded["day"] == date(2024, 1, 2)
+    assert math.isnan(loaded["nan"])
+    assert loaded["numbers"] == [1, 1.5, True, None]
+    assert [type(value) for value in loaded["numbers"]] == [
+        int,
+        float,
+        bool,
+        type(None),
+    ]
+    assert loaded[1] == "one"
+    assert list(loaded) == list(first)
+    key = next(iter(loaded))
+    assert (key.__config_file__, key.__line__) == (str(path), 1)
+    assert loaded["numbers"].__line__ == 4
+
+
+def test_unused_entries_dropped(tmp_path: Path, yaml_cache: YamlCache) -> None:
+    """Test entries not loaded since the cache was created are not stored."""
+    config_path = tmp_path / "configuration.yaml"
+    _write(config_path, "included: !include included.yaml\n")
+    _write(tmp_path / "included.yaml", "1")
+    other_path = tmp_path / "other.yaml"
+    _write(other_path, "2")
+    yaml.load_yaml(config_path)
+    yaml.load_yaml(other_path)
+    save_yaml_cache(str(tmp_path))
+
+    cache = enable_yaml_cache(str(tmp_path))
+    yaml.load_yaml(config_path)
+    save_yaml_cache(str(tmp_path))
+
+    # The included file is kept for when the file including it changes
+    cache = enable_yaml_cache(str(tmp_path))
+    _write(config_path, "included: !include included.yaml\nname: Home\n")
+    assert yaml.load_yaml(config_path) == {"included": 1, "name": "Home"}
+    assert (cache.misses, cache.hits) == (1, 1)
+    yaml.load_yaml(other_path)
+    assert cache.misses == 2